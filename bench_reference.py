@@ -0,0 +1,388 @@
+"""
+Salinan beku matcher berpasangan sch.py sebelum optimasi (scan penuh per item),
+dipakai bench_sch.py sebagai referensi kesetaraan. Jangan diubah ikut sch.py:
+selisih terhadap modul ini justru yang ingin dideteksi.
+
+Satu-satunya perbedaan dari aslinya: normalize_name diambil dari canon
+(normalisasi bersama yang memang menggantikan versi lama di sch.py).
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from fuzzywuzzy import fuzz
+
+from canon import normalize_name
+
+
+# Function to calculate time difference in minutes
+def time_difference(time1: str, time2: str, date1: str, date2: str) -> float:
+    try:
+        dt1 = datetime.strptime(f"{date1} {time1}", "%Y-%m-%d %H:%M")
+        dt2 = datetime.strptime(f"{date2} {time2}", "%Y-%m-%d %H:%M")
+        diff = abs((dt1 - dt2).total_seconds() / 60)
+        return diff
+    except ValueError:
+        return float('inf')
+
+# Function for strict matching (fallback)
+def strict_match_rere_manual(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+    norm_league = normalize_name(item['league'])
+    norm_team1 = normalize_name(item['team1']['name'])
+    norm_team2 = normalize_name(item['team2']['name'])
+    date = item['kickoff_date']
+    time = item['kickoff_time']
+    for idx, sch in enumerate(schedule):
+        sch_norm_league = normalize_name(sch['league'])
+        sch_norm_team1 = normalize_name(sch['team1']['name'])
+        sch_norm_team2 = normalize_name(sch['team2']['name'])
+        if (sch_norm_league == norm_league and
+            ((sch_norm_team1 == norm_team1 and sch_norm_team2 == norm_team2) or
+             (sch_norm_team1 == norm_team2 and sch_norm_team2 == norm_team1)) and
+            sch['kickoff_date'] == date and
+            sch['kickoff_time'] == time):
+            logging.debug(f"Strict match found for {item['id']} with {sch['id']}")
+            return idx
+    return -1
+
+def strict_match_inplaynet(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+    norm_league = normalize_name(item['league'])
+    norm_team1 = normalize_name(item['team1']['name'])
+    norm_team2 = normalize_name(item['team2']['name'])
+    for idx, sch in enumerate(schedule):
+        sch_norm_league = normalize_name(sch['league'])
+        sch_norm_team1 = normalize_name(sch['team1']['name'])
+        sch_norm_team2 = normalize_name(sch['team2']['name'])
+        if (sch_norm_league == norm_league and
+            ((sch_norm_team1 == norm_team1 and sch_norm_team2 == norm_team2) or
+             (sch_norm_team1 == norm_team2 and sch_norm_team2 == norm_team1))):
+            logging.debug(f"Strict match found for {item['id']} with {sch['id']}")
+            return idx
+    return -1
+
+def strict_match_sportsonline(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+    norm_team1 = normalize_name(item['team1']['name'])
+    norm_team2 = normalize_name(item['team2']['name'])
+    time = item['kickoff_time']
+    for idx, sch in enumerate(schedule):
+        sch_norm_team1 = normalize_name(sch['team1']['name'])
+        sch_norm_team2 = normalize_name(sch['team2']['name'])
+        if (((sch_norm_team1 == norm_team1 and sch_norm_team2 == norm_team2) or
+             (sch_norm_team1 == norm_team2 and sch_norm_team2 == norm_team1)) and
+            sch['kickoff_time'] == time):
+            logging.debug(f"Strict match found for {item['id']} with {sch['id']}")
+            return idx
+    return -1
+
+# Function for fuzzy matching (rere.json and manual.json)
+def find_match_rere_manual(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
+    best_match_idx = -1
+    best_score = 0.0
+    norm_league = normalize_name(item['league'])
+    norm_team1 = normalize_name(item['team1']['name'])
+    norm_team2 = normalize_name(item['team2']['name'])
+    date = item['kickoff_date']
+    time = item['kickoff_time']
+    for idx, sch in enumerate(schedule):
+        sch_norm_league = normalize_name(sch['league'])
+        sch_norm_team1 = normalize_name(sch['team1']['name'])
+        sch_norm_team2 = normalize_name(sch['team2']['name'])
+        
+        league_score = fuzz.token_sort_ratio(norm_league, sch_norm_league) / 100.0
+        if league_score < 0.9:
+            logging.debug(f"Skipping {item['id']} vs {sch['id']} due to low league_score={league_score:.2f}")
+            continue
+        
+        team1_score = max(fuzz.token_sort_ratio(norm_team1, sch_norm_team1), fuzz.partial_ratio(norm_team1, sch_norm_team1)) / 100.0
+        team2_score = max(fuzz.token_sort_ratio(norm_team2, sch_norm_team2), fuzz.partial_ratio(norm_team2, sch_norm_team2)) / 100.0
+        team_score = max(
+            (team1_score + team2_score) / 2,
+            (max(fuzz.token_sort_ratio(norm_team1, sch_norm_team2), fuzz.partial_ratio(norm_team1, sch_norm_team2)) +
+             max(fuzz.token_sort_ratio(norm_team2, sch_norm_team1), fuzz.partial_ratio(norm_team2, sch_norm_team1))) / 200.0
+        )
+        
+        date_score = 1.0 if date == sch['kickoff_date'] else 0.0
+        time_diff = time_difference(time, sch['kickoff_time'], date, sch['kickoff_date'])
+        time_score = 1.0 if time_diff <= 30 else max(0.0, 1.0 - time_diff / 120.0)
+
+        total_score = (0.3 * league_score + 0.6 * team_score + 0.05 * date_score + 0.05 * time_score)
+        
+        logging.debug(
+            f"Comparing {item['id']} with {sch['id']}: league_score={league_score:.2f}, team_score={team_score:.2f}, "
+            f"date_score={date_score:.2f}, time_score={time_score:.2f}, total_score={total_score:.2f}"
+        )
+        
+        if total_score >= threshold and total_score > best_score:
+            best_score = total_score
+            best_match_idx = idx
+
+    # Fallback to strict matching
+    if best_match_idx == -1:
+        strict_idx = strict_match_rere_manual(schedule, item)
+        if strict_idx != -1:
+            logging.debug(f"Fallback to strict match for {item['id']}")
+            return strict_idx
+
+    return best_match_idx
+
+# Function for fuzzy matching (inplaynet.json)
+def find_match_inplaynet(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
+    best_match_idx = -1
+    best_score = 0.0
+    norm_league = normalize_name(item['league'])
+    norm_team1 = normalize_name(item['team1']['name'])
+    norm_team2 = normalize_name(item['team2']['name'])
+    for idx, sch in enumerate(schedule):
+        sch_norm_league = normalize_name(sch['league'])
+        sch_norm_team1 = normalize_name(sch['team1']['name'])
+        sch_norm_team2 = normalize_name(sch['team2']['name'])
+        
+        league_score = fuzz.token_sort_ratio(norm_league, sch_norm_league) / 100.0
+        if league_score < 0.9:
+            logging.debug(f"Skipping {item['id']} vs {sch['id']} due to low league_score={league_score:.2f}")
+            continue
+        
+        team1_score = max(fuzz.token_sort_ratio(norm_team1, sch_norm_team1), fuzz.partial_ratio(norm_team1, sch_norm_team1)) / 100.0
+        team2_score = max(fuzz.token_sort_ratio(norm_team2, sch_norm_team2), fuzz.partial_ratio(norm_team2, sch_norm_team2)) / 100.0
+        team_score = max(
+            (team1_score + team2_score) / 2,
+            (max(fuzz.token_sort_ratio(norm_team1, sch_norm_team2), fuzz.partial_ratio(norm_team1, sch_norm_team2)) +
+             max(fuzz.token_sort_ratio(norm_team2, sch_norm_team1), fuzz.partial_ratio(norm_team2, sch_norm_team1))) / 200.0
+        )
+
+        total_score = (0.3 * league_score + 0.7 * team_score)
+        
+        logging.debug(
+            f"Comparing {item['id']} with {sch['id']}: league_score={league_score:.2f}, team_score={team_score:.2f}, "
+            f"total_score={total_score:.2f}"
+        )
+        
+        if total_score >= threshold and total_score > best_score:
+            best_score = total_score
+            best_match_idx = idx
+
+    # Fallback to strict matching
+    if best_match_idx == -1:
+        strict_idx = strict_match_inplaynet(schedule, item)
+        if strict_idx != -1:
+            logging.debug(f"Fallback to strict match for {item['id']}")
+            return strict_idx
+
+    return best_match_idx
+
+# Function for fuzzy matching (sportsonline.json)
+def find_match_sportsonline(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
+    best_match_idx = -1
+    best_score = 0.0
+    norm_team1 = normalize_name(item['team1']['name'])
+    norm_team2 = normalize_name(item['team2']['name'])
+    time = item['kickoff_time']
+    date = item['kickoff_date'] if 'kickoff_date' in item else "1970-01-01"
+
+    for idx, sch in enumerate(schedule):
+        sch_norm_team1 = normalize_name(sch['team1']['name'])
+        sch_norm_team2 = normalize_name(sch['team2']['name'])
+        
+        team1_score = max(fuzz.token_sort_ratio(norm_team1, sch_norm_team1), fuzz.partial_ratio(norm_team1, sch_norm_team1)) / 100.0
+        team2_score = max(fuzz.token_sort_ratio(norm_team2, sch_norm_team2), fuzz.partial_ratio(norm_team2, sch_norm_team2)) / 100.0
+        team_score = max(
+            (team1_score + team2_score) / 2,
+            (max(fuzz.token_sort_ratio(norm_team1, sch_norm_team2), fuzz.partial_ratio(norm_team1, sch_norm_team2)) +
+             max(fuzz.token_sort_ratio(norm_team2, sch_norm_team1), fuzz.partial_ratio(norm_team2, sch_norm_team1))) / 200.0
+        )
+        
+        time_diff = time_difference(time, sch['kickoff_time'], date, sch['kickoff_date'])
+        time_score = 1.0 if time_diff <= 30 else max(0.0, 1.0 - time_diff / 120.0)
+
+        total_score = (0.4 * time_score + 0.6 * team_score)
+        
+        logging.debug(
+            f"Comparing {item['id']} with {sch['id']}: team_score={team_score:.2f}, time_score={time_score:.2f}, "
+            f"total_score={total_score:.2f}"
+        )
+        
+        if total_score >= threshold and total_score > best_score:
+            best_score = total_score
+            best_match_idx = idx
+
+    # Fallback to strict matching
+    if best_match_idx == -1:
+        strict_idx = strict_match_sportsonline(schedule, item)
+        if strict_idx != -1:
+            logging.debug(f"Fallback to strict match for {item['id']}")
+            return strict_idx
+
+    return best_match_idx
+
+# Function for fuzzy matching (streamcenter.json)
+def find_match_streamcenter(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
+    """
+    Mencari pertandingan yang cocok di jadwal untuk data dari streamcenter.json.
+    
+    Args:
+        schedule: Daftar jadwal yang sudah ada
+        item: Item dari streamcenter.json yang akan dicocokkan
+        threshold: Ambang batas kecocokan (0-1)
+        
+    Returns:
+        int: Indeks pertandingan yang cocok di schedule, atau -1 jika tidak ditemukan
+    """
+    # Cek pencocokan ketat terlebih dahulu
+    strict_idx = strict_match_streamcenter(schedule, item)
+    if strict_idx != -1:
+        return strict_idx
+    
+    # Jika tidak ada yang cocok secara ketat, lakukan fuzzy matching
+    item_team1 = normalize_name(item['team1']['name'])
+    item_team2 = normalize_name(item['team2']['name'])
+    item_date = item.get('kickoff_date', '')
+    item_time = item.get('kickoff_time', '')
+    
+    best_score = 0
+    best_idx = -1
+    
+    for idx, match in enumerate(schedule):
+        # Skip jika tanggal tidak cocok
+        match_date = match.get('kickoff_date', '')
+        if item_date and match_date and item_date != match_date:
+            continue
+            
+        # Hitung skor kecocokan tim
+        match_team1 = normalize_name(match['team1']['name'])
+        match_team2 = normalize_name(match['team2']['name'])
+        
+        # Hitung skor untuk kedua kemungkinan urutan tim
+        score1 = (fuzz.ratio(item_team1, match_team1) + fuzz.ratio(item_team2, match_team2)) / 2
+        score2 = (fuzz.ratio(item_team1, match_team2) + fuzz.ratio(item_team2, match_team1)) / 2
+        score = max(score1, score2)
+        
+        # Periksa kecocokan waktu jika tersedia
+        if item_time and 'kickoff_time' in match:
+            time_diff = time_difference(item_time, match['kickoff_time'], item_date, match_date)
+            if time_diff <= 180:  # Maksimal selisih 3 jam
+                score = score * 0.7 + 30  # Beri bobot lebih jika waktu cocok
+        
+        if score > best_score and score >= threshold * 100:
+            best_score = score
+            best_idx = idx
+    
+    return best_idx
+
+def strict_match_streamcenter(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+    """
+    Mencocokkan pertandingan dari streamcenter.json dengan ketat berdasarkan nama tim.
+    """
+    item_team1 = normalize_name(item['team1']['name'])
+    item_team2 = normalize_name(item['team2']['name'])
+    
+    for idx, match in enumerate(schedule):
+        match_team1 = normalize_name(match['team1']['name'])
+        match_team2 = normalize_name(match['team2']['name'])
+        
+        # Cek kedua kemungkinan urutan tim
+        if (item_team1 == match_team1 and item_team2 == match_team2) or \
+           (item_team1 == match_team2 and item_team2 == match_team1):
+            return idx
+    
+    return -1
+
+# soco.json
+# Function for fuzzy matching (soco.json)
+def find_match_soco(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
+    """
+    Mencari pertandingan yang cocok di jadwal untuk data dari soco.json.
+    
+    Args:
+        schedule: Daftar jadwal yang sudah ada
+        item: Item dari soco.json yang akan dicocokkan
+        threshold: Ambang batas kecocokan (0-1)
+        
+    Returns:
+        int: Indeks pertandingan yang cocok di schedule, atau -1 jika tidak ditemukan
+    """
+    # Cek pencocokan ketat terlebih dahulu
+    strict_idx = strict_match_soco(schedule, item)
+    if strict_idx != -1:
+        return strict_idx
+    
+    # Jika tidak ada yang cocok secara ketat, lakukan fuzzy matching
+    item_team1 = normalize_name(item['team1']['name'])
+    item_team2 = normalize_name(item['team2']['name'])
+    item_date = item.get('kickoff_date', '')
+    item_time = item.get('kickoff_time', '')
+    
+    best_score = 0
+    best_idx = -1
+    
+    for idx, match in enumerate(schedule):
+        # Skip jika tanggal tidak cocok
+        match_date = match.get('kickoff_date', '')
+        if item_date and match_date and item_date != match_date:
+            continue
+            
+        # Hitung skor kecocokan tim
+        match_team1 = normalize_name(match['team1']['name'])
+        match_team2 = normalize_name(match['team2']['name'])
+        
+        # Hitung skor untuk kedua kemungkinan urutan tim
+        score1 = (fuzz.ratio(item_team1, match_team1) + fuzz.ratio(item_team2, match_team2)) / 2
+        score2 = (fuzz.ratio(item_team1, match_team2) + fuzz.ratio(item_team2, match_team1)) / 2
+        score = max(score1, score2)
+        
+        # Periksa kecocokan waktu jika tersedia
+        if item_time and 'kickoff_time' in match:
+            time_diff = time_difference(item_time, match['kickoff_time'], item_date, match_date)
+            if time_diff <= 180:  # Maksimal selisih 3 jam
+                score = score * 0.7 + 30  # Beri bobot lebih jika waktu cocok
+        
+        if score > best_score and score >= threshold * 100:
+            best_score = score
+            best_idx = idx
+    
+    return best_idx
+
+def strict_match_soco(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+    """
+    Mencocokkan pertandingan dari soco.json dengan ketat berdasarkan nama tim.
+    """
+    item_team1 = normalize_name(item['team1']['name'])
+    item_team2 = normalize_name(item['team2']['name'])
+    
+    for idx, match in enumerate(schedule):
+        match_team1 = normalize_name(match['team1']['name'])
+        match_team2 = normalize_name(match['team2']['name'])
+        
+        # Cek kedua kemungkinan urutan tim
+        if (item_team1 == match_team1 and item_team2 == match_team2) or \
+           (item_team1 == match_team2 and item_team2 == match_team1):
+            return idx
+    
+    return -1
+
+
+REFERENCE_MATCHERS = {
+    'rere_manual': find_match_rere_manual,
+    'inplaynet': find_match_inplaynet,
+    'sportsonline': find_match_sportsonline,
+    'streamcenter': find_match_streamcenter,
+    'soco': find_match_soco,
+}
+
+# Function to merge items the way the original script did, returning the match index of every item
+def reference_merge(schedule: List[Dict[str, Any]], kind: str, items: List[Dict[str, Any]],
+                    threshold: float = 0.8, append_unmatched: bool = False) -> Tuple[List[int], int]:
+    """
+    Mencocokkan item satu per satu; item tanpa pasangan ditambahkan ke salinan
+    schedule jika `append_unmatched`, jadi item berikutnya ikut dinilai terhadapnya.
+    Mengembalikan (indeks hasil per item, jumlah entri yang di-scan).
+    """
+    matcher = REFERENCE_MATCHERS[kind]
+    schedule = list(schedule)
+    results, scanned = [], 0
+    for item in items:
+        scanned += len(schedule)
+        match_idx = matcher(schedule, item, threshold=threshold)
+        if match_idx == -1 and append_unmatched:
+            schedule.append(item)
+        results.append(match_idx)
+    return results, scanned
@@ -0,0 +1,571 @@
+"""
+Benchmark dan uji kesetaraan untuk mesin pencocokan sch.py.
+
+Membuat schedule sintetis ala event.json beserta feed sumber hasil perturbasi
+(suffix "FC", aksen, tim tertukar, kickoff bergeser +-30 menit, sebagian kecil
+item sportsonline tanpa tanggal, serta item tanpa pasangan yang sebagian muncul
+lagi), lalu untuk setiap matcher melaporkan match/detik, jumlah perbandingan
+pasangan, memori puncak, precision/recall, tahap kaskade skor (hanya di --json),
+dan selisih hasil terhadap referensi: salinan beku matcher berpasangan asli
+(bench_reference.py). Untuk sumber yang menambahkan entri baru (APPEND_KINDS)
+ada juga baris "+append" yang membandingkan merge_source(append_unmatched=True)
+dengan urutan append referensi, jadi entri yang ditambahkan harus bisa dicocokkan
+oleh item berikutnya.
+
+Sebelum benchmark, kasus regresi kecil (REGRESSION_CHECKS) selalu dijalankan;
+--checks hanya menjalankan kasus tersebut.
+
+Contoh:
+    python bench_sch.py --checks
+    python bench_sch.py --sizes 100 1000 10000 --modes indexed batch
+    python bench_sch.py --model-memory 100000
+"""
+import argparse
+import base64
+import gc
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+import canon
+import sch
+from bench_reference import reference_merge
+from model import matches_from_dicts, matches_to_dicts
+
+LEAGUES = [
+    'Premier League', 'La Liga', 'Serie A', 'Bundesliga', 'Ligue 1', 'Eredivisie', 'Primeira Liga',
+    'Super Lig', 'Championship', 'MLS', 'Liga MX', 'J1 League', 'K League 1', 'A-League',
+    'Scottish Premiership', 'Belgian Pro League', 'Liga 1 Indonesia', 'Copa Libertadores',
+    'UEFA Champions League', 'UEFA Europa League',
+]
+SYLLABLES = ['ba', 'ro', 'ka', 'lin', 'to', 'ven', 'mar', 'sa', 'del', 'ri', 'no', 'gal', 'ter', 'vi',
+             'zu', 'an', 'mo', 'le', 'dor', 'ne', 'pa', 'sil', 'ha', 'ber', 'go', 'ti', 'wes', 'chan']
+PREFIXES = ['', '', '', 'Real ', 'Atletico ', 'Sporting ', 'Dynamo ', 'Inter ', 'Union ']
+SUFFIXES = ['', '', '', ' United', ' City', ' Rovers', ' Athletic', ' Wanderers']
+ACCENTS = {'a': 'á', 'e': 'é', 'i': 'í', 'o': 'ó', 'u': 'ú', 'n': 'ñ'}
+
+SERVER_LABELS = ['CH-EN', 'CH-ES', 'CH-FR', 'CH-AR', 'CH-1', 'CH-2', 'CH-VN']
+
+# Matcher yang dibenchmark (kunci sch.MATCH_SPECS)
+KINDS = ['rere_manual', 'inplaynet', 'sportsonline', 'streamcenter', 'soco']
+# Sumber yang item tanpa pasangannya ditambahkan ke schedule (rere.json/manual.json, inplaynet.json)
+APPEND_KINDS = ['rere_manual', 'inplaynet']
+
+SPORTSONLINE_NO_DATE_RATIO = 0.1  # sportsonline.json hampir selalu punya tanggal; sisakan sedikit untuk jalur tanpa tanggal
+DECOY_REPEAT_RATIO = 0.5          # Peluang item tanpa pasangan adalah pertandingan yang sama dengan decoy sebelumnya
+
+
+# --- GENERATOR DATA SINTETIS ---
+def make_team_name(rng: random.Random) -> str:
+    word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+    return f"{rng.choice(PREFIXES)}{word}{rng.choice(SUFFIXES)}"
+
+def make_schedule(size: int, rng: random.Random, start_date: str = '2025-12-01') -> List[Dict[str, Any]]:
+    """
+    Schedule ala event.json dengan `size` pertandingan tersebar dalam 14 hari.
+    """
+    base = datetime.strptime(start_date, "%Y-%m-%d")
+    schedule = []
+    for i in range(size):
+        team1, team2 = make_team_name(rng), make_team_name(rng)
+        league = rng.choice(LEAGUES)
+        kickoff = base + timedelta(days=rng.randrange(14), minutes=15 * rng.randrange(96))
+        schedule.append({
+            'id': f"{league.replace(' ', '')}-{team1.replace(' ', '')}-{team2.replace(' ', '')}-{i}",
+            'league': league,
+            'team1': {'name': team1},
+            'team2': {'name': team2},
+            'kickoff_date': kickoff.strftime("%Y-%m-%d"),
+            'kickoff_time': kickoff.strftime("%H:%M"),
+            'match_date': kickoff.strftime("%Y-%m-%d"),
+            'match_time': kickoff.strftime("%H:%M"),
+            'duration': '3.5',
+            'servers': [],
+        })
+    return schedule
+
+def make_servers(rng: random.Random) -> List[Dict[str, str]]:
+    """
+    1-4 server player ala sumber asli (envivo, ss, iframe base64).
+    """
+    servers = []
+    for _ in range(rng.randint(1, 4)):
+        roll = rng.random()
+        if roll < 0.4:
+            url = f"https://multi.govoet.my.id/?envivo={rng.randint(1, 200)}"
+        elif roll < 0.7:
+            url = f"https://multi.govoet.my.id/?ss={rng.choice(['hd', 'br', 'sporttv'])}{rng.randint(1, 12)}"
+        else:
+            stream = f"https://stream.example.invalid/embed/{rng.randrange(10 ** 6)}"
+            url = f"https://multi.govoet.my.id/?iframe={base64.b64encode(stream.encode()).decode()}"
+        servers.append({'url': url, 'label': rng.choice(SERVER_LABELS)})
+    return servers
+
+def perturb_name(name: str, rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.25:
+        name = name[:-3] if name.endswith(' FC') else f"{name} FC"
+    elif roll < 0.4:
+        name = f"FC {name}"
+    if rng.random() < 0.3:
+        positions = [i for i, ch in enumerate(name) if ch in ACCENTS]
+        if positions:
+            pos = rng.choice(positions)
+            name = name[:pos] + ACCENTS[name[pos]] + name[pos + 1:]
+    return name
+
+def perturb_item(entry: Dict[str, Any], kind: str, rng: random.Random, serial: int) -> Dict[str, Any]:
+    """
+    Item sumber `kind` yang berasal dari `entry` schedule.
+    """
+    team1, team2 = perturb_name(entry['team1']['name'], rng), perturb_name(entry['team2']['name'], rng)
+    if rng.random() < 0.2:
+        team1, team2 = team2, team1
+    kickoff = datetime.strptime(f"{entry['kickoff_date']} {entry['kickoff_time']}", "%Y-%m-%d %H:%M")
+    kickoff += timedelta(minutes=rng.randint(-30, 30))
+    item = {
+        'id': f"{kind}-{serial}",
+        'league': entry['league'],
+        'team1': {'name': team1},
+        'team2': {'name': team2},
+        'kickoff_date': kickoff.strftime("%Y-%m-%d"),
+        'kickoff_time': kickoff.strftime("%H:%M"),
+        'duration': '3.5',
+        'servers': [{'url': f"https://example.invalid/{kind}/{serial}", 'label': 'CH-1'}],
+    }
+    if kind == 'sportsonline':
+        # sportsonline.json tidak punya liga; tanggal hanya sesekali kosong
+        item['league'] = ''
+        if rng.random() < SPORTSONLINE_NO_DATE_RATIO:
+            item['kickoff_date'] = ''
+    elif kind in ('streamcenter', 'soco'):
+        item['id'] = ''
+        item['league'] = ''
+    return item
+
+def make_source(schedule: List[Dict[str, Any]], kind: str, count: int, rng: random.Random,
+                unmatched_ratio: float = 0.1) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Mengembalikan (items, truth); truth[i] adalah indeks schedule asal item i, atau -1 untuk item tanpa pasangan.
+    Sebagian item tanpa pasangan adalah perturbasi baru dari decoy sebelumnya, sehingga
+    saat item tanpa pasangan ditambahkan (append), item berikutnya bisa cocok dengannya.
+    """
+    items, truth, decoys = [], [], []
+    for serial in range(count):
+        if rng.random() < unmatched_ratio:
+            if decoys and rng.random() < DECOY_REPEAT_RATIO:
+                decoy = rng.choice(decoys)
+            else:
+                decoy = make_schedule(1, rng)[0]
+                decoys.append(decoy)
+            items.append(perturb_item(decoy, kind, rng, serial))
+            truth.append(-1)
+        else:
+            idx = rng.randrange(len(schedule))
+            items.append(perturb_item(schedule[idx], kind, rng, serial))
+            truth.append(idx)
+    return items, truth
+
+
+# --- MENJALANKAN MATCHER ---
+class CountingScorer:
+    """
+    Membungkus scorer per pasangan untuk menghitung jumlah perbandingan.
+    """
+
+    def __init__(self, scorer):
+        self.scorer = scorer
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.scorer(*args, **kwargs)
+
+def run_matcher(kind: str, schedule: List[Dict[str, Any]], items: List[Dict[str, Any]], mode: str,
+                threshold: float = 0.8, append_unmatched: bool = False) -> Tuple[List[int], Optional[int]]:
+    """
+    Mencocokkan setiap item ke schedule dan mengembalikan (indeks hasil per item,
+    jumlah perbandingan). Dengan `append_unmatched`, item tanpa pasangan ditambahkan
+    ke salinan schedule (merge_source) dan ikut dinilai untuk item berikutnya.
+
+    mode: 'reference' (salinan beku matcher asli, scan penuh), 'indexed', 'batch', atau 'parallel'.
+    Perbandingan di proses worker (mode parallel) tidak terhitung, jadi hasilnya None.
+    """
+    if mode == 'reference':
+        return reference_merge(schedule, kind, items, threshold, append_unmatched)
+    spec = sch.MATCH_SPECS[kind]
+    parallel_min_pairs = sch.PARALLEL_MIN_PAIRS
+    counter = CountingScorer(spec.scorer)
+    sch.MATCH_SPECS[kind] = spec._replace(scorer=counter)
+    try:
+        if mode == 'parallel':
+            # Paksa mode paralel meskipun ukurannya kecil
+            sch.PARALLEL_MIN_PAIRS = 0
+        workers = max(2, os.cpu_count() or 1) if mode == 'parallel' else 1
+        if append_unmatched:
+            # Salinan entri: merge_source mengganti list server entri yang cocok
+            index = sch.ScheduleIndex([dict(entry) for entry in schedule])
+            results = sch.merge_source(index, f"{kind}.json", kind, items, True, threshold,
+                                       batch=(mode == 'batch'), workers=workers)
+        else:
+            index = sch.ScheduleIndex(schedule)
+            results = [idx for _, idx in sch.iter_matches(kind, index, items, threshold, batch=(mode == 'batch'),
+                                                           workers=workers)]
+        comparisons = counter.calls
+        if mode == 'batch' and sch.np is not None:
+            comparisons += len(items) * len(schedule)  # Sel matriks kemiripan
+        return results, comparisons if mode != 'parallel' else None
+    finally:
+        sch.MATCH_SPECS[kind] = spec
+        sch.PARALLEL_MIN_PAIRS = parallel_min_pairs
+
+def precision_recall(results: List[int], truth: List[int]) -> Tuple[float, float]:
+    true_pos = sum(1 for got, want in zip(results, truth) if got != -1 and got == want)
+    predicted = sum(1 for got in results if got != -1)
+    relevant = sum(1 for want in truth if want != -1)
+    precision = true_pos / predicted if predicted else 1.0
+    recall = true_pos / relevant if relevant else 1.0
+    return precision, recall
+
+def bench_case(kind: str, schedule: List[Dict[str, Any]], items: List[Dict[str, Any]], truth: List[int],
+               mode: str, measure_memory: bool, reference: Optional[List[int]],
+               append_unmatched: bool = False) -> Dict[str, Any]:
+    sch.CASCADE_STATS.clear()
+    start = time.perf_counter()
+    results, comparisons = run_matcher(kind, schedule, items, mode, append_unmatched=append_unmatched)
+    elapsed = time.perf_counter() - start
+    cascade = dict(sch.CASCADE_STATS)
+
+    peak_kib = None
+    if measure_memory:
+        # Pass terpisah karena tracemalloc memperlambat eksekusi
+        tracemalloc.start()
+        run_matcher(kind, schedule, items, mode, append_unmatched=append_unmatched)
+        peak_kib = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+
+    # Kecocokan dengan entri hasil append tidak punya truth, jadi dihitung sebagai tanpa pasangan
+    precision, recall = precision_recall([idx if idx < len(schedule) else -1 for idx in results], truth)
+    row = {
+        'kind': kind,
+        'mode': f"{mode}+append" if append_unmatched else mode,
+        'schedule': len(schedule),
+        'items': len(items),
+        'seconds': elapsed,
+        'matches_per_sec': len(items) / elapsed if elapsed else float('inf'),
+        'comparisons': comparisons,
+        'peak_kib': peak_kib,
+        'precision': precision,
+        'recall': recall,
+        'reference_diffs': None,
+        'cascade': cascade,
+    }
+    if reference is not None:
+        diffs = [i for i, (got, want) in enumerate(zip(results, reference)) if got != want]
+        row['reference_diffs'] = len(diffs)
+        for i in diffs[:5]:
+            logging.warning(f"[{kind}/{mode}] item {i} ({items[i]['team1']['name']} vs {items[i]['team2']['name']}): "
+                            f"hasil {results[i]}, referensi {reference[i]}")
+    return row
+
+# --- CEK REGRESI ---
+def make_entry(match_id: str, league: str, team1: str, team2: str, date: str, time_str: str,
+               url: str) -> Dict[str, Any]:
+    return {'id': match_id, 'league': league, 'team1': {'name': team1}, 'team2': {'name': team2},
+            'kickoff_date': date, 'kickoff_time': time_str, 'duration': '3.5',
+            'servers': [{'url': url, 'label': 'CH-1'}]}
+
+def merge_ids(sources: Dict[str, List[Dict[str, Any]]], **options) -> List[str]:
+    """
+    Id hasil merge_schedule (tanpa merge state maupun alias di disk kecuali pathnya diberikan).
+    """
+    return [item['id'] for item in sch.merge_schedule(sources, {}, sch.MergeOptions(**options))]
+
+def check_append_then_match() -> Optional[str]:
+    """
+    Entri yang ditambahkan ke liga yang sudah diindeks harus tetap lolos
+    gerbang liga untuk item berikutnya (manual.json digabung ke entri rere.json).
+    """
+    sources = {
+        'event.json': [make_entry('SerieA-Juventus-Roma', 'Serie A', 'Juventus', 'Roma', '2025-12-06', '20:00',
+                                  'https://multi.govoet.my.id/?ss=hd1')],
+        'rere.json': [make_entry('SerieA-ACMilan-Inter', 'Serie A', 'AC Milan', 'Inter', '2025-12-06', '20:45',
+                                 'https://multi.govoet.my.id/?ss=hd2')],
+        'manual.json': [make_entry('x-Milan-Inter', 'Serie A', 'AC Milan', 'Inter', '2025-12-06', '21:00',
+                                   'https://multi.govoet.my.id/?ss=hd3')],
+    }
+    ids = merge_ids(sources)
+    if ids != ['SerieA-Juventus-Roma', 'SerieA-ACMilan-Inter']:
+        return f"manual.json tidak digabung ke entri yang baru ditambahkan: {ids}"
+    return None
+
+def check_alias_not_learned_from_pair_score() -> Optional[str]:
+    """
+    Skor pasangan tinggi karena lawan dan liganya sama tidak boleh
+    mengajarkan alias "manchester united" -> "manchester city".
+    """
+    sources = {
+        'event.json': [make_entry('PL-ManCity-Arsenal', 'Premier League', 'Manchester City', 'Arsenal',
+                                  '2025-12-06', '20:00', 'https://multi.govoet.my.id/?ss=hd1')],
+        'rere.json': [make_entry('PL-ManUtd-Arsenal', 'Premier League', 'Manchester United', 'Arsenal',
+                                 '2025-12-06', '20:00', 'https://multi.govoet.my.id/?ss=hd2')],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        alias_path = os.path.join(tmp, 'team_aliases.json')
+        merge_ids(sources, alias_path=alias_path)
+        with open(alias_path, 'r', encoding='utf-8') as f:
+            aliases = json.load(f)['aliases']
+    learned = aliases.get('rere_manual', {}).get('manchester united')
+    if learned is not None:
+        return f"alias dipelajari dari skor pasangan: manchester united -> {learned['key']}"
+    return None
+
+def check_alias_never_beats_exact_name() -> Optional[str]:
+    """
+    Alias yang tersimpan tidak boleh mengalihkan nama yang ada persis di schedule.
+    """
+    schedule = [
+        make_entry('PL-ManCity-Liverpool', 'Premier League', 'Manchester City', 'Liverpool', '2025-12-06', '20:00',
+                   'https://multi.govoet.my.id/?ss=hd1'),
+        make_entry('PL-ManUtd-Liverpool', 'Premier League', 'Manchester United', 'Liverpool', '2025-12-06', '20:00',
+                   'https://multi.govoet.my.id/?ss=hd2'),
+    ]
+    store = sch.AliasStore({'rere_manual': {'manchester united': {'key': 'manchester city', 'seen': '2025-12-06'}}})
+    index = sch.ScheduleIndex(schedule, aliases=store)
+    item = make_entry('r1', 'Premier League', 'Manchester United', 'Liverpool', '2025-12-06', '20:00',
+                      'https://multi.govoet.my.id/?ss=hd3')
+    got = sch.find_match('rere_manual', schedule, item, index=index)
+    if got != 1:
+        return f"item Manchester United digabung ke entri {got}, seharusnya 1 (PL-ManUtd-Liverpool)"
+    return None
+
+def check_state_tracks_threshold() -> Optional[str]:
+    """
+    Merge state dari run dengan threshold lain tidak boleh dipakai ulang.
+    """
+    sources = {
+        'event.json': [make_entry('SerieA-Juventus-Roma', 'Serie A', 'Juventus', 'Roma', '2025-12-06', '20:00',
+                                  'https://multi.govoet.my.id/?ss=hd1')],
+        'rere.json': [make_entry('SerieA-Juventus-Lazio', 'Serie A', 'Juventus', 'Lazio', '2025-12-06', '20:00',
+                                 'https://multi.govoet.my.id/?ss=hd2')],
+    }
+    cold = merge_ids(sources, threshold=0.6)
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = os.path.join(tmp, 'merge_state.json')
+        merge_ids(sources, threshold=0.8, state_path=state_path)
+        warm = merge_ids(sources, threshold=0.6, state_path=state_path)
+    if warm != cold:
+        return f"threshold 0.6 dengan state dari 0.8 menghasilkan {warm}, run tanpa state {cold}"
+    return None
+
+def check_translation_keeps_tags() -> Optional[str]:
+    """
+    Hanya tag negara seperti "(Tur)" yang boleh dibuang saat menerjemahkan; "(W)"/"(U21)" tetap.
+    """
+    translator = sch.Translator({'Beşiktaş (Tur)': 'Besiktas', 'Liverpool': 'Liverpool',
+                                 'Bournemouth': 'Bournemouth', 'Premier League': 'England - Premier League'})
+    expected = {'Besiktas': 'Besiktas', 'Beşiktaş (Tur)': 'Besiktas', 'Liverpool (W)': 'Liverpool (W)',
+                'Bournemouth (U21)': 'Bournemouth (U21)', 'Premier League (W)': 'Premier League (W)'}
+    wrong = {name: translator.lookup(name) for name, want in expected.items() if translator.lookup(name) != want}
+    if wrong:
+        return f"terjemahan salah: {wrong}"
+    return None
+
+def check_base64_plus_dedup() -> Optional[str]:
+    """
+    '+' mentah, '%2B' dan alfabet urlsafe di ?iframe=<base64> harus menjadi stream yang sama.
+    """
+    encoded = base64.b64encode(b'https://example.com/live?x=>>>').decode()
+    if '+' not in encoded:
+        return f"contoh base64 tidak mengandung '+': {encoded}"
+    urls = [f"https://player.example/?iframe={encoded}",
+            f"https://player.example/?iframe={encoded.replace('+', '%2B')}",
+            f"https://player.example/?iframe={base64.urlsafe_b64encode(b'https://example.com/live?x=>>>').decode()}"]
+    keys = {sch.canonical_server_url(url) for url in urls}
+    if len(keys) != 1:
+        return f"URL base64 yang sama menghasilkan key berbeda: {sorted(keys)}"
+    servers = sch.remove_duplicate_servers([{'url': urls[0], 'label': 'A'}],
+                                           [{'url': url, 'label': 'B'} for url in urls[1:]])
+    if len(servers) != 1:
+        return f"remove_duplicate_servers menyisakan {len(servers)} server"
+    return None
+
+def check_entry_id_rules() -> Optional[str]:
+    """
+    canon.entry_id harus menghasilkan ID yang sama dengan aturan lama tiap scraper.
+    """
+    names = ['Serie A', 'AC Milan', 'Inter\u00a0Milan', 'Team:B', 'Real\tMadrid', ' Roma ']
+    wrong = []
+    for league in names:
+        for team1 in names:
+            for team2 in names:
+                # rereyano.py dan jadwalflash.py: hanya spasi yang dibuang
+                old = f"{league.replace(' ', '')}-{team1.replace(' ', '')}-{team2.replace(' ', '')}"
+                if canon.entry_id(league, team1, team2) != old:
+                    wrong.append(old)
+                # sportsonline.py: spasi dibuang dan ':' menjadi '-'
+                old = team1.replace(' ', '').replace(':', '-') + '-' + team2.replace(' ', '').replace(':', '-')
+                if canon.entry_id(team1, team2, colons_to_dash=True) != old:
+                    wrong.append(old)
+    if wrong:
+        return f"ID berbeda dari aturan lama scraper: {wrong[:3]}"
+    return None
+
+def check_short_names_indexed() -> Optional[str]:
+    """
+    Nama tim pendek/singkatan tanpa trigram ("PSG" vs "P SG", "A C" vs "AC") harus
+    mendapat hasil yang sama dengan index maupun scan penuh.
+    """
+    schedule = [make_entry('Ligue1-PSG-OM', 'Ligue 1', 'P SG', 'O M', '2025-12-06', '20:00', 'https://a.invalid/1'),
+                make_entry('SerieA-AC-FCB', 'Serie A', 'AC', 'FC B', '2025-12-06', '20:00', 'https://a.invalid/2'),
+                make_entry('SerieA-Roma-Lazio', 'Serie A', 'Roma', 'Lazio', '2025-12-06', '20:00', 'https://a.invalid/3')]
+    items = [make_entry('x-PSG-OM', 'Ligue 1', 'PSG', 'OM', '2025-12-06', '20:00', 'https://b.invalid/1'),
+             make_entry('x-AC-FCB', 'Serie A', 'A.C.', 'F.C.B.', '2025-12-06', '20:00', 'https://b.invalid/2'),
+             make_entry('x-AC-FCB', 'Serie A', 'A C', 'FCB', '2025-12-06', '20:00', 'https://b.invalid/3')]
+    index = sch.ScheduleIndex(schedule)
+    wrong = []
+    for kind in KINDS:
+        for item in items:
+            scan = sch.find_match(kind, schedule, item)
+            indexed = sch.find_match(kind, schedule, item, index=index)
+            if indexed != scan:
+                wrong.append(f"{kind} {item['team1']['name']}: index {indexed}, scan penuh {scan}")
+    resolver = sch.LogoResolver({'psg': 'https://logo.invalid/psg', 'ac': 'https://logo.invalid/ac',
+                                 'paris sg': 'https://logo.invalid/psg2'})
+    for name in ['P SG', 'A C', 'PSG', 'Paris S G']:
+        norm_name = sch.normalize_name(name)
+        best_key, best_score = None, 0
+        for logo_key in resolver.keys:
+            score = sch.fuzz.token_sort_ratio(norm_name, logo_key)
+            if score > best_score and score >= resolver.threshold:
+                best_key, best_score = logo_key, score
+        if resolver.resolve(name) != (best_key, best_score):
+            wrong.append(f"logo {name}: {resolver.resolve(name)}, scan penuh {(best_key, best_score)}")
+    if wrong:
+        return '; '.join(wrong)
+    return None
+
+REGRESSION_CHECKS = [check_append_then_match, check_alias_not_learned_from_pair_score,
+                     check_alias_never_beats_exact_name, check_state_tracks_threshold,
+                     check_translation_keeps_tags, check_base64_plus_dedup,
+                     check_entry_id_rules, check_short_names_indexed]
+
+def run_regression_checks() -> List[str]:
+    failures = []
+    for check in REGRESSION_CHECKS:
+        error = check()
+        if error is not None:
+            failures.append(f"{check.__name__}: {error}")
+    return failures
+
+def measure_model_memory(size: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Memori schedule sintetis (dengan server) setelah dibaca dari JSON: list dict
+    biasa dibandingkan dengan model.Match, plus cek konversi bolak-balik.
+    """
+    schedule = make_schedule(size, rng)
+    for entry in schedule:
+        entry['servers'] = make_servers(rng)
+    text = json.dumps(schedule, ensure_ascii=False)
+    del schedule
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    data = json.loads(text)
+    dict_bytes = tracemalloc.get_traced_memory()[0] - base
+    matches = matches_from_dicts(data)
+    del data
+    gc.collect()
+    model_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    lossless = json.dumps(matches_to_dicts(matches), ensure_ascii=False) == text
+    return {'entries': size, 'dict_kib': dict_bytes / 1024, 'model_kib': model_bytes / 1024,
+            'saved': 1 - model_bytes / dict_bytes, 'lossless': lossless}
+
+def format_row(row: Dict[str, Any]) -> str:
+    peak = f"{row['peak_kib']:.0f}" if row['peak_kib'] is not None else '-'
+    diffs = str(row['reference_diffs']) if row['reference_diffs'] is not None else '-'
+    comparisons = str(row['comparisons']) if row['comparisons'] is not None else '-'
+    return (f"{row['kind']:<13} {row['mode']:<16} {row['schedule']:>7} {row['items']:>7} "
+            f"{row['matches_per_sec']:>10.1f} {comparisons:>12} {peak:>10} "
+            f"{row['precision']:>6.3f} {row['recall']:>6.3f} {diffs:>6}")
+
+HEADER = (f"{'matcher':<13} {'mode':<16} {'sched':>7} {'items':>7} {'match/s':>10} {'compares':>12} "
+          f"{'peak KiB':>10} {'prec':>6} {'recall':>6} {'diffs':>6}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dan uji kesetaraan matcher sch.py")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500],
+                        help="Ukuran schedule sintetis (100 sampai 100000)")
+    parser.add_argument('--items-ratio', type=float, default=0.5,
+                        help="Jumlah item per sumber relatif terhadap ukuran schedule")
+    parser.add_argument('--kinds', nargs='+', default=KINDS, choices=KINDS)
+    parser.add_argument('--modes', nargs='+', default=['indexed'], choices=['indexed', 'batch', 'parallel', 'reference'])
+    parser.add_argument('--reference-max', type=int, default=2000,
+                        help="Ukuran schedule maksimum untuk membandingkan dengan referensi (scan penuh lambat)")
+    parser.add_argument('--no-memory', action='store_true', help="Lewati pengukuran memori puncak")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--json', help="Simpan hasil sebagai JSON ke path ini")
+    parser.add_argument('--checks', action='store_true', help="Hanya jalankan cek regresi (REGRESSION_CHECKS)")
+    parser.add_argument('--model-memory', type=int, metavar='N',
+                        help="Hanya ukur memori N entri sebagai dict vs model.Match (mis. 100000)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+
+    failures = run_regression_checks()
+    print(f"Cek regresi: {len(REGRESSION_CHECKS) - len(failures)}/{len(REGRESSION_CHECKS)} lolos")
+    for failure in failures:
+        print(f"  GAGAL {failure}")
+    if failures:
+        raise SystemExit("Cek regresi gagal")
+    if args.checks:
+        return
+
+    if args.model_memory:
+        result = measure_model_memory(args.model_memory, random.Random(args.seed))
+        print(f"{result['entries']} entri: dict {result['dict_kib']:.0f} KiB, Match {result['model_kib']:.0f} KiB "
+              f"({result['saved']:.1%} lebih kecil), lossless={result['lossless']}")
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2)
+        if not result['lossless']:
+            raise SystemExit("Konversi model tidak lossless")
+        return
+
+    rows = []
+    print(HEADER)
+    for size in args.sizes:
+        rng = random.Random(args.seed + size)
+        schedule = make_schedule(size, rng)
+        for kind in args.kinds:
+            items, truth = make_source(schedule, kind, max(1, int(size * args.items_ratio)), rng)
+            for append_unmatched in ([False, True] if kind in APPEND_KINDS else [False]):
+                reference = None
+                if size <= args.reference_max:
+                    reference, _ = run_matcher(kind, schedule, items, 'reference', append_unmatched=append_unmatched)
+                for mode in args.modes:
+                    row = bench_case(kind, schedule, items, truth, mode, not args.no_memory,
+                                     reference if mode != 'reference' else None, append_unmatched)
+                    rows.append(row)
+                    print(format_row(row), flush=True)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+
+    if any(row['reference_diffs'] for row in rows):
+        raise SystemExit("Hasil berbeda dari implementasi referensi")
+
+
+if __name__ == '__main__':
+    main()
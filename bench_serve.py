@@ -0,0 +1,307 @@
+"""
+Uji beban lokal untuk serve.py.
+
+Menjalankan serve.py sebagai subprocess (kecuali --url diberikan), lalu
+membuka sejumlah koneksi keep-alive yang mengirim GET berulang-ulang selama
+--duration detik ke campuran URL yang diambil dari jadwal: seluruh jadwal,
+filter per tanggal/liga/tim, dan /matches/<id>. Melaporkan request/detik,
+latensi p50/p90/p99, jumlah per status dan byte yang diterima.
+
+Sebelum uji beban, kasus regresi kecil (REGRESSION_CHECKS) selalu dijalankan;
+--checks hanya menjalankan kasus tersebut.
+
+Contoh:
+    python bench_serve.py --checks
+    python bench_serve.py --duration 10 --connections 32
+    python bench_serve.py --conditional --encoding gzip
+    python bench_serve.py --url http://127.0.0.1:8080
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode, urlsplit
+
+from serve import DEFAULT_FILE, ScheduleServer
+
+
+# --- DAFTAR URL ---
+def make_paths(schedule: List[Dict[str, Any]], rng: random.Random, count: int = 200) -> List[str]:
+    """
+    Campuran path ala klien: seperempat seluruh jadwal, sisanya filter dan id.
+    """
+    dates = sorted({item['match_date'] for item in schedule if item.get('match_date')})
+    leagues = sorted({item['league'].rsplit(' - ', 1)[-1] for item in schedule if item.get('league')})
+    teams = sorted({item[side]['name'] for item in schedule for side in ('team1', 'team2')
+                    if isinstance(item.get(side), dict) and item[side].get('name')})
+    ids = [item['id'] for item in schedule if item.get('id')]
+    paths = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.25 or not schedule:
+            paths.append('/matches')
+        elif kind < 0.45 and dates:
+            paths.append('/matches?' + urlencode({'date': rng.choice(dates)}))
+        elif kind < 0.6 and leagues:
+            paths.append('/matches?' + urlencode({'league': rng.choice(leagues)}))
+        elif kind < 0.7 and dates and leagues:
+            paths.append('/matches?' + urlencode({'date': rng.choice(dates), 'league': rng.choice(leagues)}))
+        elif kind < 0.85 and teams:
+            paths.append('/matches?' + urlencode({'team': rng.choice(teams)}))
+        else:
+            paths.append('/matches/' + quote(rng.choice(ids), safe=''))
+    return paths
+
+
+# --- KLIEN ---
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], int]:
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length', '0'))
+    if length:
+        await reader.readexactly(length)
+    return status, headers, length
+
+
+async def client(host: str, port: int, paths: List[str], deadline: float, encoding: str, conditional: bool,
+                 offset: int, latencies: List[float], statuses: Counter) -> int:
+    """
+    Satu koneksi keep-alive; mengembalikan jumlah byte body yang diterima.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    etags: Dict[str, str] = {}
+    received = 0
+    i = offset
+    try:
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            lines = [f"GET {path} HTTP/1.1", f"Host: {host}:{port}"]
+            if encoding != 'identity':
+                lines.append(f"Accept-Encoding: {encoding}")
+            if conditional and path in etags:
+                lines.append(f"If-None-Match: {etags[path]}")
+            start = time.perf_counter()
+            writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+            status, headers, length = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            received += length
+            if 'etag' in headers:
+                etags[path] = headers['etag']
+    finally:
+        writer.close()
+    return received
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def run_load(host: str, port: int, paths: List[str], duration: float, connections: int,
+                   encoding: str, conditional: bool) -> Dict[str, Any]:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    start = time.perf_counter()
+    deadline = start + duration
+    received = await asyncio.gather(*(client(host, port, paths, deadline, encoding, conditional,
+                                             n * len(paths) // connections, latencies, statuses)
+                                      for n in range(connections)))
+    elapsed = time.perf_counter() - start
+    return {
+        'connections': connections, 'encoding': encoding, 'conditional': conditional,
+        'requests': len(latencies), 'seconds': round(elapsed, 3),
+        'requests_per_sec': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 3),
+        'p90_ms': round(percentile(latencies, 0.9) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'statuses': {str(status): count for status, count in sorted(statuses.items())},
+        'body_mib': round(sum(received) / (1 << 20), 2),
+    }
+
+
+# --- SERVER ---
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(path: str, port: int, timeout: float = 30.0) -> subprocess.Popen:
+    """
+    Menjalankan serve.py dan menunggu sampai /status menjawab 200.
+    """
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'serve.py')
+    proc = subprocess.Popen([sys.executable, script, '--file', path, '--port', str(port)],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"serve.py berhenti dengan kode {proc.returncode}")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1) as sock:
+                sock.sendall(b"GET /status HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n\r\n")
+                if sock.recv(16).startswith(b'HTTP/1.1 200'):
+                    return proc
+        except OSError:
+            pass
+        time.sleep(0.1)
+    proc.kill()
+    raise SystemExit("serve.py tidak siap dalam batas waktu")
+
+
+# --- CEK REGRESI ---
+def write_batches(path: str, ids: List[int]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([{'id': batch_id, 'time': '', 'changes': []} for batch_id in ids], f)
+
+async def read_events(reader: asyncio.StreamReader, count: int, timeout: float = 5.0) -> List[Tuple[str, str]]:
+    """
+    `count` event SSE berikutnya sebagai (id, nama event); komentar dan retry dilewati.
+    """
+    events = []
+    while len(events) < count:
+        block = (await asyncio.wait_for(reader.readuntil(b'\n\n'), timeout)).decode('utf-8')
+        fields = dict(line.split(': ', 1) for line in block.strip().split('\n') if ': ' in line)
+        if 'event' in fields:
+            events.append((fields['id'], fields['event']))
+    return events
+
+async def _changefeed_reset(tmp: str) -> Optional[str]:
+    path = os.path.join(tmp, 'schedule.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([], f)
+    changes_path = os.path.join(tmp, 'changes.json')
+    write_batches(changes_path, [40, 41])
+    server = ScheduleServer(path)
+    await server.reload_changes()
+    listener = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        writer.write(b"GET /changes HTTP/1.1\r\nHost: bench\r\nLast-Event-ID: 41\r\n\r\n")
+        await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 5.0)
+        while not server.feed.subscribers:
+            await asyncio.sleep(0.01)
+        # changes.json dibuat ulang: id mulai lagi dari 1
+        write_batches(changes_path, [1])
+        await server.reload_changes()
+        events = await read_events(reader, 2)
+    except asyncio.TimeoutError:
+        return "subscriber tidak menerima event setelah id changefeed mulai ulang"
+    finally:
+        writer.close()
+        await writer.wait_closed()
+        # Tunggu stream_changes melihat EOF agar handler selesai sebelum event loop ditutup
+        for _ in range(500):
+            if not server.feed.subscribers:
+                break
+            await asyncio.sleep(0.01)
+        listener.close()
+        await listener.wait_closed()
+    if events != [('0', 'reset'), ('1', 'changes')]:
+        return f"event setelah id mulai ulang: {events}"
+    return None
+
+def check_changefeed_reset() -> Optional[str]:
+    """
+    Subscriber yang tetap tersambung saat id changes.json mulai ulang harus
+    menerima `reset` lalu batch id 1.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        return asyncio.run(_changefeed_reset(tmp))
+
+REGRESSION_CHECKS = [check_changefeed_reset]
+
+def run_regression_checks() -> List[str]:
+    failures = []
+    for check in REGRESSION_CHECKS:
+        error = check()
+        if error is not None:
+            failures.append(f"{check.__name__}: {error}")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Uji beban serve.py (request/detik dan latensi)")
+    parser.add_argument('--file', default=DEFAULT_FILE, help="Jadwal yang dilayani dan sumber daftar URL")
+    parser.add_argument('--url', help="Server yang sudah berjalan (mis. http://127.0.0.1:8080); "
+                                      "tanpa ini serve.py dijalankan sendiri di port acak")
+    parser.add_argument('--duration', type=float, default=5.0, help="Detik per putaran")
+    parser.add_argument('--connections', type=int, nargs='+', default=[1, 16, 64],
+                        help="Jumlah koneksi keep-alive paralel (satu putaran per nilai)")
+    parser.add_argument('--encoding', default='gzip', choices=['identity', 'gzip', 'br'])
+    parser.add_argument('--conditional', action='store_true',
+                        help="Kirim If-None-Match dengan ETag terakhir per URL (mengukur jalur 304)")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--json', help="Simpan hasil sebagai JSON ke path ini")
+    parser.add_argument('--checks', action='store_true', help="Hanya jalankan cek regresi (REGRESSION_CHECKS)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+
+    failures = run_regression_checks()
+    print(f"Cek regresi: {len(REGRESSION_CHECKS) - len(failures)}/{len(REGRESSION_CHECKS)} lolos")
+    for failure in failures:
+        print(f"  GAGAL {failure}")
+    if failures:
+        raise SystemExit("Cek regresi gagal")
+    if args.checks:
+        return
+
+    with open(args.file, 'r', encoding='utf-8') as f:
+        paths = make_paths(json.load(f), random.Random(args.seed))
+
+    proc = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = '127.0.0.1', free_port()
+        proc = start_server(args.file, port)
+
+    rows = []
+    print(f"{'conns':>5} {'encoding':<8} {'cond':<5} {'requests':>9} {'req/s':>10} "
+          f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'MiB':>8}  status")
+    try:
+        for connections in args.connections:
+            row = asyncio.run(run_load(host, port, paths, args.duration, connections,
+                                       args.encoding, args.conditional))
+            rows.append(row)
+            statuses = ' '.join(f"{status}:{count}" for status, count in row['statuses'].items())
+            print(f"{connections:>5} {args.encoding:<8} {str(args.conditional):<5} {row['requests']:>9} "
+                  f"{row['requests_per_sec']:>10.1f} {row['p50_ms']:>8.3f} {row['p90_ms']:>8.3f} "
+                  f"{row['p99_ms']:>8.3f} {row['body_mib']:>8.2f}  {statuses}", flush=True)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+
+    if any(status not in ('200', '304') for row in rows for status in row['statuses']):
+        raise SystemExit("Ada respons selain 200/304")
+
+
+if __name__ == '__main__':
+    main()
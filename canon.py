@@ -0,0 +1,81 @@
+"""
+Kanonisasi nama tim/liga yang dipakai bersama oleh semua scraper dan sch.py.
+
+Satu tempat untuk regex, tabel lipat aksen, dan memo, sehingga nama yang
+dikeluarkan scraper dan nama yang dicocokkan sch.py diproses dengan aturan
+yang sama.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+
+NAME_MEMO_SIZE = 16384  # Batas memo normalize_name (nama unik per run jauh di bawah ini)
+
+PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+class _FoldTable(dict):
+    """
+    Tabel str.translate untuk lipat NFKD: karakter didekomposisi lalu tanda
+    diakritik (kategori Mn) dibuang, mis. 'ş' -> 's', 'ﬁ' -> 'fi'.
+    Diisi saat karakter pertama kali muncul, sehingga seluruh Unicode
+    tercakup tanpa membangun tabel untuk setiap code point saat impor.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        folded = ''.join(c for c in unicodedata.normalize('NFKD', char)
+                         if unicodedata.category(c) != 'Mn')
+        # None akan menghapus karakter, jadi karakter yang tetap dipetakan ke dirinya sendiri
+        value = self[codepoint] = codepoint if folded == char else folded
+        return value
+
+FOLD_TABLE = _FoldTable()
+
+
+def fold_accents(text: str) -> str:
+    return text.translate(FOLD_TABLE)
+
+
+# Function to normalize names
+@lru_cache(maxsize=NAME_MEMO_SIZE)
+def normalize_name(name: str) -> str:
+    """
+    Bentuk pencocokan sebuah nama: tanpa keterangan dalam kurung,
+    huruf kecil, aksen dilipat, dan tanpa spasi di tepi.
+    """
+    name = PARENTHETICAL_RE.sub('', name)
+    return fold_accents(name.lower()).strip()
+
+
+# Function to build an order-independent key of two team names
+def team_pair_key(team1: str, team2: str) -> tuple:
+    """
+    Key pasangan tim yang tidak bergantung urutan home/away.
+    Masukan harus sudah dinormalisasi.
+    """
+    if team1 <= team2:
+        return (team1, team2)
+    return (team2, team1)
+
+
+def clean_name(name: str) -> str:
+    """
+    Nama tampilan yang dikeluarkan scraper: spasi beruntun dirapikan.
+    """
+    return WHITESPACE_RE.sub(' ', name).strip()
+
+
+def entry_id(*parts: str, colons_to_dash: bool = False) -> str:
+    """
+    ID entri scraper dengan aturan lama setiap scraper: karakter spasi dibuang
+    dari setiap bagian (whitespace lain tidak), lalu digabung dengan '-'.
+    Dengan `colons_to_dash`, ':' juga menjadi '-' (sportsonline.py).
+    Bagian harus berupa nama mentah seperti sebelumnya, bukan hasil clean_name,
+    agar ID entri yang sudah terbit tidak berubah.
+    """
+    parts = [part.replace(' ', '') for part in parts]
+    if colons_to_dash:
+        parts = [part.replace(':', '-') for part in parts]
+    return '-'.join(parts)
@@ -12,7 +12,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from output import write_json_list
 
 # Setup logging
 logging.basicConfig(
@@ -403,7 +404,8 @@ def main():
             executor.submit(process_match, match_id, base_url, cookies, ["Abigail", "Coyin", "Lia", "Ekin", "Ecarg", "Icel"][i % 6])
             for i, match_id in enumerate(match_ids)
         ]
-        for future in as_completed(futures):
+        # Urut sesuai match_ids (bukan urutan selesai) agar output deterministik
+        for future in futures:
             try:
                 result = future.result()
                 if result["servers"]:
@@ -425,9 +427,8 @@ def main():
     main_logger.info(output_json)
 
     # Simpan ke file
-    with open("inplaynet.json", "w") as f:
-        f.write(output_json)
-        main_logger.info("Output disimpan ke inplaynet.json")
+    write_json_list("inplaynet.json", matches, variants=False, patch=True, indent=4, ensure_ascii=True)
+    main_logger.info("Output disimpan ke inplaynet.json")
 
 if __name__ == "__main__":
     main()
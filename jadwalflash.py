@@ -1,4 +1,3 @@
-import json
 import time
 from datetime import datetime, timedelta
 from dateutil.parser import parse
@@ -10,6 +9,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from canon import clean_name, entry_id
+from output import write_json_list
 
 # List of URLs to scrape
 urls = [
@@ -88,11 +89,13 @@ for league_info in urls:
         try:
             # Home team
             home_participant = match.find_element(By.CLASS_NAME, "event__homeParticipant")
-            home_name = home_participant.find_element(By.CSS_SELECTOR, "span.wcl-name_jjfMf").text
+            home_text = home_participant.find_element(By.CSS_SELECTOR, "span.wcl-name_jjfMf").text
+            home_name = clean_name(home_text)
 
             # Away team
             away_participant = match.find_element(By.CLASS_NAME, "event__awayParticipant")
-            away_name = away_participant.find_element(By.CSS_SELECTOR, "span.wcl-name_jjfMf").text
+            away_text = away_participant.find_element(By.CSS_SELECTOR, "span.wcl-name_jjfMf").text
+            away_name = clean_name(away_text)
 
             # Time and date
             time_div = match.find_element(By.CLASS_NAME, "event__time")
@@ -132,8 +135,8 @@ for league_info in urls:
                 match_date = datetime.strptime(kickoff_date, "%Y-%m-%d")
                 # Include today's matches and next 3 days
                 if current_date <= match_date <= end_date:
-                    # ID without spaces
-                    match_id = f"{league_name.replace(' ', '')}-{home_name.replace(' ', '')}-{away_name.replace(' ', '')}"
+                    # ID without spaces (from the raw names, so published IDs stay the same)
+                    match_id = entry_id(league_name, home_text, away_text)
 
                     # Build the item
                     item = {
@@ -166,8 +169,7 @@ for league_info in urls:
 
 # Save to event.json
 print(f"Saving {len(data)} matches to event.json...")
-with open("event.json", "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=2)
+write_json_list("event.json", data, variants=False, patch=True, ensure_ascii=True)
 
 print("Scraping completed successfully! Data saved to event.json.")
 
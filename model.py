@@ -0,0 +1,180 @@
+"""
+Model ringkas untuk entri jadwal: Match, Team dan Server dengan __slots__.
+
+Setiap objek menyimpan urutan key aslinya (layout, dibagi antar objek dengan
+urutan yang sama) dan key di luar skema di `_extra`, sehingga
+Model.from_dict(d).to_dict() == d, termasuk urutan key saat ditulis ke JSON.
+String yang sering berulang (liga, tanggal/jam, label, nama tim, awalan URL
+player) di-intern.
+
+Objek mendukung akses baca/tulis ala dict (obj['key'], obj.get(), 'key' in obj,
+obj.copy()) sehingga kode pencocokan di sch.py bekerja untuk dict maupun model.
+"""
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_LAYOUTS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _layout(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return _LAYOUTS.setdefault(keys, keys)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class _Record:
+    __slots__ = ('_layout', '_extra')
+    FIELDS: Tuple[str, ...] = ()
+    INTERNED: frozenset = frozenset()
+
+    def __init__(self):
+        self._layout: Tuple[str, ...] = ()
+        self._extra: Optional[Dict[str, Any]] = None
+        for field in self.FIELDS:
+            setattr(self, field, None)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_Record':
+        obj = cls()
+        for key, value in data.items():
+            obj._set(key, value)
+        obj._layout = _layout(tuple(data))
+        return obj
+
+    def _convert(self, key: str, value: Any) -> Any:
+        return _intern(value) if key in self.INTERNED else value
+
+    def _set(self, key: str, value: Any) -> None:
+        if key in self.FIELDS:
+            setattr(self, key, self._convert(key, value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def _export(self, key: str, value: Any) -> Any:
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self._export(key, self[key]) for key in self._layout}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._layout:
+            raise KeyError(key)
+        return getattr(self, key) if key in self.FIELDS else self._extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._set(key, value)
+        if key not in self._layout:
+            self._layout = _layout(self._layout + (key,))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._layout else default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._layout
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._layout
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        return len(self._layout)
+
+    def copy(self) -> '_Record':
+        """
+        Salinan dangkal, seperti dict.copy().
+        """
+        obj = self.__class__.__new__(self.__class__)
+        obj._layout = self._layout
+        obj._extra = dict(self._extra) if self._extra is not None else None
+        for field in self._slot_names():
+            setattr(obj, field, getattr(self, field))
+        return obj
+
+    def _slot_names(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+
+class Team(_Record):
+    __slots__ = ('name', 'logo')
+    FIELDS = ('name', 'logo')
+    INTERNED = frozenset(FIELDS)
+
+
+class Server(_Record):
+    """
+    URL disimpan sebagai awalan (s/d '=' pertama di query, di-intern, mis.
+    'https://multi.govoet.my.id/?ss=') dan sisanya.
+    """
+    __slots__ = ('url_prefix', 'url_rest', 'label')
+    FIELDS = ('url', 'label')
+    INTERNED = frozenset(('label',))
+
+    def __init__(self):
+        self._layout = ()
+        self._extra = None
+        self.url_prefix = ''
+        self.url_rest = None
+        self.label = None
+
+    @property
+    def url(self) -> Any:
+        return self.url_prefix + self.url_rest if self.url_prefix else self.url_rest
+
+    def _set(self, key: str, value: Any) -> None:
+        if key == 'url':
+            self.url_prefix, self.url_rest = split_url(value)
+        else:
+            super()._set(key, value)
+
+    def _slot_names(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+
+class Match(_Record):
+    __slots__ = ('id', 'league', 'team1', 'team2', 'kickoff_date', 'kickoff_time',
+                 'match_date', 'match_time', 'duration', 'servers')
+    FIELDS = __slots__
+    INTERNED = frozenset(('league', 'kickoff_date', 'kickoff_time', 'match_date', 'match_time', 'duration'))
+
+    def _convert(self, key: str, value: Any) -> Any:
+        if key in ('team1', 'team2'):
+            return Team.from_dict(value) if isinstance(value, dict) else value
+        if key == 'servers':
+            return [Server.from_dict(server) if isinstance(server, dict) else server
+                    for server in value] if isinstance(value, list) else value
+        return super()._convert(key, value)
+
+    def _export(self, key: str, value: Any) -> Any:
+        if isinstance(value, _Record):
+            return value.to_dict()
+        if key == 'servers' and isinstance(value, list):
+            return [server.to_dict() if isinstance(server, _Record) else server for server in value]
+        return value
+
+
+def split_url(url: Any) -> Tuple[str, Any]:
+    """
+    (awalan yang di-intern, sisa) dari URL player; awalan '' jika tidak ada query.
+    """
+    if type(url) is not str:
+        return '', url
+    query = url.find('?')
+    cut = url.find('=', query) + 1 if query != -1 else 0
+    return (sys.intern(url[:cut]), url[cut:]) if cut else ('', url)
+
+
+def matches_from_dicts(items: List[Dict[str, Any]]) -> List[Match]:
+    return [Match.from_dict(item) for item in items]
+
+
+def matches_to_dicts(matches: List[Any]) -> List[Dict[str, Any]]:
+    return [match.to_dict() if isinstance(match, _Record) else match for match in matches]
@@ -0,0 +1,328 @@
+"""
+Penulisan output JSON (sch/schedule.json, sch/schedulegvt.json).
+
+Item ditulis satu per satu ke beberapa varian sekaligus:
+  - <nama>.json          format json.dump(list, indent=2, ensure_ascii=False),
+  - <nama>.min.json      tanpa spasi,
+  - <varian>.gz / .br    versi terkompresi dari kedua file di atas
+                         (.br hanya jika modul brotli terpasang).
+Setiap varian ditulis ke file sementara lalu os.replace, sehingga pembaca
+tidak pernah melihat file yang setengah jadi. File yang isinya tidak berubah
+tidak ditulis ulang, dan setiap perubahan bisa disertai <nama>.patch.json
+(JSON Patch, RFC 6902) agar klien cukup mengunduh selisihnya. Patch memuat
+sha256 file dasar dan hasilnya, jadi klien hanya menerapkannya pada versi
+yang benar.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    # Opsional, hanya untuk varian .br
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def minified_path(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}.min{ext}"
+
+
+class _Sink:
+    """
+    Satu file tujuan: ditulis ke `<path>.<pid>.tmp`, dikompresi jika diminta.
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = None):
+        self.path = path
+        self.tmp_path = f"{path}.{os.getpid()}.tmp"
+        self.raw = open(self.tmp_path, 'wb')
+        self.gzip = None
+        self.brotli = None
+        if compression == 'gz':
+            # mtime=0: isi yang sama menghasilkan byte .gz yang sama
+            self.gzip = gzip.GzipFile(filename='', mode='wb', fileobj=self.raw, compresslevel=GZIP_LEVEL, mtime=0)
+        elif compression == 'br':
+            self.brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def write(self, data: bytes) -> None:
+        if self.gzip is not None:
+            self.gzip.write(data)
+        elif self.brotli is not None:
+            self.raw.write(self.brotli.process(data))
+        else:
+            self.raw.write(data)
+
+    def close(self) -> None:
+        if self.gzip is not None:
+            self.gzip.close()
+        elif self.brotli is not None:
+            self.raw.write(self.brotli.finish())
+        self.raw.close()
+
+    def commit(self) -> None:
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self) -> None:
+        self.raw.close()
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+
+def output_paths(path: str, variants: bool = True) -> List[str]:
+    """
+    Semua file yang ditulis write_json_list untuk `path`.
+    """
+    if not variants:
+        return [path]
+    paths = [path, minified_path(path)]
+    compressions = ['gz'] + (['br'] if brotli is not None else [])
+    return paths + [f"{base}.{compression}" for base in paths for compression in compressions]
+
+
+def patch_path(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}.patch{ext}"
+
+
+def file_digest(path: str) -> Optional[str]:
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+# --- JSON PATCH (RFC 6902) ---
+def _item_key(item: Any) -> str:
+    return json.dumps(item, sort_keys=True, ensure_ascii=False)
+
+
+def _pointer_token(key: Any) -> str:
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def json_patch(old: Any, new: Any, path: str = '') -> List[Dict[str, Any]]:
+    """
+    Operasi RFC 6902 (add/remove/replace) yang mengubah `old` menjadi `new`.
+    Item list disejajarkan dengan difflib.SequenceMatcher, jadi entri yang
+    disisipkan/dihapus di tengah jadwal hanya menghasilkan satu operasi
+    add/remove; item yang berubah di tempat dibandingkan per field.
+    """
+    if type(old) is not type(new):
+        return [{'op': 'replace', 'path': path, 'value': new}]
+    if isinstance(old, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': f"{path}/{_pointer_token(key)}"})
+            else:
+                ops.extend(json_patch(old[key], new[key], f"{path}/{_pointer_token(key)}"))
+        for key in new:
+            if key not in old:
+                ops.append({'op': 'add', 'path': f"{path}/{_pointer_token(key)}", 'value': new[key]})
+        return ops
+    if isinstance(old, list):
+        ops = []
+        matcher = SequenceMatcher(None, [_item_key(item) for item in old], [_item_key(item) for item in new],
+                                  autojunk=False)
+        # Setelah setiap opcode, dokumen berisi new[:j1] diikuti old[i1:], jadi old[i1] berada di indeks j1
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            common = min(i2 - i1, j2 - j1)
+            for k in range(common):
+                ops.extend(json_patch(old[i1 + k], new[j1 + k], f"{path}/{j1 + k}"))
+            ops.extend({'op': 'remove', 'path': f"{path}/{j1 + common}"} for _ in range(i2 - i1 - common))
+            ops.extend({'op': 'add', 'path': f"{path}/{j}", 'value': new[j]} for j in range(j1 + common, j2))
+        return ops
+    return [] if old == new else [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def apply_patch(doc: Any, ops: List[Dict[str, Any]]) -> Any:
+    """
+    Menerapkan operasi add/remove/replace dari json_patch. `doc` diubah langsung
+    kecuali operasi mengganti seluruh dokumen; hasilnya dikembalikan.
+    """
+    for op in ops:
+        if not op['path']:
+            doc = op['value']
+            continue
+        *parents, last = [token.replace('~1', '/').replace('~0', '~') for token in op['path'][1:].split('/')]
+        target = doc
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        if isinstance(target, list):
+            index = len(target) if last == '-' else int(last)
+            if op['op'] == 'add':
+                target.insert(index, op['value'])
+            elif op['op'] == 'remove':
+                del target[index]
+            else:
+                target[index] = op['value']
+        elif op['op'] == 'remove':
+            del target[last]
+        else:
+            target[last] = op['value']
+    return doc
+
+
+class JsonListWriter:
+    """
+    Context manager yang menulis list objek JSON item demi item ke `path`
+    dan (dengan `variants`) ke varian .min.json, .gz dan .br. Semua varian
+    di-rename bersamaan saat keluar tanpa error; jika ada error, file
+    sementara dihapus dan file lama tetap utuh.
+
+    Jika isi `path` sama persis dengan file sebelumnya (dan semua varian sudah
+    ada), tidak ada file yang diganti (`changed` False). Dengan `patch`, setiap
+    perubahan juga menulis <nama>.patch.json berisi
+    {"base": <sha256 versi sebelumnya>, "target": <sha256 versi ini>, "ops": [...]}
+    dengan ops JSON Patch (RFC 6902). Patch yang tidak lagi berakhir di isi
+    `path` saat ini (target berbeda, atau tidak ada patch baru) dihapus.
+    """
+
+    def __init__(self, path: str, variants: bool = True, patch: bool = False,
+                 indent: int = 2, ensure_ascii: bool = False):
+        self.path = path
+        self.variants = variants
+        self.patch = patch
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+        self.count = 0
+        self.changed = False
+        self.digest = hashlib.sha256()
+        self.pretty: List[_Sink] = []
+        self.minified: List[_Sink] = []
+
+    def __enter__(self) -> 'JsonListWriter':
+        try:
+            for target in output_paths(self.path, self.variants):
+                base, compression = target, None
+                if target.endswith(('.gz', '.br')):
+                    base, compression = target[:-3], target[-2:]
+                sinks = self.minified if base != self.path else self.pretty
+                sinks.append(_Sink(target, compression))
+        except OSError:
+            self._abort()
+            raise
+        return self
+
+    def _write(self, sinks: List[_Sink], text: str) -> None:
+        data = text.encode('utf-8')
+        for sink in sinks:
+            sink.write(data)
+
+    def write(self, item: Dict[str, Any]) -> None:
+        margin = '\n' + ' ' * self.indent
+        pretty = json.dumps(item, indent=self.indent, ensure_ascii=self.ensure_ascii).replace('\n', margin)
+        chunk = (',' if self.count else '[') + margin + pretty
+        self.digest.update(chunk.encode('utf-8'))
+        self._write(self.pretty, chunk)
+        if self.minified:
+            minified = json.dumps(item, ensure_ascii=self.ensure_ascii, separators=(',', ':'))
+            self._write(self.minified, (',' if self.count else '[') + minified)
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._abort()
+            return
+        sinks = self.pretty + self.minified
+        try:
+            tail = '\n]' if self.count else '[]'
+            self.digest.update(tail.encode('utf-8'))
+            self._write(self.pretty, tail)
+            self._write(self.minified, ']' if self.count else '[]')
+            for sink in sinks:
+                sink.close()
+            digest = self.digest.hexdigest()
+            old_digest = file_digest(self.path)
+            if old_digest == digest and all(os.path.exists(sink.path) for sink in sinks):
+                self._abort()
+                self._drop_stale_patch(digest)
+                return
+            patch_sink = None
+            if self.patch and old_digest is not None:
+                patch_sink = self._patch_sink(old_digest, digest)
+                if patch_sink is not None:
+                    sinks.append(patch_sink)
+        except OSError:
+            self._abort()
+            raise
+        for sink in sinks:
+            sink.commit()
+        if patch_sink is None:
+            self._drop_stale_patch(digest)
+        self.changed = True
+
+    def _drop_stale_patch(self, digest: str) -> None:
+        """
+        Menghapus <nama>.patch.json yang tidak menghasilkan isi `path` saat ini.
+        """
+        path = patch_path(self.path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                target = json.load(f).get('target')
+        except FileNotFoundError:
+            return
+        except (ValueError, AttributeError):
+            target = None
+        if target != digest:
+            try:
+                os.remove(path)
+                logging.info(f"Menghapus patch usang {path}")
+            except OSError as e:
+                logging.warning(f"Gagal menghapus patch usang {path}: {str(e)}")
+
+    def _patch_sink(self, base: str, target: str) -> Optional[_Sink]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                old = json.load(f)
+        except ValueError as e:
+            logging.warning(f"{self.path} lama tidak valid, patch tidak dibuat: {str(e)}")
+            return None
+        with open(self.pretty[0].tmp_path, 'r', encoding='utf-8') as f:
+            new = json.load(f)
+        sink = _Sink(patch_path(self.path))
+        self.pretty.append(sink)  # Ikut dihapus oleh _abort jika commit gagal
+        document = {'base': base, 'target': target, 'ops': json_patch(old, new)}
+        sink.write(json.dumps(document, indent=self.indent, ensure_ascii=self.ensure_ascii).encode('utf-8'))
+        sink.close()
+        return sink
+
+    def _abort(self) -> None:
+        for sink in self.pretty + self.minified:
+            sink.abort()
+
+
+# Function to write a list of JSON objects one item at a time
+def write_json_list(path: str, items: Iterable[Dict[str, Any]], variants: bool = True, patch: bool = False,
+                    indent: int = 2, ensure_ascii: bool = False) -> int:
+    """
+    Menulis item satu per satu; `path` berisi format yang sama persis seperti
+    json.dump(list(items), f, indent=indent, ensure_ascii=ensure_ascii).
+    File tidak ditulis ulang jika isinya tidak berubah (lihat JsonListWriter).
+    Mengembalikan jumlah item.
+    """
+    with JsonListWriter(path, variants, patch, indent, ensure_ascii) as writer:
+        for item in items:
+            writer.write(item)
+    if writer.changed:
+        logging.debug(f"Menulis {writer.count} item ke {', '.join(output_paths(path, variants))}")
+    else:
+        logging.info(f"{path} tidak berubah, file tidak ditulis ulang")
+    return writer.count
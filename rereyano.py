@@ -1,9 +1,10 @@
 import requests
 from bs4 import BeautifulSoup
 import re
-import json
 from datetime import datetime
 from pytz import timezone
+from canon import clean_name, entry_id
+from output import write_json_list
 
 def convert_paris_to_jakarta(date_str, time_str):
     # Define time zones
@@ -48,10 +49,10 @@ def scrape_rereyano():
         if not match_pattern:
             continue
         
-        date_str, time_str, league, team_or1, team2_opt = match_pattern.groups()
-        league = league.strip()
-        team_or1 = team_or1.strip()
-        team2 = team2_opt.strip() if team2_opt else ""
+        date_str, time_str, league_raw, team1_raw, team2_opt = match_pattern.groups()
+        league = clean_name(league_raw)
+        team_or1 = clean_name(team1_raw)
+        team2 = clean_name(team2_opt) if team2_opt else ""
         
         # Extract channels
         channel_matches = re.findall(r'\(CH(\d+)(\w+)\)', line)
@@ -75,10 +76,9 @@ def scrape_rereyano():
         match_date_jakarta = kickoff_date_jakarta
         match_time_jakarta = kickoff_time_jakarta
         
-        # Create ID
-        id_str = league.replace(" ", "") + "-" + team_or1.replace(" ", "")
-        if team2:
-            id_str += "-" + team2.replace(" ", "")
+        # Create ID (from the raw names, so published IDs stay the same)
+        id_parts = [league_raw.strip(), team1_raw.strip()] + ([team2_opt.strip()] if team2 else [])
+        id_str = entry_id(*id_parts)
         
         match_data = {
             "id": id_str,
@@ -96,8 +96,7 @@ def scrape_rereyano():
         matches.append(match_data)
     
     # Save to rere.json
-    with open("rere.json", "w", encoding="utf-8") as f:
-        json.dump(matches, f, indent=2)
+    write_json_list("rere.json", matches, variants=False, patch=True, ensure_ascii=True)
     
     return matches
 
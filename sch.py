@@ -1,55 +1,183 @@
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Set, Tuple, NamedTuple, Callable
 import re
-from fuzzywuzzy import fuzz
+from collections import defaultdict, Counter
+from functools import lru_cache
+from fuzzywuzzy import fuzz, utils as fuzz_utils
 from datetime import datetime, timedelta
 import logging
 import requests  # Ditambahkan untuk request ke GitHub API
-import copy      # Ditambahkan untuk menyalin data secara mendalam
-
-# Set up logging to console and file
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('merge.log'),
-        logging.StreamHandler()
-    ]
-)
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
+from urllib.parse import quote, urlsplit, urlunsplit, parse_qsl
+import base64
+import binascii
+from bisect import bisect_left, bisect_right
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from canon import fold_accents, normalize_name, team_pair_key
+from model import matches_from_dicts, matches_to_dicts
+from output import write_json_list
+
+try:
+    # Opsional, hanya untuk mode batch (--batch)
+    import numpy as np
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:
+    np = None
 
 # --- FUNGSI BARU UNTUK MENGAMBIL LOGO DARI GITHUB ---
-def get_github_logos() -> Dict[str, str]:
+GITHUB_API_URL = os.environ.get('GITHUB_API_URL', 'https://api.github.com')
+GITHUB_RAW_URL = os.environ.get('GITHUB_RAW_URL', 'https://raw.githubusercontent.com')
+LOGO_CACHE_FILE = os.path.join('cache', 'github_logos.json')
+
+def load_logo_cache(path: str = LOGO_CACHE_FILE) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_logo_cache(cache: Dict[str, Any], path: str = LOGO_CACHE_FILE) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+    except OSError as e:
+        logging.error(f"Gagal menyimpan cache logo: {str(e)}")
+
+def get_github_logos(owner: str = "sendyarf", repo: str = "logos", branch: str = "main",
+                     folder_path: str = "Logos", cache_path: str = LOGO_CACHE_FILE) -> Dict[str, str]:
     """
     Mengambil daftar logo dari repositori GitHub dan membuat mapping.
     Key: nama tim yang dinormalisasi (contoh: 'ac-milan')
     Value: URL mentah ke gambar logo
+
+    Daftar diambil dari endpoint git trees (tidak terpotong di 1000 file seperti
+    endpoint contents) dan disimpan di `cache_path` bersama ETag dan SHA tree.
+    Request berikutnya memakai If-None-Match; jika 304 atau GitHub tidak bisa
+    dihubungi, daftar dari cache yang dipakai.
     """
-    owner = "sendyarf"
-    repo = "logos"
-    folder_path = "Logos"
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{folder_path}"
-    logo_map = {}
+    api_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/git/trees/{branch}"
+    source = f"{owner}/{repo}/{branch}/{folder_path}"
+    cache = load_logo_cache(cache_path)
+    cached_logos = cache.get('logos', {}) if cache.get('source') == source else {}
+
+    headers = {'Accept': 'application/vnd.github+json'}
+    if cached_logos and cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+    if os.environ.get('GITHUB_TOKEN'):
+        headers['Authorization'] = f"Bearer {os.environ['GITHUB_TOKEN']}"
 
     logging.info(f"Mengambil daftar logo dari GitHub: {api_url}")
     try:
-        response = requests.get(api_url, timeout=15)
+        response = requests.get(api_url, params={'recursive': '1'}, headers=headers, timeout=15)
+        if response.status_code == 304:
+            logging.info(f"Daftar logo tidak berubah (304), memakai {len(cached_logos)} logo dari cache.")
+            return cached_logos
         response.raise_for_status()
-        files = response.json()
-        
-        for item in files:
-            if item['type'] == 'file' and item['name'].lower().endswith(('.png', '.jpg', '.svg')):
-                # Menggunakan nama file tanpa ekstensi sebagai key
-                # Contoh: 'ac-milan.png' -> 'ac-milan'
-                file_name_key = os.path.splitext(item['name'])[0].lower()
-                logo_map[file_name_key] = item['download_url']
-        
-        logging.info(f"Berhasil mengambil {len(logo_map)} logo dari GitHub.")
-        return logo_map
-    except requests.exceptions.RequestException as e:
+        tree = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        if cached_logos:
+            logging.warning(f"Gagal mengambil logo dari GitHub ({e}), memakai {len(cached_logos)} logo dari cache.")
+            return cached_logos
         logging.error(f"Gagal mengambil logo dari GitHub: {e}")
         return {} # Mengembalikan dictionary kosong jika gagal
 
+    if tree.get('truncated'):
+        logging.warning("Daftar tree dari GitHub terpotong; sebagian logo mungkin tidak ada.")
+
+    logo_map = {}
+    prefix = folder_path.rstrip('/') + '/'
+    for item in tree.get('tree', []):
+        path = item['path']
+        name = path[len(prefix):]
+        # Hanya file langsung di dalam folder, sama seperti endpoint contents
+        if item['type'] != 'blob' or not path.startswith(prefix) or '/' in name:
+            continue
+        if name.lower().endswith(('.png', '.jpg', '.svg')):
+            # Menggunakan nama file tanpa ekstensi sebagai key
+            # Contoh: 'ac-milan.png' -> 'ac-milan'
+            file_name_key = os.path.splitext(name)[0].lower()
+            logo_map[file_name_key] = f"{GITHUB_RAW_URL}/{owner}/{repo}/{branch}/{quote(path)}"
+
+    save_logo_cache({
+        'source': source,
+        'etag': response.headers.get('ETag'),
+        'tree_sha': tree.get('sha'),
+        'logos': logo_map,
+    }, cache_path)
+    logging.info(f"Berhasil mengambil {len(logo_map)} logo dari GitHub.")
+    return logo_map
+
+
+class LogoResolver:
+    """
+    Mencari logo untuk nama tim dengan semantik yang sama seperti scan
+    fuzz.token_sort_ratio ke semua key logo_map (skor >= threshold, key pertama
+    dengan skor tertinggi), tetapi:
+      1. key dengan bentuk token-sort yang sama persis langsung dipakai (skor 100),
+      2. fuzzy scoring hanya untuk key yang berbagi token/trigram dengan nama tim,
+         ditambah key tanpa trigram (mis. "ac"); nama tim tanpa trigram dinilai
+         terhadap semua key,
+      3. setiap nama tim hanya di-resolve sekali per run (memo).
+    """
+
+    def __init__(self, logo_map: Dict[str, str], threshold: int = 85):
+        self.logo_map = logo_map
+        self.threshold = threshold
+        self.keys = list(logo_map)
+        self.exact: Dict[str, str] = {}
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        self.short_keys: List[int] = []  # Key tanpa trigram, selalu ikut dinilai
+        self.max_form_len = 0
+        self.memo: Dict[str, Tuple[Optional[str], int]] = {}
+        self.fuzz_calls = 0
+        for pos, key in enumerate(self.keys):
+            form = token_sort_form(key)
+            self.exact.setdefault(form, key)
+            self.max_form_len = max(self.max_form_len, len(form))
+            for index_key in team_index_keys(form):
+                self.postings[index_key].append(pos)
+            if lacks_trigram(form):
+                self.short_keys.append(pos)
+
+    def resolve(self, team_name: str) -> Tuple[Optional[str], int]:
+        """
+        Mengembalikan (key logo terbaik, skor), atau (None, 0) jika tidak ada yang >= threshold.
+        """
+        norm_team = normalize_name(team_name)
+        if norm_team not in self.memo:
+            self.memo[norm_team] = self._resolve(norm_team)
+        return self.memo[norm_team]
+
+    def _resolve(self, norm_team: str) -> Tuple[Optional[str], int]:
+        form = token_sort_form(norm_team)
+        # Bentuk berbeda baru bisa dibulatkan menjadi skor 100 jika total panjangnya >= 200
+        if form in self.exact and len(form) + self.max_form_len < 200:
+            return self.exact[form], 100
+
+        if lacks_trigram(form):
+            candidates = set(range(len(self.keys)))
+        else:
+            candidates = set(self.short_keys)
+            for index_key in team_index_keys(form):
+                candidates.update(self.postings.get(index_key, ()))
+        best_score = 0
+        best_key = None
+        self.fuzz_calls += len(candidates)
+        for pos in sorted(candidates):
+            logo_key = self.keys[pos]
+            score = fuzz.token_sort_ratio(norm_team, logo_key)
+            if score > best_score and score >= self.threshold:
+                best_score = score
+                best_key = logo_key
+        return best_key, best_score
+
 
 # Function to subtract 10 minutes from a time, adjusting date if necessary
 def subtract_ten_minutes(date_str: str, time_str: str) -> tuple[str, str]:
@@ -63,577 +191,1524 @@ def subtract_ten_minutes(date_str: str, time_str: str) -> tuple[str, str]:
         logging.error(f"Error processing date/time {date_str} {time_str}: {str(e)}")
         return date_str, time_str  # Return original values in case of error
 
-# Function to normalize names
-def normalize_name(name: str) -> str:
-    name = re.sub(r'\s*\([^)]*\)', '', name)
-    name = name.lower().strip()
-    accents = {'ñ': 'n', 'é': 'e', 'í': 'i', 'ó': 'o', 'á': 'a', 'ú': 'u'}
-    for acc, repl in accents.items():
-        name = name.replace(acc, repl)
-    return name
+EPOCH = datetime(1970, 1, 1)
 
-# Function to remove duplicate servers
-def remove_duplicate_servers(existing_servers: List[Dict[str, str]], new_servers: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    seen_urls = {server['url'] for server in existing_servers}
-    result = existing_servers.copy()
+# Function to parse kickoff date and time into minutes since epoch
+def kickoff_minutes(date_str: str, time_str: str) -> Optional[int]:
+    try:
+        dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+    except ValueError:
+        return None
+    return int((dt - EPOCH).total_seconds()) // 60
+
+class MatchRecord:
+    """
+    Field pencocokan yang sudah dinormalisasi untuk satu entri/item.
+    Dibuat sekali per entri sehingga normalize_name dan strptime tidak
+    dijalankan ulang untuk setiap pasangan yang dibandingkan.
+    """
+    __slots__ = ('league', 'team1', 'team2', 'kickoff', 'league_id')
+
+    def __init__(self, league: str, team1: str, team2: str, kickoff: Optional[int]):
+        self.league = league
+        self.team1 = team1
+        self.team2 = team2
+        self.kickoff = kickoff
+        self.league_id = LEAGUES.league_id(league)
+
+# Function to build the match record of a schedule entry or source item
+def make_record(item: Dict[str, Any], default_date: str = '') -> MatchRecord:
+    return MatchRecord(
+        normalize_name(item['league']),
+        normalize_name(item['team1']['name']),
+        normalize_name(item['team2']['name']),
+        kickoff_minutes(item.get('kickoff_date', default_date), item.get('kickoff_time', ''))
+    )
+
+# --- TABEL LIGA KANONIK ---
+LEAGUE_MIN_SCORE = 90  # Gerbang liga rere/manual dan inplaynet (token_sort_ratio >= 90)
+
+class LeagueTable:
+    """
+    ID kanonik per liga: liga dengan bentuk token-sort yang sama (setelah
+    normalize_name dan terjemahan translate/en.json) mendapat ID yang sama,
+    karena skor fuzz.token_sort_ratio-nya terhadap liga lain pasti sama.
+    Skor antar ID dihitung sekali lalu disimpan, sehingga gerbang liga
+    menjadi perbandingan integer. merge_schedule mengosongkan tabel di awal
+    setiap run, jadi ID hanya berlaku untuk MatchRecord dari run yang sama.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.forms: List[str] = []
+        self.scores: Dict[Tuple[int, int], int] = {}
+
+    def clear(self) -> None:
+        self.ids.clear()
+        self.forms.clear()
+        self.scores.clear()
+
+    def league_id(self, league: str) -> int:
+        form = token_sort_form(league)
+        league_id = self.ids.get(form)
+        if league_id is None:
+            league_id = self.ids[form] = len(self.forms)
+            self.forms.append(form)
+        return league_id
+
+    def similarity(self, id1: int, id2: int) -> int:
+        """
+        fuzz.token_sort_ratio antara dua liga.
+        """
+        key = (id1, id2) if id1 <= id2 else (id2, id1)
+        score = self.scores.get(key)
+        if score is None:
+            # token_sort_ratio = ratio dari bentuk token-sort kedua string
+            score = self.scores[key] = fuzz.ratio(self.forms[id1], self.forms[id2])
+        return score
+
+    def matrix(self, ids1: List[int], ids2: List[int]) -> 'np.ndarray':
+        """
+        Matriks skor (0-100) untuk mode batch, dari tabel skor ID unik.
+        """
+        unique1, rows = np.unique(np.array(ids1, dtype=np.int64), return_inverse=True)
+        unique2, cols = np.unique(np.array(ids2, dtype=np.int64), return_inverse=True)
+        table = np.array([[self.similarity(int(a), int(b)) for b in unique2] for a in unique1], dtype=np.float64)
+        return table[rows.reshape(-1)[:, None], cols.reshape(-1)[None, :]]
+
+LEAGUES = LeagueTable()
+
+# Function to build the token-sorted form used by fuzz.token_sort_ratio
+def token_sort_form(name: str) -> str:
+    return " ".join(sorted(fuzz_utils.full_process(name, force_ascii=True).split())).strip()
+
+# Function to build the inverted-index keys of a normalized team name
+def team_index_keys(norm_name: str) -> Set[str]:
+    """
+    Token dan trigram karakter dari nama tim yang dinormalisasi.
+    Nama yang kosong setelah diproses fuzzywuzzy (mis. tim kosong pada event
+    tunggal) mendapat key '' karena token_sort_ratio menilai keduanya 100.
+    """
+    keys = set()
+    for token in norm_name.split():
+        keys.add(token)
+        for i in range(len(token) - 2):
+            keys.add(token[i:i + 3])
+    if not fuzz_utils.full_process(norm_name, force_ascii=True):
+        keys.add('')
+    return keys
+
+def record_index_keys(record: MatchRecord) -> Set[str]:
+    return team_index_keys(record.team1) | team_index_keys(record.team2)
+
+# Function to check whether a normalized name has no trigram key (every token is shorter than 3 characters)
+def lacks_trigram(norm_name: str) -> bool:
+    """
+    Nama seperti "AC" atau "P SG" tidak punya trigram, sehingga bisa cocok secara
+    fuzzy dengan nama yang tidak berbagi satu key pun ("PSG"). Nama yang kosong
+    setelah diproses fuzzywuzzy tidak termasuk karena sudah punya key ''.
+    """
+    return (not any(len(token) >= 3 for token in norm_name.split())
+            and bool(fuzz_utils.full_process(norm_name, force_ascii=True)))
+
+def record_lacks_trigram(record: MatchRecord) -> bool:
+    return lacks_trigram(record.team1) or lacks_trigram(record.team2)
+
+# Function to build an order-independent key of the two team names
+def team_pair(record: MatchRecord) -> tuple:
+    return team_pair_key(record.team1, record.team2)
+
+# Keys of the strict (exact equality) matchers, per source
+def strict_key_rere_manual(record: MatchRecord, item: Dict[str, Any]) -> tuple:
+    return (record.league, team_pair(record), item['kickoff_date'], item['kickoff_time'])
+
+def strict_key_inplaynet(record: MatchRecord, item: Dict[str, Any]) -> tuple:
+    return (record.league, team_pair(record))
+
+def strict_key_sportsonline(record: MatchRecord, item: Dict[str, Any]) -> tuple:
+    return (team_pair(record), item['kickoff_time'])
+
+def strict_key_teams(record: MatchRecord, item: Dict[str, Any]) -> tuple:
+    return team_pair(record)
+
+STRICT_KEYS = {
+    'rere_manual': strict_key_rere_manual,
+    'inplaynet': strict_key_inplaynet,
+    'sportsonline': strict_key_sportsonline,
+    'teams': strict_key_teams,  # streamcenter.json dan soco.json
+}
+
+
+# --- TABEL ALIAS NAMA TIM ANTAR SUMBER ---
+ALIAS_FILE = os.path.join('cache', 'team_aliases.json')
+ALIAS_MAX_AGE_DAYS = 30     # Alias yang tidak terlihat selama N hari dibuang
+ALIAS_MAX_ENTRIES = 5000    # Batas total alias; yang paling lama tidak terlihat dibuang lebih dulu
+ALIAS_MIN_SCORE = 0.9       # Skor kecocokan minimum (skala 0-1) agar alias dipelajari
+ALIAS_NAME_MIN_SIMILARITY = 90  # team_similarity minimum antara nama itu sendiri dan nama di schedule
+
+# Function to check whether a team name may be learned as an alias of a schedule name
+def alias_allowed(name: str, sch_name: str) -> bool:
+    return token_sort_form(name) == token_sort_form(sch_name) or \
+        team_similarity(name, sch_name) >= ALIAS_NAME_MIN_SIMILARITY
+
+class AliasStore:
+    """
+    Alias persisten: nama tim ternormalisasi per sumber -> key tim kanonik.
+    Key kanonik adalah nama ternormalisasi di sisi schedule, setelah seed dari
+    translate/en.json. Alias dipelajari dari kecocokan fuzzy berskor tinggi,
+    per nama hanya jika nama itu sendiri mirip dengan nama di schedule (skor
+    pasangan saja tidak cukup: "Manchester United" vs "Manchester City" dengan
+    lawan yang sama tetap berskor tinggi). Nama yang sudah dikenal persis di
+    schedule tidak pernah dialihkan oleh alias.
+    Pencocokan selama satu run membaca snapshot saat dimuat (`frozen`), sehingga
+    alias baru baru berlaku pada run berikutnya dan hasil run tidak bergantung
+    pada urutan pemrosesan sumber.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, Dict[str, Dict[str, str]]]] = None,
+                 seeds: Optional[Dict[str, str]] = None, today: Optional[str] = None):
+        self.aliases = aliases or {}
+        self.seeds = seeds or {}
+        self.today = today or datetime.now().strftime("%Y-%m-%d")
+        self.frozen = {source: {name: entry['key'] for name, entry in names.items()}
+                       for source, names in self.aliases.items()}
+        self.hits = 0
+        self.learned = 0
+
+    @classmethod
+    def load(cls, trans_dict: Dict[str, str], path: str = ALIAS_FILE) -> 'AliasStore':
+        seeds = {}
+        for raw, translated in trans_dict.items():
+            norm_raw, norm_translated = normalize_name(raw), normalize_name(translated)
+            if norm_raw != norm_translated:
+                seeds[norm_raw] = norm_translated
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                aliases = json.load(f).get('aliases', {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            aliases = {}
+        # Alias lama yang dipelajari sebelum syarat kemiripan nama berlaku dibuang
+        aliases = {source: {name: entry for name, entry in names.items() if alias_allowed(name, entry['key'])}
+                   for source, names in aliases.items()}
+        return cls(aliases, seeds)
+
+    def snapshot_hash(self) -> str:
+        return hashlib.sha256(json.dumps([self.frozen, self.seeds], sort_keys=True).encode('utf-8')).hexdigest()
+
+    def entry_key(self, norm_name: str) -> str:
+        return self.seeds.get(norm_name, norm_name)
+
+    def touch(self, source: str, norm_name: str) -> None:
+        entry = self.aliases.get(source, {}).get(norm_name)
+        if entry is not None:
+            entry['seen'] = self.today
+
+    def resolve(self, source: str, norm_name: str, known_keys: Set[str]) -> Optional[str]:
+        key = self.entry_key(norm_name)
+        if key in known_keys:
+            return key
+        key = self.frozen.get(source, {}).get(norm_name)
+        if key is not None:
+            self.touch(source, norm_name)
+        return key
+
+    def learn(self, source: str, rec: MatchRecord, sch_rec: MatchRecord) -> None:
+        straight = team_similarity(rec.team1, sch_rec.team1) + team_similarity(rec.team2, sch_rec.team2)
+        swapped = team_similarity(rec.team1, sch_rec.team2) + team_similarity(rec.team2, sch_rec.team1)
+        pairs = ((rec.team1, sch_rec.team1), (rec.team2, sch_rec.team2)) if straight >= swapped else \
+                ((rec.team1, sch_rec.team2), (rec.team2, sch_rec.team1))
+        names = self.aliases.setdefault(source, {})
+        for name, sch_name in pairs:
+            key = self.entry_key(sch_name)
+            if not name or not key or self.entry_key(name) == key:
+                continue
+            if not alias_allowed(name, sch_name):
+                continue
+            entry = names.get(name)
+            if entry is None or entry['key'] != key:
+                self.learned += 1
+            names[name] = {'key': key, 'seen': self.today}
+
+    def evict(self, max_age_days: int = ALIAS_MAX_AGE_DAYS, max_entries: int = ALIAS_MAX_ENTRIES) -> int:
+        cutoff = (datetime.strptime(self.today, "%Y-%m-%d") - timedelta(days=max_age_days)).strftime("%Y-%m-%d")
+        entries = [(entry['seen'], source, name) for source, names in self.aliases.items()
+                   for name, entry in names.items()]
+        entries.sort(reverse=True)
+        evicted = 0
+        for pos, (seen, source, name) in enumerate(entries):
+            if seen < cutoff or pos >= max_entries:
+                del self.aliases[source][name]
+                evicted += 1
+        return evicted
+
+    def save(self, path: str = ALIAS_FILE) -> None:
+        evicted = self.evict()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'aliases': self.aliases}, f, indent=2, ensure_ascii=False, sort_keys=True)
+            logging.info(f"Alias tim: {self.hits} lookup berhasil, {self.learned} alias baru, {evicted} dibuang")
+        except OSError as e:
+            logging.error(f"Gagal menyimpan alias tim: {str(e)}")
+
+class ScheduleIndex:
+    """
+    Inverted index token/trigram nama tim -> indeks entri di schedule,
+    beserta MatchRecord setiap entri. Matcher hanya menilai entri yang
+    berbagi minimal satu key dengan item, bukan seluruh schedule.
+    Entri dengan nama tim tanpa trigram (lacks_trigram) selalu menjadi kandidat.
+    Pencocokan ketat menjadi satu lookup dict per sumber (STRICT_KEYS).
+    Dengan AliasStore, entri juga diindeks per pasangan key tim kanonik.
+    Kickoff (menit epoch) disimpan terurut untuk jendela waktu (bisect);
+    entri tanpa kickoff yang valid (mis. "LIVE") masuk ke bucket `untimed`.
+    Entri juga dikelompokkan per ID liga (LEAGUES) untuk matcher dengan gerbang liga.
+    Entri baru harus ditambahkan lewat append().
+    """
+
+    def __init__(self, schedule: List[Dict[str, Any]], aliases: Optional[AliasStore] = None):
+        self.schedule = schedule
+        self.aliases = aliases
+        self.alias_pairs: Dict[tuple, List[int]] = defaultdict(list)
+        self.alias_keys: Set[str] = set()
+        self.records: List[MatchRecord] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        self.short_names: List[int] = []  # Entri dengan nama tim tanpa trigram
+        self.strict: Dict[str, Dict[tuple, int]] = {kind: {} for kind in STRICT_KEYS}
+        self.kickoff_keys: List[int] = []   # Kickoff terurut, sejajar dengan kickoff_idx
+        self.kickoff_idx: List[int] = []
+        self.untimed: List[int] = []
+        self.league_postings: Dict[int, List[int]] = defaultdict(list)
+        self.server_keys: Dict[int, Set[str]] = {}  # URL server kanonik per entri, dibuat saat merge pertama
+        self.league_compat: Dict[Tuple[int, int], Set[int]] = {}  # (ID liga, skor minimum) -> ID liga yang lolos
+        # Hash berantai dari field yang dibaca matcher; server tidak ikut karena tidak memengaruhi pencocokan
+        self.fingerprint = ''
+        for sch in schedule:
+            self._add_entry(sch)
+
+    def _add_entry(self, sch: Dict[str, Any]) -> None:
+        idx = len(self.records)
+        record = make_record(sch)
+        self.records.append(record)
+        for key in record_index_keys(record):
+            self.postings[key].append(idx)
+        if record_lacks_trigram(record):
+            self.short_names.append(idx)
+        if record.league_id not in self.league_postings:
+            self.league_compat.clear()  # Liga baru bisa cocok dengan liga item yang sudah dihitung
+        self.league_postings[record.league_id].append(idx)
+        if record.kickoff is None:
+            self.untimed.append(idx)
+        else:
+            pos = bisect_right(self.kickoff_keys, record.kickoff)
+            self.kickoff_keys.insert(pos, record.kickoff)
+            self.kickoff_idx.insert(pos, idx)
+        for kind, key_func in STRICT_KEYS.items():
+            # Simpan hanya indeks pertama, sama seperti scan linear
+            self.strict[kind].setdefault(key_func(record, sch), idx)
+        if self.aliases is not None:
+            key1, key2 = self.aliases.entry_key(record.team1), self.aliases.entry_key(record.team2)
+            self.alias_keys.update((key1, key2))
+            self.alias_pairs[(key1, key2) if key1 <= key2 else (key2, key1)].append(idx)
+        match_fields = [sch['league'], sch['team1']['name'], sch['team2']['name'],
+                        sch.get('kickoff_date'), sch.get('kickoff_time')]
+        self.fingerprint = hashlib.sha256(
+            (self.fingerprint + json.dumps(match_fields, ensure_ascii=False)).encode('utf-8')
+        ).hexdigest()
+
+    def append(self, item: Dict[str, Any]) -> None:
+        # Salinan dangkal: merge berikutnya mengubah entri schedule, bukan item sumber (dict atau Match)
+        item = item.copy()
+        self.schedule.append(item)
+        self._add_entry(item)
+
+    def candidates(self, record: MatchRecord) -> List[int]:
+        found = set(self.short_names)
+        for key in record_index_keys(record):
+            found.update(self.postings.get(key, ()))
+        # Urutan indeks harus naik agar hasil sama dengan scan penuh
+        return sorted(found)
+
+    def compatible_leagues(self, league_id: int, min_score: int) -> Set[int]:
+        """
+        ID liga di schedule yang punya token_sort_ratio >= min_score dengan `league_id`.
+        Yang disimpan ID liga, bukan indeks entri, sehingga entri yang ditambahkan
+        lewat append() ke liga yang sudah ada langsung ikut lolos gerbang.
+        """
+        key = (league_id, min_score)
+        if key not in self.league_compat:
+            self.league_compat[key] = {sch_id for sch_id in self.league_postings
+                                       if LEAGUES.similarity(league_id, sch_id) >= min_score}
+        return self.league_compat[key]
+
+    def time_window(self, kickoff: int, minutes: int) -> Set[int]:
+        """
+        Indeks entri dengan kickoff dalam +-`minutes` dari `kickoff` (tanpa bucket untimed).
+        """
+        lo = bisect_left(self.kickoff_keys, kickoff - minutes)
+        hi = bisect_right(self.kickoff_keys, kickoff + minutes)
+        return set(self.kickoff_idx[lo:hi])
+
+    def alias_candidates(self, source: str, record: MatchRecord) -> Optional[List[int]]:
+        """
+        Entri dengan pasangan tim yang sama menurut alias, atau None jika salah satu tim belum dikenal.
+        """
+        if self.aliases is None:
+            return None
+        key1 = self.aliases.resolve(source, record.team1, self.alias_keys)
+        key2 = self.aliases.resolve(source, record.team2, self.alias_keys)
+        if key1 is None or key2 is None:
+            return None
+        return self.alias_pairs.get((key1, key2) if key1 <= key2 else (key2, key1), [])
+
+    def merge_servers(self, idx: int, new_servers: List[Dict[str, str]]) -> None:
+        """
+        Menambahkan server baru ke entri `idx`, tanpa duplikat menurut canonical_server_url.
+        """
+        seen_keys = self.server_keys.get(idx)
+        if seen_keys is None:
+            # Salin list server sekali agar data sumber milik pemanggil tidak ikut berubah
+            servers = self.schedule[idx]['servers'] = list(self.schedule[idx].get('servers', []))
+            seen_keys = self.server_keys[idx] = {canonical_server_url(server['url']) for server in servers}
+        add_new_servers(self.schedule[idx]['servers'], seen_keys, new_servers)
+
+    def strict_lookup(self, kind: str, item: Dict[str, Any]) -> int:
+        key = STRICT_KEYS[kind](make_record(item), item)
+        return self.strict[kind].get(key, -1)
+
+# Function to get the match records of the schedule (built on the fly without an index)
+def schedule_records(schedule: List[Dict[str, Any]], index: Optional[ScheduleIndex] = None) -> List[MatchRecord]:
+    if index is None:
+        return [make_record(sch) for sch in schedule]
+    return index.records
+
+# Function to pick which schedule entries (from index `start` onwards) a matcher scores
+def candidate_indices(schedule: List[Dict[str, Any]], record: MatchRecord,
+                      index: Optional[ScheduleIndex] = None, start: int = 0,
+                      max_minutes: Optional[int] = None, league_min: Optional[int] = None) -> Iterable[int]:
+    """
+    Item dengan nama tim tanpa trigram dinilai terhadap semua entri (scan penuh).
+    Dengan `max_minutes`, hanya entri yang kickoff-nya dalam jendela waktu
+    tersebut; item tanpa kickoff yang valid tidak punya kandidat.
+    Dengan `league_min`, hanya entri yang liganya lolos gerbang liga.
+    """
+    if index is None:
+        return range(start, len(schedule))
+    if record_lacks_trigram(record):
+        candidates = range(start, len(schedule))
+    else:
+        candidates = index.candidates(record)
+        candidates = candidates[bisect_left(candidates, start):]
+    if league_min is not None:
+        leagues = index.compatible_leagues(record.league_id, league_min)
+        records = index.records
+        candidates = [idx for idx in candidates if records[idx].league_id in leagues]
+    if max_minutes is None:
+        return candidates
+    if record.kickoff is None:
+        return []
+    window = index.time_window(record.kickoff, max_minutes)
+    return [idx for idx in candidates if idx in window]
+
+# --- DEDUP SERVER BERDASARKAN URL KANONIK ---
+ENCODED_URL_PARAMS = ('iframe', 'hls')  # Parameter player berisi URL stream dalam base64
+CHANNEL_PARAMS = ('envivo', 'ss')       # Parameter player berisi ID channel
+SERVER_URL_MEMO_SIZE = 16384            # Batas memo canonical_server_url (URL server unik per run jauh di bawah ini)
+
+def _normalize_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+def _decode_base64_url(value: str) -> Optional[str]:
+    value = value.strip().replace('-', '+').replace('_', '/')
+    try:
+        decoded = base64.b64decode(value + '=' * (-len(value) % 4)).decode('utf-8')
+    except (binascii.Error, ValueError):
+        return None
+    return decoded if '://' in decoded else None
+
+@lru_cache(maxsize=SERVER_URL_MEMO_SIZE)
+def canonical_server_url(url: str) -> str:
+    """
+    Key kanonik stream di balik URL server player, mis.
+    ?iframe=<base64> dan ?hls=<base64> menjadi URL yang di-decode (padding dan
+    alfabet urlsafe tidak berpengaruh), ?envivo=007 dan ?envivo=7 menjadi
+    'envivo:7'. URL lain dinormalisasi (skema/host huruf kecil, tanpa fragment).
+    '+' mentah di query tetap '+' (bukan spasi), karena scraper menulis base64 tanpa quote.
+    """
+    params = dict(parse_qsl(urlsplit(url.strip()).query.replace('+', '%2B')))
+    if len(params) == 1:
+        (name, value), = params.items()
+        name = name.lower()
+        if name in ENCODED_URL_PARAMS:
+            decoded = _decode_base64_url(value)
+            if decoded is not None:
+                return _normalize_url(decoded)
+        elif name in CHANNEL_PARAMS:
+            channel = value.strip().lower()
+            return f"{name}:{(channel.lstrip('0') or '0') if channel.isdigit() else channel}"
+    return _normalize_url(url)
+
+# Function to add servers whose canonical URL is not in `seen_keys` yet (updates both in place)
+def add_new_servers(servers: List[Dict[str, str]], seen_keys: Set[str], new_servers: List[Dict[str, str]]) -> None:
     for server in new_servers:
-        if server['url'] not in seen_urls:
-            seen_urls.add(server['url'])
-            result.append(server)
+        key = canonical_server_url(server['url'])
+        if key not in seen_keys:
+            seen_keys.add(key)
+            servers.append(server)
             logging.debug(f"Added server {server['url']} ({server['label']})")
         else:
             logging.debug(f"Skipped duplicate server {server['url']} ({server['label']})")
-    return result
 
-# Function to translate data
-def translate_data(data: List[Dict[str, Any]], trans_dict: Dict[str, str]) -> List[Dict[str, Any]]:
-    translated = []
-    for item in data:
-        trans_item = item.copy()
-        trans_item['league'] = trans_dict.get(trans_item['league'], trans_item['league'])
-        trans_item['team1']['name'] = trans_dict.get(trans_item['team1']['name'], trans_item['team1']['name'])
-        trans_item['team2']['name'] = trans_dict.get(trans_item['team2']['name'], trans_item['team2']['name'])
-        translated.append(trans_item)
-    return translated
-
-# Function to calculate time difference in minutes
-def time_difference(time1: str, time2: str, date1: str, date2: str) -> float:
-    try:
-        dt1 = datetime.strptime(f"{date1} {time1}", "%Y-%m-%d %H:%M")
-        dt2 = datetime.strptime(f"{date2} {time2}", "%Y-%m-%d %H:%M")
-        diff = abs((dt1 - dt2).total_seconds() / 60)
-        return diff
-    except ValueError:
-        return float('inf')
+# Function to remove duplicate servers
+def remove_duplicate_servers(existing_servers: List[Dict[str, str]], new_servers: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    result = existing_servers.copy()
+    add_new_servers(result, {canonical_server_url(server['url']) for server in existing_servers}, new_servers)
+    return result
 
-# Function for strict matching (fallback)
-def strict_match_rere_manual(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
-    norm_league = normalize_name(item['league'])
-    norm_team1 = normalize_name(item['team1']['name'])
-    norm_team2 = normalize_name(item['team2']['name'])
-    date = item['kickoff_date']
-    time = item['kickoff_time']
-    for idx, sch in enumerate(schedule):
-        sch_norm_league = normalize_name(sch['league'])
-        sch_norm_team1 = normalize_name(sch['team1']['name'])
-        sch_norm_team2 = normalize_name(sch['team2']['name'])
-        if (sch_norm_league == norm_league and
-            ((sch_norm_team1 == norm_team1 and sch_norm_team2 == norm_team2) or
-             (sch_norm_team1 == norm_team2 and sch_norm_team2 == norm_team1)) and
-            sch['kickoff_date'] == date and
-            sch['kickoff_time'] == time):
-            logging.debug(f"Strict match found for {item['id']} with {sch['id']}")
-            return idx
-    return -1
-
-def strict_match_inplaynet(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
-    norm_league = normalize_name(item['league'])
-    norm_team1 = normalize_name(item['team1']['name'])
-    norm_team2 = normalize_name(item['team2']['name'])
-    for idx, sch in enumerate(schedule):
-        sch_norm_league = normalize_name(sch['league'])
-        sch_norm_team1 = normalize_name(sch['team1']['name'])
-        sch_norm_team2 = normalize_name(sch['team2']['name'])
-        if (sch_norm_league == norm_league and
-            ((sch_norm_team1 == norm_team1 and sch_norm_team2 == norm_team2) or
-             (sch_norm_team1 == norm_team2 and sch_norm_team2 == norm_team1))):
-            logging.debug(f"Strict match found for {item['id']} with {sch['id']}")
-            return idx
-    return -1
-
-def strict_match_sportsonline(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
-    norm_team1 = normalize_name(item['team1']['name'])
-    norm_team2 = normalize_name(item['team2']['name'])
-    time = item['kickoff_time']
-    for idx, sch in enumerate(schedule):
-        sch_norm_team1 = normalize_name(sch['team1']['name'])
-        sch_norm_team2 = normalize_name(sch['team2']['name'])
-        if (((sch_norm_team1 == norm_team1 and sch_norm_team2 == norm_team2) or
-             (sch_norm_team1 == norm_team2 and sch_norm_team2 == norm_team1)) and
-            sch['kickoff_time'] == time):
-            logging.debug(f"Strict match found for {item['id']} with {sch['id']}")
-            return idx
-    return -1
+# --- PENERJEMAH NAMA LIGA/TIM ---
+TRANSLATION_MEMO_SIZE = 8192
+# Tag negara 3 huruf di akhir nama yang diabaikan saat mencari key, mis. "Beşiktaş (Tur)". Tag lain
+# seperti "(W)" atau "(U21)" menandai tim/liga yang berbeda, jadi tetap ikut dalam key.
+TRANSLATION_COUNTRY_TAG_RE = re.compile(r'\s*\([A-Z][a-z]{2}\)\s*$')
 
-# Function for fuzzy matching (rere.json and manual.json)
-def find_match_rere_manual(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
-    best_match_idx = -1
-    best_score = 0.0
-    norm_league = normalize_name(item['league'])
-    norm_team1 = normalize_name(item['team1']['name'])
-    norm_team2 = normalize_name(item['team2']['name'])
-    date = item['kickoff_date']
-    time = item['kickoff_time']
-    for idx, sch in enumerate(schedule):
-        sch_norm_league = normalize_name(sch['league'])
-        sch_norm_team1 = normalize_name(sch['team1']['name'])
-        sch_norm_team2 = normalize_name(sch['team2']['name'])
-        
-        league_score = fuzz.token_sort_ratio(norm_league, sch_norm_league) / 100.0
-        if league_score < 0.9:
-            logging.debug(f"Skipping {item['id']} vs {sch['id']} due to low league_score={league_score:.2f}")
-            continue
-        
-        team1_score = max(fuzz.token_sort_ratio(norm_team1, sch_norm_team1), fuzz.partial_ratio(norm_team1, sch_norm_team1)) / 100.0
-        team2_score = max(fuzz.token_sort_ratio(norm_team2, sch_norm_team2), fuzz.partial_ratio(norm_team2, sch_norm_team2)) / 100.0
-        team_score = max(
-            (team1_score + team2_score) / 2,
-            (max(fuzz.token_sort_ratio(norm_team1, sch_norm_team2), fuzz.partial_ratio(norm_team1, sch_norm_team2)) +
-             max(fuzz.token_sort_ratio(norm_team2, sch_norm_team1), fuzz.partial_ratio(norm_team2, sch_norm_team1))) / 200.0
-        )
-        
-        date_score = 1.0 if date == sch['kickoff_date'] else 0.0
-        time_diff = time_difference(time, sch['kickoff_time'], date, sch['kickoff_date'])
-        time_score = 1.0 if time_diff <= 30 else max(0.0, 1.0 - time_diff / 120.0)
-
-        total_score = (0.3 * league_score + 0.6 * team_score + 0.05 * date_score + 0.05 * time_score)
-        
-        logging.debug(
-            f"Comparing {item['id']} with {sch['id']}: league_score={league_score:.2f}, team_score={team_score:.2f}, "
-            f"date_score={date_score:.2f}, time_score={time_score:.2f}, total_score={total_score:.2f}"
-        )
-        
-        if total_score >= threshold and total_score > best_score:
-            best_score = total_score
-            best_match_idx = idx
+class Translator:
+    """
+    Penerjemah translate/en.json yang dikompilasi sekali per kamus:
+      1. key persis (perilaku lama),
+      2. key ternormalisasi (huruf kecil, aksen dilipat) setelah tag negara
+         seperti "(Tur)" dibuang (TRANSLATION_COUNTRY_TAG_RE); keterangan lain
+         dalam kurung tidak dibuang, jadi "Liverpool (W)" tidak menjadi "Liverpool",
+      3. selain itu nama tidak berubah.
+    Hasil per string input disimpan di memo LRU. Item yang tidak berubah
+    dikembalikan apa adanya (copy-on-write), jadi data pemanggil tidak pernah diubah.
+
+    Terjemahan sebagian (mis. akhiran nama) sengaja tidak dipakai: "Inter Milan"
+    akan ikut menjadi "AC Milan" karena key "Milan".
+    """
 
-    # Fallback to strict matching
-    if best_match_idx == -1:
-        strict_idx = strict_match_rere_manual(schedule, item)
-        if strict_idx != -1:
-            logging.debug(f"Fallback to strict match for {item['id']}")
-            return strict_idx
+    def __init__(self, trans_dict: Dict[str, str]):
+        self.exact = dict(trans_dict)
+        self.normalized: Dict[str, str] = {}
+        for key, value in trans_dict.items():
+            self.normalized.setdefault(self.normalize_key(key), value)
+        self.stats: Dict[str, int] = Counter()
+        self.lookup = lru_cache(maxsize=TRANSLATION_MEMO_SIZE)(self._lookup)
+
+    @staticmethod
+    def normalize_key(name: str) -> str:
+        return fold_accents(TRANSLATION_COUNTRY_TAG_RE.sub('', name).lower()).strip()
+
+    def _lookup(self, name: str) -> str:
+        if name in self.exact:
+            self.stats['exact'] += 1
+            return self.exact[name]
+        translated = self.normalized.get(self.normalize_key(name))
+        if translated is not None:
+            self.stats['normalized'] += 1
+            return translated
+        self.stats['miss'] += 1
+        return name
+
+    def translate_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        league = self.lookup(item['league'])
+        team1 = self.lookup(item['team1']['name'])
+        team2 = self.lookup(item['team2']['name'])
+        if league == item['league'] and team1 == item['team1']['name'] and team2 == item['team2']['name']:
+            return item
+        trans_item = dict(item, league=league)
+        if team1 != item['team1']['name']:
+            trans_item['team1'] = dict(item['team1'], name=team1)
+        if team2 != item['team2']['name']:
+            trans_item['team2'] = dict(item['team2'], name=team2)
+        return trans_item
+
+    def translate_items(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self.translate_item(item) for item in data]
+
+    def hit_rates(self) -> Dict[str, Any]:
+        """
+        Jumlah lookup per jenis hasil (exact/normalized/miss dihitung per string unik) dan rasio hit memo.
+        """
+        memo = self.lookup.cache_info()
+        lookups = memo.hits + memo.misses
+        return dict(self.stats, lookups=lookups, memo_hit_rate=round(memo.hits / lookups, 3) if lookups else 0.0)
 
-    return best_match_idx
+# Function to translate data
+def translate_data(data: List[Dict[str, Any]], trans_dict: Dict[str, str]) -> List[Dict[str, Any]]:
+    return Translator(trans_dict).translate_items(data)
 
-# Function for fuzzy matching (inplaynet.json)
-def find_match_inplaynet(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
-    best_match_idx = -1
-    best_score = 0.0
-    norm_league = normalize_name(item['league'])
-    norm_team1 = normalize_name(item['team1']['name'])
-    norm_team2 = normalize_name(item['team2']['name'])
-    for idx, sch in enumerate(schedule):
-        sch_norm_league = normalize_name(sch['league'])
-        sch_norm_team1 = normalize_name(sch['team1']['name'])
-        sch_norm_team2 = normalize_name(sch['team2']['name'])
-        
-        league_score = fuzz.token_sort_ratio(norm_league, sch_norm_league) / 100.0
-        if league_score < 0.9:
-            logging.debug(f"Skipping {item['id']} vs {sch['id']} due to low league_score={league_score:.2f}")
-            continue
-        
-        team1_score = max(fuzz.token_sort_ratio(norm_team1, sch_norm_team1), fuzz.partial_ratio(norm_team1, sch_norm_team1)) / 100.0
-        team2_score = max(fuzz.token_sort_ratio(norm_team2, sch_norm_team2), fuzz.partial_ratio(norm_team2, sch_norm_team2)) / 100.0
-        team_score = max(
-            (team1_score + team2_score) / 2,
-            (max(fuzz.token_sort_ratio(norm_team1, sch_norm_team2), fuzz.partial_ratio(norm_team1, sch_norm_team2)) +
-             max(fuzz.token_sort_ratio(norm_team2, sch_norm_team1), fuzz.partial_ratio(norm_team2, sch_norm_team1))) / 200.0
-        )
-
-        total_score = (0.3 * league_score + 0.7 * team_score)
-        
-        logging.debug(
-            f"Comparing {item['id']} with {sch['id']}: league_score={league_score:.2f}, team_score={team_score:.2f}, "
-            f"total_score={total_score:.2f}"
-        )
-        
-        if total_score >= threshold and total_score > best_score:
-            best_score = total_score
-            best_match_idx = idx
+# Function to calculate time difference in minutes between two parsed kickoffs
+def time_difference(kickoff1: Optional[int], kickoff2: Optional[int]) -> float:
+    if kickoff1 is None or kickoff2 is None:
+        return float('inf')
+    return float(abs(kickoff1 - kickoff2))
 
-    # Fallback to strict matching
-    if best_match_idx == -1:
-        strict_idx = strict_match_inplaynet(schedule, item)
-        if strict_idx != -1:
-            logging.debug(f"Fallback to strict match for {item['id']}")
-            return strict_idx
+# Function for strict matching (fallback)
+def strict_match(schedule: List[Dict[str, Any]], item: Dict[str, Any], kind: str,
+                 index: Optional[ScheduleIndex] = None) -> int:
+    if index is None:
+        index = ScheduleIndex(schedule)
+    idx = index.strict_lookup(kind, item)
+    if idx != -1:
+        logging.debug(f"Strict match found for {item['id']} with {schedule[idx]['id']}")
+    return idx
+
+def strict_match_rere_manual(schedule: List[Dict[str, Any]], item: Dict[str, Any],
+                             index: Optional[ScheduleIndex] = None) -> int:
+    return strict_match(schedule, item, 'rere_manual', index)
+
+def strict_match_inplaynet(schedule: List[Dict[str, Any]], item: Dict[str, Any],
+                           index: Optional[ScheduleIndex] = None) -> int:
+    return strict_match(schedule, item, 'inplaynet', index)
+
+def strict_match_sportsonline(schedule: List[Dict[str, Any]], item: Dict[str, Any],
+                              index: Optional[ScheduleIndex] = None) -> int:
+    return strict_match(schedule, item, 'sportsonline', index)
+
+def strict_match_streamcenter(schedule: List[Dict[str, Any]], item: Dict[str, Any],
+                              index: Optional[ScheduleIndex] = None) -> int:
+    """
+    Mencocokkan pertandingan dari streamcenter.json dengan ketat berdasarkan nama tim.
+    """
+    return strict_match(schedule, item, 'teams', index)
 
-    return best_match_idx
+def strict_match_soco(schedule: List[Dict[str, Any]], item: Dict[str, Any],
+                      index: Optional[ScheduleIndex] = None) -> int:
+    """
+    Mencocokkan pertandingan dari soco.json dengan ketat berdasarkan nama tim.
+    """
+    return strict_match(schedule, item, 'teams', index)
+
+# Function to score the similarity of two normalized team names (0-100)
+def team_similarity(name1: str, name2: str) -> int:
+    return max(fuzz.token_sort_ratio(name1, name2), fuzz.partial_ratio(name1, name2))
+
+# Function to combine the four team similarities (0-100) into a team score, allowing swapped home/away
+def combine_team_similarities(sim11: float, sim22: float, sim12: float, sim21: float) -> float:
+    team1_score = sim11 / 100.0
+    team2_score = sim22 / 100.0
+    return max((team1_score + team2_score) / 2, (sim12 + sim21) / 200.0)
+
+# Function to score both teams of a pair, allowing swapped home/away
+def team_score(rec: MatchRecord, sch_rec: MatchRecord) -> float:
+    return combine_team_similarities(
+        team_similarity(rec.team1, sch_rec.team1), team_similarity(rec.team2, sch_rec.team2),
+        team_similarity(rec.team1, sch_rec.team2), team_similarity(rec.team2, sch_rec.team1)
+    )
+
+# --- KASKADE SKOR: BATAS ATAS MURAH SEBELUM FUZZY MATCHING ---
+# Jumlah pasangan yang berhenti di setiap tahap kaskade (lihat bounded_team_score)
+CASCADE_STATS: Dict[str, int] = Counter()
+# Penghitung pencocokan lain untuk metrik run: pasangan yang dinilai, panggilan partial_ratio/ratio,
+# pasangan di matriks batch, hit pencocokan ketat (strict_first/strict_fallback) dan alias.
+# Hanya diisi saat METRICS.enabled, agar loop pencocokan tidak membayar instrumentasi tanpa --metrics.
+MATCH_STATS: Dict[str, int] = Counter()
+
+NAME_PROFILE_MEMO_SIZE = 16384  # Batas memo name_profile (nama tim unik per run jauh di bawah ini)
+
+@lru_cache(maxsize=NAME_PROFILE_MEMO_SIZE)
+def name_profile(name: str) -> Tuple[str, Counter, Counter]:
+    """
+    (bentuk token-sort, hitungan karakter nama, hitungan karakter bentuk token-sort) per nama.
+    """
+    form = token_sort_form(name)
+    return form, Counter(name), Counter(form)
 
-# Function for fuzzy matching (sportsonline.json)
-def find_match_sportsonline(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
-    best_match_idx = -1
-    best_score = 0.0
-    norm_team1 = normalize_name(item['team1']['name'])
-    norm_team2 = normalize_name(item['team2']['name'])
-    time = item['kickoff_time']
-    date = item['kickoff_date'] if 'kickoff_date' in item else "1970-01-01"
-
-    for idx, sch in enumerate(schedule):
-        sch_norm_team1 = normalize_name(sch['team1']['name'])
-        sch_norm_team2 = normalize_name(sch['team2']['name'])
-        
-        team1_score = max(fuzz.token_sort_ratio(norm_team1, sch_norm_team1), fuzz.partial_ratio(norm_team1, sch_norm_team1)) / 100.0
-        team2_score = max(fuzz.token_sort_ratio(norm_team2, sch_norm_team2), fuzz.partial_ratio(norm_team2, sch_norm_team2)) / 100.0
-        team_score = max(
-            (team1_score + team2_score) / 2,
-            (max(fuzz.token_sort_ratio(norm_team1, sch_norm_team2), fuzz.partial_ratio(norm_team1, sch_norm_team2)) +
-             max(fuzz.token_sort_ratio(norm_team2, sch_norm_team1), fuzz.partial_ratio(norm_team2, sch_norm_team1))) / 200.0
-        )
-        
-        time_diff = time_difference(time, sch['kickoff_time'], date, sch['kickoff_date'])
-        time_score = 1.0 if time_diff <= 30 else max(0.0, 1.0 - time_diff / 120.0)
-
-        total_score = (0.4 * time_score + 0.6 * team_score)
-        
-        logging.debug(
-            f"Comparing {item['id']} with {sch['id']}: team_score={team_score:.2f}, time_score={time_score:.2f}, "
-            f"total_score={total_score:.2f}"
-        )
-        
-        if total_score >= threshold and total_score > best_score:
-            best_score = total_score
-            best_match_idx = idx
+def _overlap(counts1: Counter, counts2: Counter) -> int:
+    if len(counts1) > len(counts2):
+        counts1, counts2 = counts2, counts1
+    return sum(min(count, counts2[ch]) for ch, count in counts1.items())
 
-    # Fallback to strict matching
-    if best_match_idx == -1:
-        strict_idx = strict_match_sportsonline(schedule, item)
-        if strict_idx != -1:
-            logging.debug(f"Fallback to strict match for {item['id']}")
-            return strict_idx
+def ratio_upper_bound(counts1: Counter, len1: int, counts2: Counter, len2: int) -> int:
+    """
+    Batas atas fuzz.ratio: karakter yang cocok tidak lebih dari irisan multiset karakter.
+    """
+    if not len1 or not len2:
+        return 100 if len1 == len2 else 0
+    return math.ceil(200 * _overlap(counts1, counts2) / (len1 + len2))
 
-    return best_match_idx
+def partial_upper_bound(counts1: Counter, len1: int, counts2: Counter, len2: int) -> int:
+    """
+    Batas atas fuzz.partial_ratio. Jendela di string yang lebih panjang bisa
+    terpotong di ujung, jadi untuk M karakter cocok skor terbaiknya 2M / (pendek + M).
+    """
+    if not len1 or not len2:
+        return 100 if len1 == len2 else 0
+    shorter = min(len1, len2)
+    matched = min(_overlap(counts1, counts2), shorter)
+    return math.ceil(200 * matched / (shorter + matched))
 
-# Function for fuzzy matching (streamcenter.json)
-def find_match_streamcenter(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
+def similarity_upper_bound(name1: str, name2: str) -> int:
     """
-    Mencari pertandingan yang cocok di jadwal untuk data dari streamcenter.json.
-    
-    Args:
-        schedule: Daftar jadwal yang sudah ada
-        item: Item dari streamcenter.json yang akan dicocokkan
-        threshold: Ambang batas kecocokan (0-1)
-        
-    Returns:
-        int: Indeks pertandingan yang cocok di schedule, atau -1 jika tidak ditemukan
+    Batas atas team_similarity (100 persis jika bentuk token-sort sama).
+    """
+    form1, counts1, form_counts1 = name_profile(name1)
+    form2, counts2, form_counts2 = name_profile(name2)
+    if form1 == form2:
+        return 100
+    return max(ratio_upper_bound(form_counts1, len(form1), form_counts2, len(form2)),
+               partial_upper_bound(counts1, len(name1), counts2, len(name2)))
+
+def bounded_team_score(rec: MatchRecord, sch_rec: MatchRecord, total: Callable[[float], float],
+                       cutoff: float) -> Optional[float]:
+    """
+    team_score dengan kaskade murah-dulu. `total` memetakan team_score ke total
+    skor pasangan; jika batas atas total di bawah `cutoff`, pasangan dihentikan
+    (None) sebelum fuzzy matching yang lebih mahal:
+      1. nama sama persis atau bentuk token-sort sama: skor tim 1.0, tanpa fuzzy,
+      2. batas atas dari panjang dan multiset karakter,
+      3. token_sort_ratio, dengan batas atas partial_ratio,
+      4. partial_ratio, hanya untuk pasangan nama yang masih bisa naik.
+    Hasil yang tidak dihentikan sama persis dengan team_score.
     """
-    # Cek pencocokan ketat terlebih dahulu
-    strict_idx = strict_match_streamcenter(schedule, item)
-    if strict_idx != -1:
-        return strict_idx
-    
-    # Jika tidak ada yang cocok secara ketat, lakukan fuzzy matching
-    item_team1 = normalize_name(item['team1']['name'])
-    item_team2 = normalize_name(item['team2']['name'])
+    names = ((rec.team1, sch_rec.team1), (rec.team2, sch_rec.team2),
+             (rec.team1, sch_rec.team2), (rec.team2, sch_rec.team1))
+    forms = [(name_profile(a)[0], name_profile(b)[0]) for a, b in names]
+    if (forms[0][0] == forms[0][1] and forms[1][0] == forms[1][1]) or \
+            (forms[2][0] == forms[2][1] and forms[3][0] == forms[3][1]):
+        CASCADE_STATS['equal'] += 1
+        return 1.0
+
+    if total(combine_team_similarities(*(similarity_upper_bound(a, b) for a, b in names))) < cutoff:
+        CASCADE_STATS['char_bound'] += 1
+        return None
+
+    token_sort = [fuzz.token_sort_ratio(a, b) for a, b in names]
+    partial_bound = [partial_upper_bound(name_profile(a)[1], len(a), name_profile(b)[1], len(b)) for a, b in names]
+    if total(combine_team_similarities(*map(max, token_sort, partial_bound))) < cutoff:
+        CASCADE_STATS['token_sort'] += 1
+        return None
+
+    CASCADE_STATS['partial'] += 1
+    sims = [max(ts, fuzz.partial_ratio(a, b)) if bound > ts else ts
+            for (a, b), ts, bound in zip(names, token_sort, partial_bound)]
+    if METRICS.enabled:
+        MATCH_STATS['partial_calls'] += sum(1 for ts, bound in zip(token_sort, partial_bound) if bound > ts)
+    return combine_team_similarities(*sims)
+
+# Pair scorers, one per source. A return value of 0 means the pair is skipped.
+# Pairs whose best reachable score is below `cutoff` are skipped before the expensive fuzzy calls.
+def score_rere_manual(rec: MatchRecord, item: Dict[str, Any], sch_rec: MatchRecord, sch: Dict[str, Any],
+                      t_score: Optional[float] = None, cutoff: float = 0.0) -> float:
+    league_sim = LEAGUES.similarity(rec.league_id, sch_rec.league_id)
+    if league_sim < LEAGUE_MIN_SCORE:
+        logging.debug(f"Skipping {item['id']} vs {sch['id']} due to low league_score={league_sim / 100.0:.2f}")
+        return 0.0
+    league_score = league_sim / 100.0
+
+    date_score = 1.0 if item['kickoff_date'] == sch['kickoff_date'] else 0.0
+    time_diff = time_difference(rec.kickoff, sch_rec.kickoff)
+    time_score = 1.0 if time_diff <= 30 else max(0.0, 1.0 - time_diff / 120.0)
+
+    def total(t: float) -> float:
+        return (0.3 * league_score + 0.6 * t + 0.05 * date_score + 0.05 * time_score)
+
+    if t_score is None:
+        t_score = bounded_team_score(rec, sch_rec, total, cutoff)
+        if t_score is None:
+            return 0.0
+    total_score = total(t_score)
+
+    logging.debug(
+        f"Comparing {item['id']} with {sch['id']}: league_score={league_score:.2f}, team_score={t_score:.2f}, "
+        f"date_score={date_score:.2f}, time_score={time_score:.2f}, total_score={total_score:.2f}"
+    )
+    return total_score
+
+def score_inplaynet(rec: MatchRecord, item: Dict[str, Any], sch_rec: MatchRecord, sch: Dict[str, Any],
+                    t_score: Optional[float] = None, cutoff: float = 0.0) -> float:
+    league_sim = LEAGUES.similarity(rec.league_id, sch_rec.league_id)
+    if league_sim < LEAGUE_MIN_SCORE:
+        logging.debug(f"Skipping {item['id']} vs {sch['id']} due to low league_score={league_sim / 100.0:.2f}")
+        return 0.0
+    league_score = league_sim / 100.0
+
+    def total(t: float) -> float:
+        return (0.3 * league_score + 0.7 * t)
+
+    if t_score is None:
+        t_score = bounded_team_score(rec, sch_rec, total, cutoff)
+        if t_score is None:
+            return 0.0
+    total_score = total(t_score)
+
+    logging.debug(
+        f"Comparing {item['id']} with {sch['id']}: league_score={league_score:.2f}, team_score={t_score:.2f}, "
+        f"total_score={total_score:.2f}"
+    )
+    return total_score
+
+def score_sportsonline(rec: MatchRecord, item: Dict[str, Any], sch_rec: MatchRecord, sch: Dict[str, Any],
+                       t_score: Optional[float] = None, cutoff: float = 0.0) -> float:
+    time_diff = time_difference(rec.kickoff, sch_rec.kickoff)
+    time_score = 1.0 if time_diff <= 30 else max(0.0, 1.0 - time_diff / 120.0)
+
+    def total(t: float) -> float:
+        return (0.4 * time_score + 0.6 * t)
+
+    if t_score is None:
+        t_score = bounded_team_score(rec, sch_rec, total, cutoff)
+        if t_score is None:
+            return 0.0
+    total_score = total(t_score)
+
+    logging.debug(
+        f"Comparing {item['id']} with {sch['id']}: team_score={t_score:.2f}, time_score={time_score:.2f}, "
+        f"total_score={total_score:.2f}"
+    )
+    return total_score
+
+def score_teams_ratio(rec: MatchRecord, item: Dict[str, Any], sch_rec: MatchRecord, sch: Dict[str, Any],
+                      t_score: Optional[float] = None, cutoff: float = 0.0) -> float:
+    """
+    Skor (0-100) untuk streamcenter.json dan soco.json.
+    `t_score` (0-1) menggantikan skor nama tim, mis. saat tim dikenali lewat alias.
+    """
+    # Skip jika tanggal tidak cocok
     item_date = item.get('kickoff_date', '')
-    item_time = item.get('kickoff_time', '')
-    
-    best_score = 0
-    best_idx = -1
-    
-    for idx, match in enumerate(schedule):
-        # Skip jika tanggal tidak cocok
-        match_date = match.get('kickoff_date', '')
-        if item_date and match_date and item_date != match_date:
-            continue
-            
-        # Hitung skor kecocokan tim
-        match_team1 = normalize_name(match['team1']['name'])
-        match_team2 = normalize_name(match['team2']['name'])
-        
+    match_date = sch.get('kickoff_date', '')
+    if item_date and match_date and item_date != match_date:
+        return 0.0
+
+    if t_score is None:
         # Hitung skor untuk kedua kemungkinan urutan tim
-        score1 = (fuzz.ratio(item_team1, match_team1) + fuzz.ratio(item_team2, match_team2)) / 2
-        score2 = (fuzz.ratio(item_team1, match_team2) + fuzz.ratio(item_team2, match_team1)) / 2
+        score1 = (fuzz.ratio(rec.team1, sch_rec.team1) + fuzz.ratio(rec.team2, sch_rec.team2)) / 2
+        score2 = (fuzz.ratio(rec.team1, sch_rec.team2) + fuzz.ratio(rec.team2, sch_rec.team1)) / 2
         score = max(score1, score2)
-        
-        # Periksa kecocokan waktu jika tersedia
-        if item_time and 'kickoff_time' in match:
-            time_diff = time_difference(item_time, match['kickoff_time'], item_date, match_date)
-            if time_diff <= 180:  # Maksimal selisih 3 jam
-                score = score * 0.7 + 30  # Beri bobot lebih jika waktu cocok
-        
-        if score > best_score and score >= threshold * 100:
-            best_score = score
-            best_idx = idx
-    
-    return best_idx
+        if METRICS.enabled:
+            MATCH_STATS['ratio_calls'] += 4
+    else:
+        score = 100.0 * t_score
+
+    # Periksa kecocokan waktu jika tersedia
+    time_diff = time_difference(rec.kickoff, sch_rec.kickoff)
+    if time_diff <= 180:  # Maksimal selisih 3 jam
+        score = score * 0.7 + 30  # Beri bobot lebih jika waktu cocok
+    return score
 
-def strict_match_streamcenter(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+# Function to get the widest kickoff gap at which a sportsonline pair can still reach the threshold
+def sportsonline_max_minutes(threshold: float) -> Optional[int]:
     """
-    Mencocokkan pertandingan dari streamcenter.json dengan ketat berdasarkan nama tim.
+    total = 0.4 * time_score + 0.6 * team_score dengan team_score <= 1, jadi
+    time_score minimal (threshold - 0.6) / 0.4, dan time_score = 1 - selisih / 120
+    di atas 30 menit. None jika tidak ada batas (threshold <= 0.6).
     """
-    item_team1 = normalize_name(item['team1']['name'])
-    item_team2 = normalize_name(item['team2']['name'])
-    
-    for idx, match in enumerate(schedule):
-        match_team1 = normalize_name(match['team1']['name'])
-        match_team2 = normalize_name(match['team2']['name'])
-        
-        # Cek kedua kemungkinan urutan tim
-        if (item_team1 == match_team1 and item_team2 == match_team2) or \
-           (item_team1 == match_team2 and item_team2 == match_team1):
-            return idx
-    
-    return -1
-
-# soco.json
-# Function for fuzzy matching (soco.json)
-def find_match_soco(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8) -> int:
+    min_time_score = (threshold - 0.6) / 0.4
+    if min_time_score <= 0:
+        return None
+    # Tambah 1 menit agar pembulatan float tidak membuang pasangan di batas jendela
+    return max(30, math.ceil(120 * (1.0 - min_time_score))) + 1
+
+class MatchSpec(NamedTuple):
+    scorer: Callable[..., float]  # (rec, item, sch_rec, sch, t_score=None, cutoff=0.0) -> skor
+    strict: str          # key di STRICT_KEYS
+    strict_first: bool   # strict dicek sebelum fuzzy (streamcenter/soco) atau sebagai fallback
+    scale: float         # skala skor relatif terhadap threshold (0-1 atau 0-100)
+    default_date: str    # tanggal pengganti jika item tidak punya kickoff_date
+    max_minutes: Optional[Callable[[float], Optional[int]]] = None  # threshold -> jendela kickoff (menit)
+    league_min: Optional[int] = None  # gerbang liga (token_sort_ratio minimum), kandidat dipartisi per ID liga
+
+MATCH_SPECS: Dict[str, MatchSpec] = {
+    'rere_manual': MatchSpec(score_rere_manual, 'rere_manual', False, 1.0, '', league_min=LEAGUE_MIN_SCORE),
+    'inplaynet': MatchSpec(score_inplaynet, 'inplaynet', False, 1.0, '', league_min=LEAGUE_MIN_SCORE),
+    'sportsonline': MatchSpec(score_sportsonline, 'sportsonline', False, 1.0, '1970-01-01', sportsonline_max_minutes),
+    'streamcenter': MatchSpec(score_teams_ratio, 'teams', True, 100.0, ''),
+    'soco': MatchSpec(score_teams_ratio, 'teams', True, 100.0, ''),
+}
+
+# Function to find the best-scoring candidate, continuing from a previous best
+def best_candidate(schedule: List[Dict[str, Any]], item: Dict[str, Any], rec: MatchRecord,
+                   records: List[MatchRecord], candidates: Iterable[int], scorer, threshold: float,
+                   best_score: float = 0.0, best_idx: int = -1,
+                   t_score: Optional[float] = None) -> Tuple[float, int]:
+    pairs = 0
+    for idx in candidates:
+        # Hanya skor >= threshold yang lebih tinggi dari best_score yang bisa menggantikannya
+        cutoff = max(threshold, math.nextafter(best_score, math.inf))
+        score = scorer(rec, item, records[idx], schedule[idx], t_score, cutoff)
+        pairs += 1
+        if score >= threshold and score > best_score:
+            best_score = score
+            best_idx = idx
+    if METRICS.enabled:
+        MATCH_STATS['pairs'] += pairs
+    return best_score, best_idx
+
+# Function for matching one source item against the schedule
+def find_match(kind: str, schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8,
+               index: Optional[ScheduleIndex] = None, start: int = 0,
+               best: Tuple[float, int] = (0.0, -1)) -> int:
     """
-    Mencari pertandingan yang cocok di jadwal untuk data dari soco.json.
-    
+    Mencari pertandingan yang cocok di jadwal untuk item dari sumber `kind`.
+
     Args:
+        kind: Key di MATCH_SPECS
         schedule: Daftar jadwal yang sudah ada
-        item: Item dari soco.json yang akan dicocokkan
+        item: Item dari file sumber yang akan dicocokkan
         threshold: Ambang batas kecocokan (0-1)
-        
+        index: ScheduleIndex dari schedule; None berarti scan penuh
+        start: Hanya entri fuzzy dengan indeks >= start yang dinilai
+        best: Hasil terbaik (skor, indeks) dari entri sebelum `start`, mis. dari mode batch
+
+    Jika kedua tim dikenali lewat alias (index.aliases), hanya entri dengan pasangan
+    tim kanonik yang sama yang dinilai, dengan skor tim 1.0 dan tanpa fuzzy matching.
+    Nama yang ada persis di schedule dipakai apa adanya, dan hasil pencocokan ketat
+    selalu menang atas hasil alias.
+
     Returns:
         int: Indeks pertandingan yang cocok di schedule, atau -1 jika tidak ditemukan
     """
-    # Cek pencocokan ketat terlebih dahulu
-    strict_idx = strict_match_soco(schedule, item)
-    if strict_idx != -1:
-        return strict_idx
-    
-    # Jika tidak ada yang cocok secara ketat, lakukan fuzzy matching
-    item_team1 = normalize_name(item['team1']['name'])
-    item_team2 = normalize_name(item['team2']['name'])
-    item_date = item.get('kickoff_date', '')
-    item_time = item.get('kickoff_time', '')
-    
-    best_score = 0
-    best_idx = -1
-    
-    for idx, match in enumerate(schedule):
-        # Skip jika tanggal tidak cocok
-        match_date = match.get('kickoff_date', '')
-        if item_date and match_date and item_date != match_date:
-            continue
-            
-        # Hitung skor kecocokan tim
-        match_team1 = normalize_name(match['team1']['name'])
-        match_team2 = normalize_name(match['team2']['name'])
-        
-        # Hitung skor untuk kedua kemungkinan urutan tim
-        score1 = (fuzz.ratio(item_team1, match_team1) + fuzz.ratio(item_team2, match_team2)) / 2
-        score2 = (fuzz.ratio(item_team1, match_team2) + fuzz.ratio(item_team2, match_team1)) / 2
-        score = max(score1, score2)
-        
-        # Periksa kecocokan waktu jika tersedia
-        if item_time and 'kickoff_time' in match:
-            time_diff = time_difference(item_time, match['kickoff_time'], item_date, match_date)
-            if time_diff <= 180:  # Maksimal selisih 3 jam
-                score = score * 0.7 + 30  # Beri bobot lebih jika waktu cocok
-        
-        if score > best_score and score >= threshold * 100:
-            best_score = score
-            best_idx = idx
-    
-    return best_idx
-
-def strict_match_soco(schedule: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
-    """
-    Mencocokkan pertandingan dari soco.json dengan ketat berdasarkan nama tim.
-    """
-    item_team1 = normalize_name(item['team1']['name'])
-    item_team2 = normalize_name(item['team2']['name'])
-    
-    for idx, match in enumerate(schedule):
-        match_team1 = normalize_name(match['team1']['name'])
-        match_team2 = normalize_name(match['team2']['name'])
-        
-        # Cek kedua kemungkinan urutan tim
-        if (item_team1 == match_team1 and item_team2 == match_team2) or \
-           (item_team1 == match_team2 and item_team2 == match_team1):
-            return idx
-    
-    return -1
-
+    spec = MATCH_SPECS[kind]
+    if spec.strict_first:
+        # Cek pencocokan ketat terlebih dahulu
+        strict_idx = strict_match(schedule, item, spec.strict, index)
+        if strict_idx != -1:
+            if METRICS.enabled:
+                MATCH_STATS['strict_first'] += 1
+            return strict_idx
 
-# --- BAGIAN UTAMA SCRIPT ---
+    rec = make_record(item, spec.default_date)
+    records = schedule_records(schedule, index)
+    alias_candidates = index.alias_candidates(kind, rec) if index is not None else None
+    if alias_candidates:
+        _, alias_idx = best_candidate(schedule, item, rec, records, alias_candidates,
+                                      spec.scorer, threshold * spec.scale, t_score=1.0)
+        if alias_idx != -1 and not spec.strict_first:
+            # Alias tidak boleh mengalahkan pencocokan ketat (strict_first sudah dicek di atas)
+            strict_idx = index.strict_lookup(spec.strict, item)
+            if strict_idx != -1 and strict_idx != alias_idx:
+                logging.debug(f"Strict match {schedule[strict_idx]['id']} overrides alias match for {item['id']}")
+                return strict_idx
+        if alias_idx != -1:
+            index.aliases.hits += 1
+            if METRICS.enabled:
+                MATCH_STATS['alias_hits'] += 1
+            logging.debug(f"Alias match found for {item['id']} with {schedule[alias_idx]['id']}")
+            return alias_idx
+
+    max_minutes = spec.max_minutes(threshold) if spec.max_minutes else None
+    best_score, best_idx = best_candidate(schedule, item, rec, records,
+                                          candidate_indices(schedule, rec, index, start, max_minutes, spec.league_min),
+                                          spec.scorer, threshold * spec.scale, *best)
+    if best_idx != -1 and index is not None and index.aliases is not None \
+            and best_score >= ALIAS_MIN_SCORE * spec.scale:
+        index.aliases.learn(kind, rec, records[best_idx])
 
-# Load translation dict
-trans_file = 'translate/en.json'
-trans_dict = {}
-if os.path.exists(trans_file):
-    with open(trans_file, 'r', encoding='utf-8') as f:
-        trans_dict = json.load(f)
-    logging.info(f"Loaded translation dictionary with {len(trans_dict)} entries")
-else:
-    logging.warning("Translation file 'translate/en.json' not found")
+    # Fallback to strict matching
+    if best_idx == -1 and not spec.strict_first:
+        strict_idx = strict_match(schedule, item, spec.strict, index)
+        if strict_idx != -1:
+            if METRICS.enabled:
+                MATCH_STATS['strict_fallback'] += 1
+            logging.debug(f"Fallback to strict match for {item['id']}")
+            return strict_idx
 
-# Load all JSON files
-try:
-    with open('event.json', 'r', encoding='utf-8') as f:
-        event_data = json.load(f)
-    event_data = translate_data(event_data, trans_dict)
-    logging.info(f"Loaded {len(event_data)} entries from event.json")
-except FileNotFoundError:
-    logging.error("File 'event.json' not found")
-    event_data = []
+    return best_idx
 
-try:
-    with open('rere.json', 'r', encoding='utf-8') as f:
-        rere_data = json.load(f)
-    rere_data = translate_data(rere_data, trans_dict)
-    logging.info(f"Loaded {len(rere_data)} entries from rere.json")
-except FileNotFoundError:
-    logging.warning("File 'rere.json' not found")
-    rere_data = []
+# Function for fuzzy matching (rere.json and manual.json)
+def find_match_rere_manual(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8,
+                           index: Optional[ScheduleIndex] = None) -> int:
+    return find_match('rere_manual', schedule, item, threshold, index)
 
-try:
-    with open('inplaynet.json', 'r', encoding='utf-8') as f:
-        inplaynet_data = json.load(f)
-    inplaynet_data = translate_data(inplaynet_data, trans_dict)
-    logging.info(f"Loaded {len(inplaynet_data)} entries from inplaynet.json")
-except FileNotFoundError:
-    logging.warning("File 'inplaynet.json' not found")
-    inplaynet_data = []
+# Function for fuzzy matching (inplaynet.json)
+def find_match_inplaynet(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8,
+                         index: Optional[ScheduleIndex] = None) -> int:
+    return find_match('inplaynet', schedule, item, threshold, index)
 
-try:
-    with open('sportsonline.json', 'r', encoding='utf-8') as f:
-        sportsonline_data = json.load(f)
-    sportsonline_data = translate_data(sportsonline_data, trans_dict)
-    logging.info(f"Loaded {len(sportsonline_data)} entries from sportsonline.json")
-except FileNotFoundError:
-    logging.warning("File 'sportsonline.json' not found")
-    sportsonline_data = []
+# Function for fuzzy matching (sportsonline.json)
+def find_match_sportsonline(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8,
+                            index: Optional[ScheduleIndex] = None) -> int:
+    return find_match('sportsonline', schedule, item, threshold, index)
 
-try:
-    with open('manual.json', 'r', encoding='utf-8') as f:
-        manual_data = json.load(f)
-    manual_data = translate_data(manual_data, trans_dict)
-    logging.info(f"Loaded {len(manual_data)} entries from manual.json")
-except FileNotFoundError:
-    logging.error("File 'manual.json' not found")
-    manual_data = []
+# Function for fuzzy matching (streamcenter.json)
+def find_match_streamcenter(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8,
+                            index: Optional[ScheduleIndex] = None) -> int:
+    return find_match('streamcenter', schedule, item, threshold, index)
 
-try:
-    with open('streamcenter.json', 'r', encoding='utf-8') as f:
-        streamcenter_data = json.load(f)
-    streamcenter_data = translate_data(streamcenter_data, trans_dict)
-    logging.info(f"Loaded {len(streamcenter_data)} entries from streamcenter.json")
-except FileNotFoundError:
-    logging.warning("File 'streamcenter.json' not found")
-    streamcenter_data = []
+# Function for fuzzy matching (soco.json)
+def find_match_soco(schedule: List[Dict[str, Any]], item: Dict[str, Any], threshold: float = 0.8,
+                    index: Optional[ScheduleIndex] = None) -> int:
+    return find_match('soco', schedule, item, threshold, index)
 
-try:
-    with open('soco.json', 'r', encoding='utf-8') as f:
-        soco_data = json.load(f)
-    soco_data = translate_data(soco_data, trans_dict)
-    logging.info(f"Loaded {len(soco_data)} entries from soco.json")
-except FileNotFoundError:
-    logging.warning("File 'soco.json' not found")
-    streamcenter_data = []
-
-# Initialize schedule with event.json
-schedule: List[Dict[str, Any]] = event_data.copy()
-logging.info(f"Initialized schedule with {len(schedule)} entries from event.json")
-
-# Process rere.json
-for item in rere_data:
-    match_idx = find_match_rere_manual(schedule, item, threshold=0.8)
+# Function to apply the match result of one source item to the schedule
+def apply_match(index: ScheduleIndex, item: Dict[str, Any], match_idx: int, source_file: str,
+                append_unmatched: bool) -> None:
     if match_idx != -1:
-        schedule[match_idx]['servers'] = remove_duplicate_servers(schedule[match_idx].get('servers', []), item.get('servers', []))
-        logging.info(f"Merged servers for {item['id']} from rere.json")
+        index.merge_servers(match_idx, item.get('servers', []))
+        logging.info(f"Merged servers for {item['id']} from {source_file}")
+    elif append_unmatched:
+        index.append(item)
+        logging.info(f"Added new entry {item['id']} from {source_file}")
     else:
-        schedule.append(item)
-        logging.info(f"Added new entry {item['id']} from rere.json")
+        logging.info(f"Skipped {item['id']} from {source_file} (no match)")
 
-# Process inplaynet.json
-for item in inplaynet_data:
-    match_idx = find_match_inplaynet(schedule, item, threshold=0.8)
-    if match_idx != -1:
-        schedule[match_idx]['servers'] = remove_duplicate_servers(schedule[match_idx].get('servers', []), item.get('servers', []))
-        logging.info(f"Merged servers for {item['id']} from inplaynet.json")
-    else:
-        schedule.append(item)
-        logging.info(f"Added new entry {item['id']} from inplaynet.json")
+def is_forced_item(item: Dict[str, Any], force_add_prefix: Optional[str]) -> bool:
+    return bool(force_add_prefix) and item['id'].startswith(force_add_prefix)
 
-# Process sportsonline.json
-for item in sportsonline_data:
-    match_idx = find_match_sportsonline(schedule, item, threshold=0.8)
-    if match_idx != -1:
-        schedule[match_idx]['servers'] = remove_duplicate_servers(schedule[match_idx].get('servers', []), item.get('servers', []))
-        logging.info(f"Merged servers for {item['id']} from sportsonline.json")
+# Function to merge one source into the schedule, returning the match index of every matched item
+def merge_source(index: ScheduleIndex, source_file: str, kind: str, items: List[Dict[str, Any]],
+                 append_unmatched: bool, threshold: float = 0.8, batch: bool = False,
+                 force_add_prefix: Optional[str] = None, workers: int = 1,
+                 assignments: Optional[List[int]] = None,
+                 precomputed: Optional[Tuple[int, List[Tuple[float, int]]]] = None) -> List[int]:
+    """
+    Menggabungkan item dari satu sumber ke schedule. Jika `assignments` dari run
+    sebelumnya diberikan, hasil pencocokan tersebut dipakai ulang tanpa fuzzy matching.
+    Item dengan id berawalan `force_add_prefix` selalu ditambahkan (manual.json).
+    `precomputed` diteruskan ke iter_matches untuk item yang tidak dipaksa.
+    """
+    to_match = [item for item in items if not is_forced_item(item, force_add_prefix)]
+    if assignments is None:
+        matches = (match_idx for _, match_idx in iter_matches(kind, index, to_match, threshold, batch, workers,
+                                                               precomputed))
     else:
-        logging.info(f"Skipped {item['id']} from sportsonline.json (no match)")
+        matches = iter(assignments)
+        if index.aliases is not None:
+            # Alias yang dipakai ulang tetap dianggap terlihat agar tidak dibuang
+            for item in to_match:
+                rec = make_record(item, MATCH_SPECS[kind].default_date)
+                index.aliases.touch(kind, rec.team1)
+                index.aliases.touch(kind, rec.team2)
+
+    result = []
+    for item in items:
+        if is_forced_item(item, force_add_prefix):
+            index.append(item)
+            logging.info(f"Force added new entry {item['id']} from {source_file}")
+            continue
+        match_idx = next(matches)
+        apply_match(index, item, match_idx, source_file, append_unmatched)
+        result.append(match_idx)
+    return result
 
-# Process streamcenter.json
-for item in streamcenter_data:
-    match_idx = find_match_streamcenter(schedule, item, threshold=0.8)
-    if match_idx != -1:
-        schedule[match_idx]['servers'] = remove_duplicate_servers(schedule[match_idx].get('servers', []), item.get('servers', []))
-        logging.info(f"Merged servers for {item['id']} from streamcenter.json")
-    else:
-        logging.info(f"Skipped {item['id']} from streamcenter.json (no match)")
+# --- STATE UNTUK MODE INKREMENTAL ---
+MERGE_STATE_FILE = os.path.join('cache', 'merge_state.json')
+MERGE_STATE_VERSION = 5  # Naikkan jika logika pencocokan berubah agar state lama tidak dipakai
 
-# Process soco.json
-for item in soco_data:
-    match_idx = find_match_soco(schedule, item, threshold=0.8)
-    if match_idx != -1:
-        schedule[match_idx]['servers'] = remove_duplicate_servers(schedule[match_idx].get('servers', []), item.get('servers', []))
-        logging.info(f"Merged servers for {item['id']} from soco.json")
-    else:
-        logging.info(f"Skipped {item['id']} from soco.json (no match)")
-
-# Process manual.json
-for item in manual_data:
-    if item['id'].startswith('tes'):
-        schedule.append(item)
-        logging.info(f"Force added new entry {item['id']} from manual.json")
-        continue
-    match_idx = find_match_rere_manual(schedule, item, threshold=0.8)
-    if match_idx != -1:
-        schedule[match_idx]['servers'] = remove_duplicate_servers(schedule[match_idx].get('servers', []), item.get('servers', []))
-        logging.info(f"Merged servers for {item['id']} from manual.json")
-    else:
-        schedule.append(item)
-        logging.info(f"Added new entry {item['id']} from manual.json")
+# Function to hash JSON-serializable data (source items, translations)
+def data_hash(data: Any) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
 
-# Adjust match_time to be 10 minutes earlier than kickoff_time
-for item in schedule:
-    item['match_date'], item['match_time'] = subtract_ten_minutes(item['kickoff_date'], item['kickoff_time'])
-
-# Ensure output directory exists
-output_dir = 'sch'
-os.makedirs(output_dir, exist_ok=True)
+def load_merge_state(path: str = MERGE_STATE_FILE) -> Dict[str, Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logging.info(f"Merge state tidak dipakai ({path}): {e}")
+        return {}
+
+def save_merge_state(state: Dict[str, Any], path: str = MERGE_STATE_FILE) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        logging.info(f"Berhasil menyimpan merge state ke {path}")
+    except OSError as e:
+        logging.error(f"Gagal menyimpan merge state: {str(e)}")
+
+# Function to find reusable assignments of a source from the previous run
+def reusable_assignments(prev_state: Dict[str, Any], config: Dict[str, Any], stage: Dict[str, Any],
+                         expected_len: int) -> Optional[List[int]]:
+    """
+    Hasil pencocokan lama hanya dipakai jika konfigurasi, isi file sumber, dan
+    field pencocokan schedule saat sumber diproses semuanya sama persis,
+    sehingga hasilnya identik dengan merge penuh.
+    """
+    if prev_state.get('config') != config:
+        return None
+    for prev in prev_state.get('stages', []):
+        if prev.get('source') != stage['source']:
+            continue
+        if (prev.get('hash') == stage['hash'] and prev.get('schedule_key') == stage['schedule_key']
+                and len(prev.get('assignments', [])) == expected_len):
+            return prev['assignments']
+        return None
+    return None
+
+# --- MODE BATCH: MATRIKS KEMIRIPAN SEKALIGUS UNTUK SATU SUMBER ---
+BATCH_CHUNK_ROWS = 512  # Batasi ukuran matriks (baris x schedule) per langkah
+
+def _similarity_matrix(rows: List[str], cols: List[str], scorer) -> 'np.ndarray':
+    # Dibulatkan seperti fuzzywuzzy (utils.intr) agar skor setara per pasangan
+    return np.rint(rf_process.cdist(rows, cols, scorer=scorer, processor=None, dtype=np.float64, workers=-1))
+
+def _team_matrix(item_recs: List[MatchRecord], sch_recs: List[MatchRecord]) -> 'np.ndarray':
+    n, m = len(item_recs), len(sch_recs)
+    rows = [r.team1 for r in item_recs] + [r.team2 for r in item_recs]
+    cols = [r.team1 for r in sch_recs] + [r.team2 for r in sch_recs]
+    sim = np.maximum(
+        _similarity_matrix([token_sort_form(x) for x in rows], [token_sort_form(x) for x in cols], rf_fuzz.ratio),
+        _similarity_matrix(rows, cols, rf_fuzz.partial_ratio)
+    )
+    s11, s12 = sim[:n, :m], sim[:n, m:]
+    s21, s22 = sim[n:, :m], sim[n:, m:]
+    return np.maximum((s11 / 100.0 + s22 / 100.0) / 2, (s12 + s21) / 200.0)
+
+def _league_matrix(item_recs: List[MatchRecord], sch_recs: List[MatchRecord]) -> 'np.ndarray':
+    return LEAGUES.matrix([r.league_id for r in item_recs], [r.league_id for r in sch_recs]) / 100.0
+
+def _time_diff_matrix(item_recs: List[MatchRecord], sch_recs: List[MatchRecord]) -> 'np.ndarray':
+    a = np.array([np.nan if r.kickoff is None else r.kickoff for r in item_recs], dtype=np.float64)
+    b = np.array([np.nan if r.kickoff is None else r.kickoff for r in sch_recs], dtype=np.float64)
+    diff = np.abs(a[:, None] - b[None, :])
+    return np.where(np.isnan(diff), np.inf, diff)
+
+def _time_score_matrix(time_diff: 'np.ndarray') -> 'np.ndarray':
+    with np.errstate(invalid='ignore'):
+        return np.where(time_diff <= 30, 1.0, np.maximum(0.0, 1.0 - time_diff / 120.0))
+
+def _date_equal_matrix(items: List[Dict[str, Any]], schedule: List[Dict[str, Any]], key_default=None) -> 'np.ndarray':
+    a = np.array([item.get('kickoff_date', key_default) for item in items], dtype=object)
+    b = np.array([sch.get('kickoff_date', key_default) for sch in schedule], dtype=object)
+    return a[:, None] == b[None, :]
+
+def batch_scores_rere_manual(item_recs, items, sch_recs, schedule) -> 'np.ndarray':
+    league = _league_matrix(item_recs, sch_recs)
+    date_score = _date_equal_matrix(items, schedule).astype(np.float64)
+    time_score = _time_score_matrix(_time_diff_matrix(item_recs, sch_recs))
+    total = (0.3 * league + 0.6 * _team_matrix(item_recs, sch_recs) + 0.05 * date_score + 0.05 * time_score)
+    return np.where(league < 0.9, 0.0, total)
+
+def batch_scores_inplaynet(item_recs, items, sch_recs, schedule) -> 'np.ndarray':
+    league = _league_matrix(item_recs, sch_recs)
+    total = (0.3 * league + 0.7 * _team_matrix(item_recs, sch_recs))
+    return np.where(league < 0.9, 0.0, total)
+
+def batch_scores_sportsonline(item_recs, items, sch_recs, schedule) -> 'np.ndarray':
+    time_score = _time_score_matrix(_time_diff_matrix(item_recs, sch_recs))
+    return (0.4 * time_score + 0.6 * _team_matrix(item_recs, sch_recs))
+
+def batch_scores_teams_ratio(item_recs, items, sch_recs, schedule) -> 'np.ndarray':
+    n, m = len(item_recs), len(sch_recs)
+    rows = [r.team1 for r in item_recs] + [r.team2 for r in item_recs]
+    cols = [r.team1 for r in sch_recs] + [r.team2 for r in sch_recs]
+    sim = _similarity_matrix(rows, cols, rf_fuzz.ratio)
+    score = np.maximum((sim[:n, :m] + sim[n:, m:]) / 2, (sim[:n, m:] + sim[n:, :m]) / 2)
+    score = np.where(_time_diff_matrix(item_recs, sch_recs) <= 180, score * 0.7 + 30, score)
+    # Skip jika tanggal tidak cocok (tanggal kosong dianggap cocok)
+    item_dates = np.array([item.get('kickoff_date', '') for item in items], dtype=object)
+    sch_dates = np.array([sch.get('kickoff_date', '') for sch in schedule], dtype=object)
+    date_conflict = ((item_dates[:, None] != '') & (sch_dates[None, :] != '') &
+                     (item_dates[:, None] != sch_dates[None, :]))
+    return np.where(date_conflict, 0.0, score)
+
+BATCH_SCORERS = {
+    'rere_manual': batch_scores_rere_manual,
+    'inplaynet': batch_scores_inplaynet,
+    'sportsonline': batch_scores_sportsonline,
+    'streamcenter': batch_scores_teams_ratio,
+    'soco': batch_scores_teams_ratio,
+}
+
+# Function to score a whole source against the schedule in one vectorized pass
+def batch_best_candidates(kind: str, index: ScheduleIndex, items: List[Dict[str, Any]],
+                          threshold: float = 0.8) -> List[Tuple[float, int]]:
+    """
+    Menghitung (skor, indeks) terbaik setiap item terhadap seluruh schedule
+    saat ini dengan matriks kemiripan rapidfuzz (cdist), bukan per pasangan.
+    Bobot dan ambang batas sama dengan scorer per pasangan di MATCH_SPECS.
+
+    partial_ratio rapidfuzz mencari penjajaran optimal sehingga skornya bisa
+    lebih tinggi dari fuzzywuzzy. Matriks karenanya dipakai sebagai batas atas:
+    kandidat di atas ambang batas dinilai ulang dengan scorer per pasangan dari
+    skor matriks tertinggi, sampai batas atasnya di bawah skor terbaik.
+    """
+    spec = MATCH_SPECS[kind]
+    schedule = index.schedule[:len(index.records)]
+    results: List[Tuple[float, int]] = []
+    if not schedule:
+        return [(0.0, -1)] * len(items)
+    min_score = threshold * spec.scale
+    matrix_pairs = pairs = 0
+    for start in range(0, len(items), BATCH_CHUNK_ROWS):
+        chunk = items[start:start + BATCH_CHUNK_ROWS]
+        chunk_recs = [make_record(item, spec.default_date) for item in chunk]
+        bounds = BATCH_SCORERS[kind](chunk_recs, chunk, index.records, schedule)
+        matrix_pairs += bounds.size
+        for item, rec, row in zip(chunk, chunk_recs, bounds):
+            cols = np.flatnonzero(row >= min_score)
+            best_score, best_idx = 0.0, -1
+            # Batas atas menurun, lalu indeks menaik (scan memilih indeks terkecil saat seri)
+            for col in cols[np.lexsort((cols, -row[cols]))].tolist():
+                if row[col] < best_score:
+                    break
+                # Seri dengan indeks lebih kecil tetap menang, jadi cutoff tidak melewati best_score
+                score = spec.scorer(rec, item, index.records[col], schedule[col], None, max(min_score, best_score))
+                pairs += 1
+                if score >= min_score and (score > best_score or (score == best_score and col < best_idx)):
+                    best_score, best_idx = score, col
+            results.append((best_score, best_idx))
+    if METRICS.enabled:
+        MATCH_STATS['matrix_pairs'] += matrix_pairs
+        MATCH_STATS['pairs'] += pairs
+    return results
+
+# --- MODE PARALEL: SKOR TERHADAP SNAPSHOT DI BEBERAPA PROSES ---
+PARALLEL_MIN_PAIRS = 200_000  # Di bawah jumlah pasangan (item x schedule) ini, mode serial lebih cepat
+PARALLEL_CHUNKS_PER_WORKER = 4
+
+_worker_state: Optional[Tuple[ScheduleIndex, float]] = None
+
+def _parallel_worker_init(snapshot: List[Dict[str, Any]], threshold: float, metrics: bool = False) -> None:
+    global _worker_state
+    # Log debug per pasangan dari banyak proses hanya akan tercampur di merge.log
+    logging.getLogger().setLevel(logging.WARNING)
+    # Proses worker tidak mewarisi METRICS jika dibuat dengan spawn
+    METRICS.enabled = metrics
+    _worker_state = (ScheduleIndex(snapshot), threshold)
+
+def _parallel_score_chunk(kind: str, items: List[Dict[str, Any]]) -> Tuple[List[Tuple[float, int]], Counter, Counter]:
+    """
+    Skor terbaik per item, beserta penghitung kaskade dan pencocokan potongan ini
+    agar statistik proses utama tetap lengkap.
+    """
+    index, threshold = _worker_state
+    CASCADE_STATS.clear()
+    MATCH_STATS.clear()
+    spec = MATCH_SPECS[kind]
+    max_minutes = spec.max_minutes(threshold) if spec.max_minutes else None
+    results = []
+    for item in items:
+        rec = make_record(item, spec.default_date)
+        candidates = candidate_indices(index.schedule, rec, index, 0, max_minutes, spec.league_min)
+        results.append(best_candidate(index.schedule, item, rec, index.records, candidates,
+                                      spec.scorer, threshold * spec.scale))
+    return results, Counter(CASCADE_STATS), Counter(MATCH_STATS)
+
+# Function to score several sources against the schedule snapshot in worker processes
+def concurrent_best_candidates(index: ScheduleIndex, sources: List[Tuple[str, List[Dict[str, Any]]]],
+                               threshold: float = 0.8,
+                               workers: int = 2) -> Optional[List[List[Tuple[float, int]]]]:
+    """
+    Menghitung (skor, indeks) fuzzy terbaik setiap item dari setiap sumber
+    (kind, items) terhadap snapshot schedule saat ini. Item dibagi per potongan
+    ke satu ProcessPoolExecutor. Hasilnya sama dengan best_candidate per item,
+    sehingga dapat dipakai sebagai `best` di find_match seperti mode batch.
+    None jika pool gagal (pemanggil kembali ke serial).
+    """
+    snapshot = index.schedule[:len(index.records)]
+    total_items = sum(len(items) for _, items in sources)
+    chunk_size = max(1, math.ceil(total_items / (workers * PARALLEL_CHUNKS_PER_WORKER)))
+    logging.info(f"Menilai {total_items} item dari {len(sources)} sumber terhadap {len(snapshot)} entri "
+                 f"dengan {workers} proses")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_parallel_worker_init,
+                                 initargs=(snapshot, threshold, METRICS.enabled)) as executor:
+            futures = [[executor.submit(_parallel_score_chunk, kind, items[start:start + chunk_size])
+                        for start in range(0, len(items), chunk_size)]
+                       for kind, items in sources]
+            results = []
+            for source_futures in futures:
+                bests = []
+                for future in source_futures:
+                    chunk_bests, cascade, match_stats = future.result()
+                    bests.extend(chunk_bests)
+                    CASCADE_STATS.update(cascade)
+                    MATCH_STATS.update(match_stats)
+                results.append(bests)
+            return results
+    except (OSError, BrokenProcessPool) as e:
+        logging.warning(f"Mode paralel gagal, kembali ke serial: {str(e)}")
+        return None
+
+def parallel_best_candidates(kind: str, index: ScheduleIndex, items: List[Dict[str, Any]],
+                             threshold: float = 0.8, workers: int = 2) -> Optional[List[Tuple[float, int]]]:
+    results = concurrent_best_candidates(index, [(kind, items)], threshold, workers)
+    return results[0] if results is not None else None
+
+# Function to iterate the match result of every item of one source, in order
+def iter_matches(kind: str, index: ScheduleIndex, items: List[Dict[str, Any]],
+                 threshold: float = 0.8, batch: bool = False, workers: int = 1,
+                 precomputed: Optional[Tuple[int, List[Tuple[float, int]]]] = None):
+    """
+    Menghasilkan (item, match_idx) berurutan. Pemanggil boleh menambahkan entri
+    lewat index.append() di antara item; entri tersebut tetap dinilai untuk item
+    berikutnya seperti pada loop per item.
+
+    Dengan `batch` atau `workers` > 1, skor terhadap snapshot schedule dihitung
+    lebih dulu (matriks atau proses paralel); alias, pencocokan ketat, dan entri
+    yang ditambahkan setelah snapshot tetap diproses berurutan di proses utama.
+    `precomputed` (panjang snapshot, skor terbaik per item) memakai skor yang
+    sudah dihitung sebelumnya, mis. dari mode konkuren di merge_schedule.
+    """
+    if batch and np is None:
+        logging.warning("rapidfuzz/numpy tidak tersedia, mode batch dinonaktifkan")
+        batch = False
+    snapshot_len = len(index.records)
+    if precomputed is not None:
+        snapshot_len, precomputed = precomputed
+    elif batch:
+        precomputed = batch_best_candidates(kind, index, items, threshold)
+    elif workers > 1 and len(items) * snapshot_len >= PARALLEL_MIN_PAIRS:
+        precomputed = parallel_best_candidates(kind, index, items, threshold, workers)
+    if precomputed is None:
+        for item in items:
+            yield item, find_match(kind, index.schedule, item, threshold, index)
+        return
+
+    for item, best in zip(items, precomputed):
+        # Entri yang ditambahkan setelah snapshot dinilai per pasangan
+        yield item, find_match(kind, index.schedule, item, threshold, index, start=snapshot_len, best=best)
+
+
+# --- METRIK RUN (OPSIONAL) ---
+METRICS_ENV = 'SCH_METRICS'              # SCH_METRICS=1 sama dengan --metrics
+METRICS_FILE_NAME = 'metrics.json'       # Ditulis di samping sch/schedule.json
+
+class RunMetrics:
+    """
+    Waktu per fase dan penghitung pencocokan per sumber untuk satu run sch.py.
+    Saat tidak aktif, phase() mengembalikan nullcontext, MATCH_STATS tidak
+    diisi dan tidak ada yang dicatat; CASCADE_STATS tetap berjalan seperti biasa.
+    """
 
-# --- MENYIMPAN FILE schedule.json (OUTPUT ASLI) ---
-output_path = os.path.join(output_dir, 'schedule.json')
-try:
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(schedule, f, indent=2, ensure_ascii=False)
-    logging.info(f"Berhasil menyimpan output asli ke {output_path}")
-except Exception as e:
-    logging.error(f"Gagal menyimpan schedule.json: {str(e)}")
+    def __init__(self, enabled: bool = False):
+        self.reset(enabled)
+
+    def reset(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.phases: Dict[str, float] = {}
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self.logos: Dict[str, Any] = {}
+
+    def phase(self, name: str):
+        return self._timed(name) if self.enabled else nullcontext()
+
+    @contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(self.phases.get(name, 0.0) + time.perf_counter() - start, 6)
+
+    @staticmethod
+    def counters() -> Counter:
+        return Counter(CASCADE_STATS) + Counter({f'match_{key}': value for key, value in MATCH_STATS.items()})
+
+    def record_source(self, name: str, before: Counter, **fields: Any) -> None:
+        """
+        Penghitung sejak `before` (hasil counters()) untuk satu tahap pencocokan.
+        fuzz_calls menjumlahkan token_sort_ratio (4 per pasangan yang lolos batas
+        karakter), partial_ratio yang benar-benar dipanggil, dan ratio streamcenter/soco.
+        """
+        if not self.enabled:
+            return
+        delta = self.counters() - before
+        cascade = {tier: delta[tier] for tier in ('equal', 'char_bound', 'token_sort', 'partial')}
+        self.sources[name] = {
+            **fields,
+            'pairs': delta['match_pairs'],
+            'matrix_pairs': delta['match_matrix_pairs'],
+            'fuzz_calls': (4 * (cascade['token_sort'] + cascade['partial']) + delta['match_partial_calls']
+                           + delta['match_ratio_calls']),
+            'strict_first_hits': delta['match_strict_first'],
+            'strict_fallback_hits': delta['match_strict_fallback'],
+            'alias_hits': delta['match_alias_hits'],
+            'cascade': cascade,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'phases': self.phases, 'sources': self.sources, 'logos': self.logos}
+
+    def write(self, path: str) -> None:
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2)
+            logging.info(f"Berhasil menyimpan metrik run ke {path}")
+        except OSError as e:
+            logging.error(f"Gagal menyimpan metrik run: {str(e)}")
+
+METRICS = RunMetrics()
+
+
+# --- API PENGGABUNGAN JADWAL ---
+BASE_SOURCE = 'event.json'
+TRANSLATION_FILE = os.path.join('translate', 'en.json')
+
+# Sumber dalam urutan prioritas: (file, matcher, tambahkan item yang tidak cocok, prefix id yang selalu ditambahkan)
+MERGE_SOURCES = [
+    ('rere.json', 'rere_manual', True, None),
+    ('inplaynet.json', 'inplaynet', True, None),
+    ('sportsonline.json', 'sportsonline', False, None),
+    ('streamcenter.json', 'streamcenter', False, None),
+    ('soco.json', 'soco', False, None),
+    ('manual.json', 'rere_manual', True, 'tes'),
+]
+
+class MergeOptions(NamedTuple):
+    threshold: float = 0.8
+    batch: bool = False                          # Matriks kemiripan per sumber (butuh rapidfuzz dan numpy)
+    state_path: Optional[str] = None              # Mis. MERGE_STATE_FILE; None: tanpa mode inkremental
+    reuse_state: bool = True                      # False: cocokkan ulang semua, tetapi tetap simpan state
+    alias_path: Optional[str] = None              # Mis. ALIAS_FILE; None: tanpa alias tim persisten
+    workers: int = 1                              # > 1: skor fuzzy di ProcessPoolExecutor (lihat PARALLEL_MIN_PAIRS)
+    concurrent: bool = False                      # Skor semua sumber sekaligus terhadap snapshot event.json
+
+def load_translations(path: str = TRANSLATION_FILE) -> Dict[str, str]:
+    if not os.path.exists(path):
+        logging.warning(f"Translation file '{path}' not found")
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        trans_dict = json.load(f)
+    logging.info(f"Loaded translation dictionary with {len(trans_dict)} entries")
+    return trans_dict
 
+def load_sources(directory: str = '.') -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Membaca event.json dan semua file di MERGE_SOURCES. File yang tidak ada menjadi list kosong.
+    """
+    sources = {}
+    for source_file in [BASE_SOURCE] + [source[0] for source in MERGE_SOURCES]:
+        try:
+            with open(os.path.join(directory, source_file), 'r', encoding='utf-8') as f:
+                sources[source_file] = json.load(f)
+            logging.info(f"Loaded {len(sources[source_file])} entries from {source_file}")
+        except FileNotFoundError:
+            level = logging.ERROR if source_file in (BASE_SOURCE, 'manual.json') else logging.WARNING
+            logging.log(level, f"File '{source_file}' not found")
+            sources[source_file] = []
+    return sources
+
+# Function to score all sources concurrently against the event.json snapshot before the commit phase
+def precompute_sources(index: ScheduleIndex, translated: Dict[str, List[Dict[str, Any]]], hashes: Dict[str, str],
+                       prev_state: Dict[str, Any], config: Dict[str, Any],
+                       options: MergeOptions) -> Dict[str, Tuple[int, List[Tuple[float, int]]]]:
+    """
+    Mode konkuren: semua sumber dinilai sekaligus terhadap snapshot schedule
+    (event.json) di ProcessPoolExecutor. Fase commit di merge_schedule lalu
+    menerapkan hasilnya sesuai urutan prioritas MERGE_SOURCES; hanya entri yang
+    ditambahkan sumber/item sebelumnya pada run yang sama yang dinilai ulang
+    (find_match dengan `start`), sehingga hasilnya identik dengan mode serial.
+
+    Sumber yang isinya sama dengan merge state sebelumnya dilewati karena
+    kemungkinan besar hasil lamanya dipakai ulang.
+    """
+    prev_hashes = {stage.get('source'): stage.get('hash') for stage in prev_state.get('stages', [])} \
+        if prev_state.get('config') == config else {}
+    pending = []
+    for source_file, kind, _, force_add_prefix in MERGE_SOURCES:
+        if prev_hashes.get(source_file) == hashes[source_file]:
+            continue
+        to_match = [item for item in translated[source_file] if not is_forced_item(item, force_add_prefix)]
+        if to_match:
+            pending.append((source_file, kind, to_match))
+
+    snapshot_len = len(index.records)
+    if sum(len(to_match) for _, _, to_match in pending) * snapshot_len < PARALLEL_MIN_PAIRS:
+        return {}
+    workers = options.workers if options.workers > 1 else (os.cpu_count() or 1)
+    results = concurrent_best_candidates(index, [(kind, to_match) for _, kind, to_match in pending],
+                                         options.threshold, workers)
+    if results is None:
+        return {}
+    return {source_file: (snapshot_len, bests) for (source_file, _, _), bests in zip(pending, results)}
+
+def merge_schedule(sources: Dict[str, List[Dict[str, Any]]], translations: Dict[str, str],
+                   options: MergeOptions = MergeOptions()) -> List[Dict[str, Any]]:
+    """
+    Menggabungkan semua sumber ke event.json dan mengembalikan schedule baru,
+    termasuk match_date/match_time (10 menit sebelum kickoff).
 
-# --- LOGIKA BARU YANG DIMODIFIKASI: MEMBUAT DAN MENYIMPAN schedulegvt.json DENGAN LOGO ---
-logging.info("Memulai proses pembuatan schedulegvt.json dengan logo.")
+    Args:
+        sources: Item per nama file sumber (BASE_SOURCE dan file di MERGE_SOURCES); file yang tidak ada boleh dilewati
+        translations: Kamus terjemahan nama liga/tim (translate/en.json)
+        options: MergeOptions
 
-# 1. Panggil fungsi untuk mendapatkan mapping logo dari GitHub
-logo_map = get_github_logos()
+    Data milik pemanggil tidak diubah, sehingga fungsi ini aman dipanggil berulang kali dalam satu proses.
+    """
+    translator = Translator(translations)
+    # Tabel liga dibangun ulang per run agar tidak terus bertambah di proses yang berumur panjang
+    LEAGUES.clear()
+    with METRICS.phase('translate'):
+        # Entri schedule akan diubah (server, match_time); Match dibuat baru sehingga data pemanggil tidak ikut berubah
+        schedule = matches_from_dicts(translator.translate_items(sources.get(BASE_SOURCE, [])))
+    with METRICS.phase('index'):
+        alias_store = AliasStore.load(translations, options.alias_path) if options.alias_path else None
+        schedule_index = ScheduleIndex(schedule, aliases=alias_store)
+    logging.info(f"Initialized schedule with {len(schedule)} entries from {BASE_SOURCE}")
+
+    # Semua yang memengaruhi hasil pencocokan; workers/concurrent tidak ikut karena hasilnya identik dengan serial.
+    # event.json juga tidak ikut: field yang dibaca matcher sudah tercakup schedule_key tiap tahap,
+    # jadi perubahan yang hanya menyentuh server tidak memaksa merge penuh.
+    merge_config = {
+        'version': MERGE_STATE_VERSION,
+        'translations': data_hash(translations),
+        'threshold': options.threshold,
+        'batch': options.batch,
+        'aliases': alias_store.snapshot_hash() if alias_store else None,
+    }
+    with METRICS.phase('merge_state_load'):
+        prev_merge_state = load_merge_state(options.state_path) if options.state_path and options.reuse_state else {}
+    merge_state = {'config': merge_config, 'stages': []}
+
+    with METRICS.phase('translate'):
+        translated = {source_file: matches_from_dicts(translator.translate_items(sources.get(source_file, [])))
+                      for source_file, _, _, _ in MERGE_SOURCES}
+    logging.info(f"Terjemahan: {translator.hit_rates()}")
+    with METRICS.phase('hash'):
+        hashes = {source_file: data_hash(sources.get(source_file, [])) for source_file, _, _, _ in MERGE_SOURCES}
+    precomputed = {}
+    if options.concurrent:
+        before = METRICS.counters() if METRICS.enabled else None
+        with METRICS.phase('match:concurrent'):
+            precomputed = precompute_sources(schedule_index, translated, hashes, prev_merge_state,
+                                             merge_config, options)
+        METRICS.record_source('concurrent', before, items=sum(len(bests) for _, bests in precomputed.values()))
+
+    for source_file, kind, append_unmatched, force_add_prefix in MERGE_SOURCES:
+        data = translated[source_file]
+        stage = {'source': source_file, 'hash': hashes[source_file], 'schedule_key': schedule_index.fingerprint}
+        expected = sum(1 for item in data if not is_forced_item(item, force_add_prefix))
+        assignments = reusable_assignments(prev_merge_state, merge_config, stage, expected)
+        if assignments is not None:
+            logging.info(f"Memakai ulang {len(assignments)} hasil pencocokan untuk {source_file} (tidak berubah)")
+        before = METRICS.counters() if METRICS.enabled else None
+        with METRICS.phase(f'match:{source_file}'):
+            stage['assignments'] = merge_source(schedule_index, source_file, kind, data, append_unmatched,
+                                                threshold=options.threshold, batch=options.batch,
+                                                force_add_prefix=force_add_prefix, workers=options.workers,
+                                                assignments=assignments, precomputed=precomputed.get(source_file))
+        METRICS.record_source(source_file, before, kind=kind, items=len(data), reused=assignments is not None,
+                              matched=sum(1 for match_idx in stage['assignments'] if match_idx != -1))
+        merge_state['stages'].append(stage)
+
+    logging.info(f"Kaskade skor (pasangan per tahap): {dict(CASCADE_STATS)}")
+    with METRICS.phase('merge_state_save'):
+        if options.state_path:
+            save_merge_state(merge_state, options.state_path)
+        if alias_store is not None:
+            alias_store.save(options.alias_path)
+
+    # Adjust match_time to be 10 minutes earlier than kickoff_time
+    for item in schedule:
+        item['match_date'], item['match_time'] = subtract_ten_minutes(item['kickoff_date'], item['kickoff_time'])
+    return matches_to_dicts(schedule)
 
-# Lanjutkan hanya jika berhasil mendapatkan logo
-if logo_map:
-    schedule_with_logos = []
-    threshold = 85  # Skor minimum untuk fuzzy matching (dapat disesuaikan)
+def resolve_logos(schedule: List[Dict[str, Any]], logo_map: Dict[str, str],
+                  threshold: int = 85) -> Dict[int, Tuple[str, str]]:
+    """
+    Overlay logo: {indeks entri: (logo tim 1, logo tim 2)} untuk pertandingan
+    yang logo kedua timnya ditemukan (logo yang sudah ada di schedule
+    diprioritaskan), berurutan sesuai schedule. Schedule tidak diubah maupun disalin.
+    """
+    overlay: Dict[int, Tuple[str, str]] = {}
+    logo_resolver = LogoResolver(logo_map, threshold)
 
-    for item in schedule:
+    for idx, item in enumerate(schedule):
         # Variabel untuk menampung URL logo final
         logo1_url = None
         logo2_url = None
 
         # --- LOGIKA PENGECEKAN DENGAN FUZZY MATCHING ---
 
-        # 2. Prioritaskan logo yang sudah ada di schedule.json untuk Tim 1
+        # Prioritaskan logo yang sudah ada di schedule.json untuk Tim 1
         if 'logo' in item['team1'] and item['team1']['logo']:
             logo1_url = item['team1']['logo']
             logging.debug(f"Menggunakan logo yang sudah ada untuk tim 1: {item['team1']['name']}")
         else:
-            # Normalisasi nama tim
-            norm_team1 = normalize_name(item['team1']['name'])
-            best_score = 0
-            best_key = None
-
-            # Cari kecocokan terbaik di logo_map menggunakan fuzzy matching
-            for logo_key in logo_map:
-                score = fuzz.token_sort_ratio(norm_team1, logo_key)
-                if score > best_score and score >= threshold:
-                    best_score = score
-                    best_key = logo_key
+            # Cari kecocokan terbaik di logo_map (exact, index token/trigram, lalu fuzzy matching)
+            best_key, best_score = logo_resolver.resolve(item['team1']['name'])
 
             if best_key:
                 logo1_url = logo_map[best_key]
@@ -641,22 +1716,13 @@ if logo_map:
             else:
                 logging.debug(f"Tidak ditemukan logo untuk tim 1 '{item['team1']['name']}'")
 
-        # 3. Prioritaskan logo yang sudah ada di schedule.json untuk Tim 2
+        # Prioritaskan logo yang sudah ada di schedule.json untuk Tim 2
         if 'logo' in item['team2'] and item['team2']['logo']:
             logo2_url = item['team2']['logo']
             logging.debug(f"Menggunakan logo yang sudah ada untuk tim 2: {item['team2']['name']}")
         else:
-            # Normalisasi nama tim
-            norm_team2 = normalize_name(item['team2']['name'])
-            best_score = 0
-            best_key = None
-
-            # Cari kecocokan terbaik di logo_map menggunakan fuzzy matching
-            for logo_key in logo_map:
-                score = fuzz.token_sort_ratio(norm_team2, logo_key)
-                if score > best_score and score >= threshold:
-                    best_score = score
-                    best_key = logo_key
+            # Cari kecocokan terbaik di logo_map (exact, index token/trigram, lalu fuzzy matching)
+            best_key, best_score = logo_resolver.resolve(item['team2']['name'])
 
             if best_key:
                 logo2_url = logo_map[best_key]
@@ -664,13 +1730,9 @@ if logo_map:
             else:
                 logging.debug(f"Tidak ditemukan logo untuk tim 2 '{item['team2']['name']}'")
 
-        # 4. Jika KEDUA logo (baik yang sudah ada maupun yang baru ditemukan) valid, tambahkan ke daftar baru
+        # Jika KEDUA logo (baik yang sudah ada maupun yang baru ditemukan) valid, tambahkan ke daftar baru
         if logo1_url and logo2_url:
-            # Gunakan deepcopy untuk memastikan data asli tidak berubah
-            new_item = copy.deepcopy(item)
-            new_item['team1']['logo'] = logo1_url
-            new_item['team2']['logo'] = logo2_url
-            schedule_with_logos.append(new_item)
+            overlay[idx] = (logo1_url, logo2_url)
             logging.debug(f"Logo valid untuk '{item['id']}'. Menambahkan ke schedulegvt.json.")
         else:
             logging.debug(f"Melewatkan '{item['id']}' untuk schedulegvt.json (salah satu atau kedua logo tidak ditemukan).")
@@ -679,15 +1741,184 @@ if logo_map:
             if not logo2_url:
                 logging.debug(f"  - Logo tidak ditemukan untuk tim 2: {item['team2']['name']}")
 
-    # 5. Simpan daftar baru ke file schedulegvt.json
-    output_gvt_path = os.path.join(output_dir, 'schedulegvt.json')
+    logging.info(f"Logo di-resolve untuk {len(logo_resolver.memo)} nama tim unik")
+    if METRICS.enabled:
+        METRICS.logos.update(unique_names=len(logo_resolver.memo), fuzz_calls=logo_resolver.fuzz_calls,
+                             matches=len(overlay), logo_keys=len(logo_map))
+    return overlay
+
+def apply_logo_overlay(schedule: List[Dict[str, Any]],
+                       overlay: Dict[int, Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Menghasilkan pertandingan dari overlay satu per satu, dengan logo terpasang.
+    Hanya dict entri dan kedua tim yang disalin dangkal (servers dan field lain
+    dipakai bersama), dan salinannya bisa dibuang setelah ditulis. Urutan key
+    sama dengan deepcopy lalu set 'logo'.
+    """
+    for idx, (logo1_url, logo2_url) in overlay.items():
+        item = schedule[idx]
+        yield {**item, 'team1': {**item['team1'], 'logo': logo1_url}, 'team2': {**item['team2'], 'logo': logo2_url}}
+
+def enrich_with_logos(schedule: List[Dict[str, Any]], logo_map: Dict[str, str],
+                      threshold: int = 85) -> List[Dict[str, Any]]:
+    """
+    Mengembalikan pertandingan yang logo kedua timnya ditemukan (lihat
+    resolve_logos). Schedule asli tidak diubah; servers dipakai bersama dengan
+    schedule, jadi jangan ubah list tersebut di hasilnya.
+    """
+    return list(apply_logo_overlay(schedule, resolve_logos(schedule, logo_map, threshold)))
+
+
+# --- CHANGEFEED (sch/changes.json, dilayani serve.py di /changes) ---
+CHANGES_FILE_NAME = 'changes.json'       # Ditulis di samping sch/schedule.json
+CHANGES_KEEP = 500                       # Batch terakhir yang disimpan di file
+
+def load_json_list(path: str) -> Optional[List[Dict[str, Any]]]:
     try:
-        with open(output_gvt_path, 'w', encoding='utf-8') as f:
-            json.dump(schedule_with_logos, f, indent=2, ensure_ascii=False)
-        logging.info(f"Berhasil menyimpan {len(schedule_with_logos)} pertandingan dengan logo ke {output_gvt_path}")
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, list) else None
+
+# Function to compute per-match changes between two schedules
+def schedule_changes(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Perubahan per pertandingan (berdasarkan id) dari `old` ke `new`:
+    match_added (beserta entrinya), match_removed, dan servers_added /
+    servers_removed (server dibandingkan per URL). Urutan mengikuti `new`,
+    lalu pertandingan yang hilang sesuai urutan `old`.
+    """
+    old_by_id = {item.get('id'): item for item in old}
+    new_ids = set()
+    changes = []
+    for item in new:
+        match_id = item.get('id')
+        new_ids.add(match_id)
+        prev = old_by_id.get(match_id)
+        if prev is None:
+            changes.append({'type': 'match_added', 'id': match_id, 'match': item})
+            continue
+        old_servers = prev.get('servers') or []
+        new_servers = item.get('servers') or []
+        old_urls = {server.get('url') for server in old_servers}
+        new_urls = {server.get('url') for server in new_servers}
+        added = [server for server in new_servers if server.get('url') not in old_urls]
+        removed = [server for server in old_servers if server.get('url') not in new_urls]
+        if added:
+            changes.append({'type': 'servers_added', 'id': match_id, 'servers': added})
+        if removed:
+            changes.append({'type': 'servers_removed', 'id': match_id, 'servers': removed})
+    for item in old:
+        if item.get('id') not in new_ids:
+            changes.append({'type': 'match_removed', 'id': item.get('id')})
+    return changes
+
+def record_changes(changes: List[Dict[str, Any]], path: str, keep: int = CHANGES_KEEP) -> int:
+    """
+    Menambahkan satu batch {id, time, changes} ke file changefeed dan
+    mengembalikan id-nya. Id naik terus (dipakai sebagai id event SSE);
+    hanya `keep` batch terakhir yang disimpan.
+    """
+    batches = load_json_list(path) or []
+    batch_id = batches[-1]['id'] + 1 if batches else 1
+    batches.append({'id': batch_id, 'time': datetime.now().astimezone().isoformat(timespec='seconds'),
+                    'changes': changes})
+    write_json_list(path, batches[-keep:], variants=False)
+    return batch_id
+
+
+# --- BAGIAN UTAMA SCRIPT ---
+def main(argv: Optional[List[str]] = None) -> None:
+    # Set up logging to console and file
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('merge.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+    parser = argparse.ArgumentParser(description="Gabungkan semua sumber jadwal ke sch/schedule.json")
+    parser.add_argument('--batch', action='store_true',
+                        help="Nilai setiap sumber sekaligus dengan matriks kemiripan (butuh rapidfuzz dan numpy)")
+    parser.add_argument('--full', action='store_true',
+                        help="Abaikan merge state dan cocokkan ulang semua sumber")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Jumlah proses untuk fuzzy matching paralel (0 = jumlah CPU, 1 = serial)")
+    parser.add_argument('--concurrent', action='store_true',
+                        help="Nilai semua sumber sekaligus terhadap snapshot event.json, lalu terapkan berurutan")
+    parser.add_argument('--metrics', action='store_true',
+                        help=f"Catat waktu per fase dan penghitung pencocokan ke sch/{METRICS_FILE_NAME} "
+                             f"(atau set {METRICS_ENV}=1)")
+    args = parser.parse_args(argv)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    METRICS.reset(args.metrics or os.environ.get(METRICS_ENV, '') not in ('', '0'))
+    run_start = time.perf_counter()
+
+    with METRICS.phase('load'):
+        trans_dict = load_translations()
+        sources = load_sources()
+    schedule = merge_schedule(sources, trans_dict, MergeOptions(batch=args.batch, state_path=MERGE_STATE_FILE,
+                                                                 reuse_state=not args.full, alias_path=ALIAS_FILE,
+                                                                 workers=workers, concurrent=args.concurrent))
+
+    # Ensure output directory exists
+    output_dir = 'sch'
+    os.makedirs(output_dir, exist_ok=True)
+
+    # --- MENYIMPAN FILE schedule.json (OUTPUT ASLI) ---
+    output_path = os.path.join(output_dir, 'schedule.json')
+    previous = load_json_list(output_path)
+    try:
+        with METRICS.phase('write_schedule'):
+            write_json_list(output_path, schedule, patch=True)
+        logging.info(f"Berhasil menyimpan output asli ke {output_path}")
     except Exception as e:
-        logging.error(f"Gagal menyimpan schedulegvt.json: {str(e)}")
-else:
-    logging.warning("Tidak dapat mengambil peta logo dari GitHub. Melewatkan pembuatan schedulegvt.json.")
+        logging.error(f"Gagal menyimpan schedule.json: {str(e)}")
+    else:
+        # Ditulis setelah schedule.json, jadi pelanggan /changes selalu bisa mengambil jadwal yang sudah berubah
+        if previous is not None:
+            with METRICS.phase('changes'):
+                changes = schedule_changes(previous, schedule)
+                if changes:
+                    changes_path = os.path.join(output_dir, CHANGES_FILE_NAME)
+                    try:
+                        batch_id = record_changes(changes, changes_path)
+                        logging.info(f"{len(changes)} perubahan dicatat sebagai batch {batch_id} di {changes_path}")
+                    except Exception as e:
+                        logging.error(f"Gagal menyimpan {CHANGES_FILE_NAME}: {str(e)}")
+
+    # --- MEMBUAT DAN MENYIMPAN schedulegvt.json DENGAN LOGO ---
+    logging.info("Memulai proses pembuatan schedulegvt.json dengan logo.")
+
+    # Panggil fungsi untuk mendapatkan mapping logo dari GitHub
+    with METRICS.phase('logo_fetch'):
+        logo_map = get_github_logos()
+
+    # Lanjutkan hanya jika berhasil mendapatkan logo
+    if logo_map:
+        with METRICS.phase('logo_resolve'):
+            logo_overlay = resolve_logos(schedule, logo_map, threshold=85)
+
+        # Simpan daftar baru ke file schedulegvt.json; logo dipasang per item saat ditulis
+        output_gvt_path = os.path.join(output_dir, 'schedulegvt.json')
+        try:
+            with METRICS.phase('write_schedulegvt'):
+                count = write_json_list(output_gvt_path, apply_logo_overlay(schedule, logo_overlay), patch=True)
+            logging.info(f"Berhasil menyimpan {count} pertandingan dengan logo ke {output_gvt_path}")
+        except Exception as e:
+            logging.error(f"Gagal menyimpan schedulegvt.json: {str(e)}")
+    else:
+        logging.warning("Tidak dapat mengambil peta logo dari GitHub. Melewatkan pembuatan schedulegvt.json.")
+
+    if METRICS.enabled:
+        METRICS.phases['total'] = round(time.perf_counter() - run_start, 6)
+        METRICS.write(os.path.join(output_dir, METRICS_FILE_NAME))
+
+    print("\nProses selesai.")
+
 
-print("\nProses selesai.")
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,11 @@
 import requests
 from bs4 import BeautifulSoup
-import json
 import re
 from datetime import datetime
 import base64
 from urllib.parse import urljoin, urlparse, parse_qs
+from canon import clean_name
+from output import write_json_list
 
 def encode_url_to_base64(url):
     """Encode URL to base64"""
@@ -147,12 +148,12 @@ def scrape_indonesia_league_matches():
             # Create match object
             match_data = {
                 "id": match_id,
-                "league": league_name,
+                "league": clean_name(league_name),
                 "team1": {
-                    "name": home_team
+                    "name": clean_name(home_team)
                 },
                 "team2": {
-                    "name": away_team
+                    "name": clean_name(away_team)
                 },
                 "kickoff_date": match_date,
                 "kickoff_time": match_time,
@@ -179,8 +180,7 @@ def scrape_indonesia_league_matches():
 def save_to_json(matches, filename="soco.json"):
     """Save matches to JSON file"""
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(matches, f, ensure_ascii=False, indent=2)
+        write_json_list(filename, matches, variants=False, patch=True)
         print(f"\n✅ Successfully saved {len(matches)} matches to {filename}")
         return True
     except Exception as e:
@@ -0,0 +1,561 @@
+"""
+Layanan HTTP lokal untuk jadwal gabungan (sch/schedule.json).
+
+Jadwal dimuat ke memori sebagai snapshot dengan index per tanggal, liga, tim
+dan id, lalu dilayani lewat asyncio (hanya pustaka standar):
+
+  GET /matches                   seluruh jadwal
+  GET /matches?date=2025-12-06&league=Serie A&team=Arsenal
+                                 filter digabung dengan AND, nilai berulang
+                                 untuk parameter yang sama digabung dengan OR
+  GET /matches/<id>              satu entri
+  GET /changes                   Server-Sent Events: batch perubahan dari
+                                 sch/changes.json (ditulis sch.py setiap merge)
+  GET /status                    info snapshot yang sedang dilayani
+
+`date` dicocokkan dengan match_date maupun kickoff_date; `league` dengan nama
+liga lengkap ("England - Premier League") atau bagian setelah " - " terakhir
+("Premier League"); `league` dan `team` dinormalisasi seperti di sch.py.
+
+Setiap respons membawa ETag (If-None-Match -> 304) dan body gzip/br yang sudah
+dikompresi sebelumnya. File dipantau dengan os.stat; karena output.py menulis
+lewat os.replace, snapshot baru dibangun di thread terpisah lalu ditukar dalam
+satu assignment, sehingga setiap request melihat satu snapshot yang utuh.
+
+/changes mengirim satu event per batch dengan `id` = id batch. Klien yang
+tersambung ulang (header Last-Event-ID atau ?last_event_id=) mendapat batch
+yang terlewat dari ring buffer di memori; jika id-nya sudah keluar dari buffer,
+klien mendapat event `reset` dan sebaiknya mengambil ulang /matches. Jika
+changes.json dibuat ulang (id mulai lagi dari 1), semua klien yang sedang
+tersambung juga mendapat `reset` dengan id 0, lalu batch baru mulai dari id 1.
+
+Contoh:
+    python serve.py --port 8080
+    curl -H 'Accept-Encoding: gzip' 'http://127.0.0.1:8080/matches?date=2025-12-06'
+    curl -N -H 'Last-Event-ID: 41' http://127.0.0.1:8080/changes
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict, defaultdict, deque
+from email.utils import formatdate
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from canon import normalize_name
+from output import BROTLI_QUALITY, GZIP_LEVEL, brotli
+
+DEFAULT_FILE = os.path.join('sch', 'schedule.json')
+CHANGES_FILE_NAME = 'changes.json'   # Changefeed dari sch.py, di direktori yang sama dengan jadwal
+POLL_INTERVAL = 2.0          # Detik antar pengecekan perubahan file
+KEEPALIVE_TIMEOUT = 15.0     # Detik menunggu request berikutnya di koneksi keep-alive
+RESPONSE_CACHE_SIZE = 512    # Respons hasil filter yang disimpan per snapshot
+COMPRESS_MIN_BYTES = 256     # Body lebih kecil dari ini tidak dikompresi
+# Respons hasil filter dikompresi di event loop saat pertama diminta, jadi levelnya lebih ringan
+DYNAMIC_GZIP_LEVEL = 6
+DYNAMIC_BROTLI_QUALITY = 5
+FEED_BUFFER_SIZE = 256       # Batch perubahan yang bisa diputar ulang untuk klien yang tersambung ulang
+FEED_QUEUE_SIZE = 64         # Batch tertunda per subscriber sebelum subscriber diputus
+FEED_HEARTBEAT = 15.0        # Detik antar komentar keep-alive di stream /changes
+FEED_RETRY_MS = 3000         # Jeda reconnect yang disarankan ke EventSource
+FEED_RESET_ID = 0            # Id event `reset` saat id changefeed mulai ulang (id batch mulai dari 1)
+
+FILTERS = ('date', 'league', 'team', 'id')
+
+
+# Function to normalize a filter value the same way it was indexed
+def filter_key(field: str, value: str) -> str:
+    value = value.strip()
+    return normalize_name(value) if field in ('league', 'team') else value
+
+
+class Response:
+    """
+    Body JSON (minified) beserta ETag dan varian terkompresinya.
+    """
+
+    def __init__(self, data: Any, gzip_level: int = DYNAMIC_GZIP_LEVEL,
+                 brotli_quality: int = DYNAMIC_BROTLI_QUALITY):
+        self.body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        # Weak ETag: satu nilai untuk semua Content-Encoding dari isi yang sama
+        self.etag = f'W/"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self.encoded: Dict[str, bytes] = {}
+        if len(self.body) >= COMPRESS_MIN_BYTES:
+            self.encoded['gzip'] = gzip.compress(self.body, compresslevel=gzip_level, mtime=0)
+            if brotli is not None:
+                self.encoded['br'] = brotli.compress(self.body, quality=brotli_quality)
+
+    def negotiate(self, accept_encoding: str) -> Tuple[Optional[str], bytes]:
+        """
+        (Content-Encoding, body) terbaik untuk header Accept-Encoding klien.
+        """
+        accepted = set()
+        for part in accept_encoding.split(','):
+            coding, _, params = part.strip().partition(';')
+            if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                accepted.add(coding.strip().lower())
+        for coding in ('br', 'gzip'):
+            if coding in self.encoded and (coding in accepted or '*' in accepted):
+                return coding, self.encoded[coding]
+        return None, self.body
+
+
+class Snapshot:
+    """
+    Satu versi jadwal yang tidak pernah diubah setelah dibangun; index berisi
+    posisi entri sehingga hasil filter tetap mengikuti urutan schedule.json.
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], source: str = ''):
+        self.items = items
+        self.source = source
+        self.loaded_at = time.time()
+        self.by_id: Dict[str, int] = {}
+        self.indexes: Dict[str, Dict[str, List[int]]] = {field: defaultdict(list) for field in FILTERS}
+        for pos, item in enumerate(items):
+            self._index(pos, item)
+        self.indexes = {field: dict(index) for field, index in self.indexes.items()}
+        self.responses: 'OrderedDict[tuple, Response]' = OrderedDict()
+        # Seluruh jadwal paling sering diminta: dikompresi penuh saat dimuat (di luar event loop)
+        self.full = Response(items, GZIP_LEVEL, BROTLI_QUALITY)
+        self.responses[()] = self.full
+
+    def _index(self, pos: int, item: Dict[str, Any]) -> None:
+        keys = {
+            'id': {item.get('id')},
+            'date': {item.get('match_date'), item.get('kickoff_date')},
+            'league': set(),
+            'team': set(),
+        }
+        league = item.get('league')
+        if isinstance(league, str) and league:
+            keys['league'] = {filter_key('league', league), filter_key('league', league.rsplit(' - ', 1)[-1])}
+        for side in ('team1', 'team2'):
+            team = item.get(side)
+            if isinstance(team, dict) and isinstance(team.get('name'), str):
+                keys['team'].add(filter_key('team', team['name']))
+        for field, values in keys.items():
+            for value in values:
+                if isinstance(value, str) and value:
+                    self.indexes[field][value].append(pos)
+        if isinstance(item.get('id'), str):
+            self.by_id.setdefault(item['id'], pos)
+
+    @classmethod
+    def load(cls, path: str) -> 'Snapshot':
+        with open(path, 'r', encoding='utf-8') as f:
+            items = json.load(f)
+        if not isinstance(items, list):
+            raise ValueError(f"{path} bukan list JSON")
+        return cls(items, path)
+
+    def select(self, filters: tuple) -> List[int]:
+        positions = None
+        for field, values in filters:
+            index = self.indexes[field]
+            found = set()
+            for value in values:
+                found.update(index.get(value, ()))
+            positions = found if positions is None else positions & found
+        return sorted(positions) if positions is not None else list(range(len(self.items)))
+
+    def matches(self, filters: tuple) -> Response:
+        response = self.responses.get(filters)
+        if response is not None:
+            self.responses.move_to_end(filters)
+            return response
+        return self._remember(filters, Response([self.items[pos] for pos in self.select(filters)]))
+
+    def match(self, match_id: str) -> Optional[Response]:
+        key = ('id', match_id)
+        response = self.responses.get(key)
+        if response is None and match_id in self.by_id:
+            response = self._remember(key, Response(self.items[self.by_id[match_id]]))
+        return response
+
+    def _remember(self, key: tuple, response: Response) -> Response:
+        self.responses[key] = response
+        if len(self.responses) > RESPONSE_CACHE_SIZE:
+            # Respons seluruh jadwal (key ()) selalu dipertahankan
+            self.responses.popitem(last=False)
+            self.responses[()] = self.full
+        return response
+
+    def status(self) -> Dict[str, Any]:
+        return {'source': self.source, 'count': len(self.items), 'etag': self.full.etag,
+                'loaded_at': formatdate(self.loaded_at, usegmt=True),
+                'dates': sorted(self.indexes['date'])}
+
+
+def sse_frame(event_id: int, event: str, data: Any) -> bytes:
+    # JSON minified tidak pernah berisi baris baru, jadi cukup satu baris data:
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode('utf-8')
+
+
+class Subscriber:
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue(FEED_QUEUE_SIZE)
+        self.dropped = False
+
+
+class ChangeFeed:
+    """
+    Ring buffer batch perubahan (id naik terus) beserta subscriber /changes
+    yang sedang tersambung.
+    """
+
+    def __init__(self, size: int = FEED_BUFFER_SIZE):
+        self.events: deque = deque(maxlen=size)  # (id, frame SSE)
+        self.last_id = 0
+        self.subscribers: Set[Subscriber] = set()
+
+    def load(self, batches: List[Dict[str, Any]]) -> int:
+        """
+        Menerbitkan batch yang id-nya lebih baru dari last_id; mengembalikan jumlahnya.
+        """
+        if batches and batches[-1]['id'] < self.last_id:
+            # File changefeed dibuat ulang (id mulai dari awal lagi)
+            logging.warning(f"Id changefeed mundur dari {self.last_id} ke {batches[-1]['id']}; buffer dikosongkan")
+            self.reset()
+        fresh = [batch for batch in batches if batch['id'] > self.last_id]
+        for batch in fresh:
+            self.publish(batch)
+        return len(fresh)
+
+    def reset(self) -> None:
+        """
+        Mengosongkan buffer dan mengirim event `reset` ke semua subscriber, sehingga
+        stream mereka menerima lagi batch mulai dari id 1.
+        """
+        self.events.clear()
+        self.last_id = 0
+        self._broadcast(FEED_RESET_ID, sse_frame(FEED_RESET_ID, 'reset', {'last_id': self.last_id}))
+
+    def publish(self, batch: Dict[str, Any]) -> None:
+        frame = sse_frame(batch['id'], 'changes', batch)
+        self.events.append((batch['id'], frame))
+        self.last_id = batch['id']
+        self._broadcast(batch['id'], frame)
+
+    def _broadcast(self, event_id: int, frame: bytes) -> None:
+        for subscriber in list(self.subscribers):
+            try:
+                subscriber.queue.put_nowait((event_id, frame))
+            except asyncio.QueueFull:
+                # Klien terlalu lambat: diputus setelah antreannya habis, lalu memutar ulang dari buffer
+                subscriber.dropped = True
+                self.subscribers.discard(subscriber)
+
+    def replay(self, last_id: int) -> Optional[List[bytes]]:
+        """
+        Frame setelah `last_id`, atau None jika ada batch yang sudah tidak ada
+        di buffer (atau id tidak dikenal).
+        """
+        if last_id == self.last_id:
+            return []
+        if last_id > self.last_id or not self.events or last_id < self.events[0][0] - 1:
+            return None
+        return [frame for event_id, frame in self.events if event_id > last_id]
+
+    def status(self) -> Dict[str, Any]:
+        return {'last_id': self.last_id, 'buffered': len(self.events), 'subscribers': len(self.subscribers)}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 503: 'Service Unavailable'}
+
+
+# Function to turn a query string into a hashable, normalized filter key
+def parse_filters(query: str) -> tuple:
+    params = parse_qs(query)
+    unknown = set(params) - set(FILTERS)
+    if unknown:
+        raise HttpError(400, f"Filter tidak dikenal: {', '.join(sorted(unknown))}")
+    return tuple((field, tuple(sorted({filter_key(field, value) for value in params[field]})))
+                 for field in FILTERS if field in params)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Perbandingan weak sesuai RFC 9110: W/ diabaikan, '*' cocok dengan apa pun.
+    """
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    bare = etag[2:] if etag.startswith('W/') else etag
+    return any(tag == '*' or (tag[2:] if tag.startswith('W/') else tag) == bare for tag in tags)
+
+
+def file_signature(path: str) -> Optional[tuple]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def load_batches(path: str) -> List[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        batches = json.load(f)
+    if not isinstance(batches, list) or not all(isinstance(batch, dict) and isinstance(batch.get('id'), int)
+                                                 for batch in batches):
+        raise ValueError(f"{path} bukan list batch perubahan")
+    return batches
+
+
+async def wait_closed(reader: asyncio.StreamReader) -> None:
+    try:
+        while await reader.read(4096):
+            pass
+    except ConnectionError:
+        pass
+
+
+class ScheduleServer:
+    """
+    Server HTTP/1.1 minimal (GET/HEAD, keep-alive) di atas asyncio.start_server.
+    """
+
+    def __init__(self, path: str = DEFAULT_FILE, poll_interval: float = POLL_INTERVAL,
+                 changes_path: Optional[str] = None):
+        self.path = path
+        self.changes_path = changes_path or os.path.join(os.path.dirname(path), CHANGES_FILE_NAME)
+        self.poll_interval = poll_interval
+        self.snapshot: Optional[Snapshot] = None
+        self.signature: Optional[tuple] = None
+        self.changes_signature: Optional[tuple] = None
+        self.feed = ChangeFeed()
+        self.requests = 0
+
+    async def reload(self) -> bool:
+        """
+        Membangun snapshot baru jika file berubah; snapshot lama tetap dilayani
+        jika file hilang atau tidak valid.
+        """
+        signature = file_signature(self.path)
+        if signature is None or signature == self.signature:
+            return False
+        loop = asyncio.get_running_loop()
+        try:
+            snapshot = await loop.run_in_executor(None, Snapshot.load, self.path)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Gagal memuat {self.path}, snapshot lama tetap dipakai: {str(e)}")
+            self.signature = signature
+            return False
+        # Signature diambil sebelum file dibaca: jika file diganti lagi di tengah jalan, poll berikutnya memuat ulang
+        self.signature = signature
+        self.snapshot = snapshot
+        logging.info(f"Snapshot dimuat dari {self.path}: {len(snapshot.items)} pertandingan, ETag {snapshot.full.etag}")
+        return True
+
+    async def reload_changes(self) -> int:
+        """
+        Menerbitkan batch baru dari file changefeed ke subscriber /changes.
+        """
+        signature = file_signature(self.changes_path)
+        if signature is None or signature == self.changes_signature:
+            return 0
+        self.changes_signature = signature
+        loop = asyncio.get_running_loop()
+        try:
+            batches = await loop.run_in_executor(None, load_batches, self.changes_path)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Gagal memuat {self.changes_path}: {str(e)}")
+            return 0
+        published = self.feed.load(batches)
+        if published:
+            logging.info(f"{published} batch perubahan diterbitkan (id terakhir {self.feed.last_id}) "
+                         f"ke {len(self.feed.subscribers)} subscriber")
+        return published
+
+    async def watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            # sch.py menulis schedule.json sebelum changes.json: snapshot ditukar dulu agar klien yang
+            # menerima perubahan langsung mendapat jadwal barunya
+            await self.reload()
+            await self.reload_changes()
+
+    def route(self, method: str, target: str) -> Response:
+        if method not in ('GET', 'HEAD'):
+            raise HttpError(405, f"Metode {method} tidak didukung")
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        if path == '/status':
+            if self.snapshot is None:
+                raise HttpError(503, "Jadwal belum dimuat")
+            return Response({**self.snapshot.status(), 'changes': self.feed.status(), 'requests': self.requests})
+        # Satu referensi snapshot per request, jadi hot-swap tidak pernah terlihat setengah jalan
+        snapshot = self.snapshot
+        if snapshot is None:
+            raise HttpError(503, "Jadwal belum dimuat")
+        if path == '/matches':
+            return snapshot.matches(parse_filters(url.query))
+        if path.startswith('/matches/'):
+            match_id = unquote(path[len('/matches/'):])
+            response = snapshot.match(match_id)
+            if response is None:
+                raise HttpError(404, f"Pertandingan {match_id} tidak ditemukan")
+            return response
+        raise HttpError(404, f"Path {path} tidak ditemukan")
+
+    def respond(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        self.requests += 1
+        try:
+            response = self.route(method, target)
+        except HttpError as e:
+            body = json.dumps({'error': str(e)}, ensure_ascii=False).encode('utf-8')
+            extra = [('Allow', 'GET, HEAD')] if e.status == 405 else []
+            return e.status, [('Content-Type', 'application/json; charset=utf-8'), *extra], body
+        common = [('ETag', response.etag), ('Vary', 'Accept-Encoding'), ('Cache-Control', 'no-cache')]
+        if_none_match = headers.get('if-none-match')
+        if if_none_match is not None and etag_matches(if_none_match, response.etag):
+            return 304, common, b''
+        coding, body = response.negotiate(headers.get('accept-encoding', ''))
+        fields = [('Content-Type', 'application/json; charset=utf-8'), *common]
+        if coding:
+            fields.append(('Content-Encoding', coding))
+        return 200, fields, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                parts = lines[0].split(' ')
+                if len(parts) != 3 or not parts[2].startswith('HTTP/1.'):
+                    writer.write(self.encode(400, [], b'', 'HTTP/1.1', False))
+                    break
+                method, target, version = parts
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                length = headers.get('content-length', '0')
+                if length.isdigit() and int(length):
+                    await reader.readexactly(int(length))
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                if method == 'GET' and urlsplit(target).path.rstrip('/') == '/changes':
+                    await self.stream_changes(reader, writer, urlsplit(target).query, headers, version)
+                    break
+                status, fields, body = self.respond(method, target, headers)
+                writer.write(self.encode(status, fields, body if method != 'HEAD' else None, version, keep_alive,
+                                         len(body)))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def stream_changes(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, query: str,
+                             headers: Dict[str, str], version: str) -> None:
+        """
+        Stream SSE sampai klien memutus: replay dari Last-Event-ID, lalu batch
+        baru saat diterbitkan. Subscriber didaftarkan sebelum replay dihitung
+        (tanpa await di antaranya), jadi tidak ada batch yang terlewat.
+        """
+        last_event_id = headers.get('last-event-id') or (parse_qs(query).get('last_event_id') or [''])[-1]
+        self.requests += 1
+        subscriber = Subscriber()
+        self.feed.subscribers.add(subscriber)
+        # Klien tidak mengirim apa pun lagi; EOF berarti koneksi sudah ditutup
+        closed = asyncio.ensure_future(wait_closed(reader))
+        try:
+            # Tanpa Content-Length: body berakhir saat koneksi ditutup
+            head = [f"{version} 200 OK", f"Date: {formatdate(usegmt=True)}", 'Connection: close',
+                    'Access-Control-Allow-Origin: *', 'Content-Type: text/event-stream; charset=utf-8',
+                    'Cache-Control: no-cache', 'X-Accel-Buffering: no']
+            frames = [('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'), f"retry: {FEED_RETRY_MS}\n\n".encode()]
+            sent_id = self.feed.last_id
+            if last_event_id.strip().isdigit():
+                replay = self.feed.replay(int(last_event_id))
+                if replay is None:
+                    frames.append(sse_frame(sent_id, 'reset', {'last_id': sent_id}))
+                else:
+                    frames.extend(replay)
+            writer.write(b''.join(frames))
+            await writer.drain()
+            while not (subscriber.dropped and subscriber.queue.empty()):
+                get = asyncio.ensure_future(subscriber.queue.get())
+                await asyncio.wait((get, closed), timeout=FEED_HEARTBEAT, return_when=asyncio.FIRST_COMPLETED)
+                if not get.done():
+                    get.cancel()
+                    if closed.done():
+                        break
+                    # Komentar SSE: menjaga koneksi tetap hidup melewati proxy
+                    writer.write(b': ping\n\n')
+                    await writer.drain()
+                    continue
+                event_id, frame = get.result()
+                if event_id == FEED_RESET_ID or event_id > sent_id:
+                    writer.write(frame)
+                    await writer.drain()
+                    sent_id = event_id
+        finally:
+            closed.cancel()
+            self.feed.subscribers.discard(subscriber)
+
+    @staticmethod
+    def encode(status: int, fields: List[Tuple[str, str]], body: Optional[bytes], version: str,
+               keep_alive: bool, length: Optional[int] = None) -> bytes:
+        lines = [f"{version} {status} {REASONS.get(status, '')}", f"Date: {formatdate(usegmt=True)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}",
+                 'Access-Control-Allow-Origin: *']
+        if status != 304:
+            lines.append(f"Content-Length: {length if length is not None else len(body or b'')}")
+        lines.extend(f"{name}: {value}" for name, value in fields)
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b'')
+
+    async def serve(self, host: str, port: int) -> None:
+        await self.reload()
+        await self.reload_changes()
+        if self.snapshot is None:
+            logging.warning(f"{self.path} belum ada atau tidak valid; menunggu file ditulis")
+        server = await asyncio.start_server(self.handle, host, port)
+        watcher = asyncio.create_task(self.watch())
+        logging.info(f"Melayani {self.path} di http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Layani sch/schedule.json lewat HTTP dengan index, ETag dan changefeed SSE")
+    parser.add_argument('--file', default=DEFAULT_FILE, help="File jadwal yang dilayani")
+    parser.add_argument('--changes', help=f"File changefeed untuk /changes (default: {CHANGES_FILE_NAME} "
+                                          f"di direktori --file)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL,
+                        help="Detik antar pengecekan perubahan file untuk hot-swap snapshot")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    try:
+        asyncio.run(ScheduleServer(args.file, args.poll_interval, args.changes).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,11 @@
 import requests
 from bs4 import BeautifulSoup
 import re
-import json
 from datetime import datetime, timedelta
 from pytz import timezone
 import logging
+from canon import clean_name, entry_id
+from output import write_json_list
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -126,9 +127,9 @@ def scrape_sportsonline():
             logging.debug(f"Line skipped, no match: {line}")
             continue
         
-        time_str, team_or1, team2_opt, url = match_pattern.groups()
-        team_or1 = team_or1.strip()
-        team2 = team2_opt.strip() if team2_opt else ""
+        time_str, team1_raw, team2_opt, url = match_pattern.groups()
+        team_or1 = clean_name(team1_raw)
+        team2 = clean_name(team2_opt) if team2_opt else ""
         
         # Extract channel from URL
         channel = extract_channel_from_url(url)
@@ -142,10 +143,9 @@ def scrape_sportsonline():
         kickoff_time_jakarta = convert_london_to_jakarta(time_str, event_date)
         match_time_jakarta = convert_london_to_jakarta(time_str, event_date)  # Use the same function as kickoff_time
         
-        # Create ID
-        id_str = team_or1.replace(" ", "").replace(":", "-")
-        if team2:
-            id_str += "-" + team2.replace(" ", "").replace(":", "-")
+        # Create ID (from the raw names, so published IDs stay the same)
+        id_parts = [team1_raw.strip()] + ([team2_opt.strip()] if team2 else [])
+        id_str = entry_id(*id_parts, colons_to_dash=True)
         
         # Check if this is a new event or a new server for the same event
         if current_time == time_str and current_event == (team_or1, team2):
@@ -178,8 +178,7 @@ def scrape_sportsonline():
     
     # Save to sportsonline.json
     try:
-        with open("sportsonline.json", "w", encoding="utf-8") as f:
-            json.dump(matches, f, indent=2, ensure_ascii=False)
+        write_json_list("sportsonline.json", matches, variants=False, patch=True)
         logging.info("Data saved to sportsonline.json")
     except IOError as e:
         logging.error(f"Failed to save to sportsonline.json: {e}")
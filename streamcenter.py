@@ -4,6 +4,8 @@ from datetime import datetime
 import pytz
 import base64
 import os
+from canon import clean_name
+from output import write_json_list
 
 def scrape_and_convert_data():
     # URL API
@@ -134,10 +136,10 @@ def scrape_and_convert_data():
                     "id": "",  # Dikosongkan
                     "league": "",  # Dikosongkan
                     "team1": {
-                        "name": team1_name
+                        "name": clean_name(team1_name)
                     },
                     "team2": {
-                        "name": team2_name
+                        "name": clean_name(team2_name)
                     },
                     "kickoff_date": kickoff_date,
                     "kickoff_time": kickoff_time,
@@ -170,8 +172,7 @@ if __name__ == "__main__":
     print(f"Berhasil mengkonversi {len(result)} pertandingan")
     
     # Simpan ke file streamcenter.json
-    with open('streamcenter.json', 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    write_json_list('streamcenter.json', result, variants=False, patch=True)
     
     print("Data disimpan ke streamcenter.json")
     